@@ -41,6 +41,14 @@ from Modules.FileOperations import FileOperations
 from Modules.SignalOperations import SignalOperations
 from Modules.CodeGeneration import CodeGeneration
 from Modules.UIHelpers import UIHelpers
+from Modules.ProjectWriter import ChangeTracker
+from Modules.RoutingMatrix import RoutingMatrix
+from Modules.UndoHistory import UndoHistory
+from Modules.GenerationLogDock import GenerationLogDock
+from Modules.FootprintEstimator import FootprintEstimator
+from Modules.FootprintDock import FootprintDock
+from Modules.RefreshScheduler import RefreshScheduler
+from Modules.SignalSearchIndex import SignalSearchIndex
 
 class SignalMgrApp(QtWidgets.QMainWindow):
     def __init__(self):
@@ -76,8 +84,18 @@ class SignalMgrApp(QtWidgets.QMainWindow):
         }
         self.copied_signal = None
         self.modified = False  # Explicitly set to False on initialization
-        self.undo_stack = []
-        self.redo_stack = []
+        # Bounded undo/redo history of signal diffs and shared snapshots
+        self.history = UndoHistory()
+        # Signals, SoCs and metadata keys changed since the last save
+        self.change_tracker = ChangeTracker()
+        # Signals x destination cores bitset matrix
+        self.routing = RoutingMatrix()
+        # Per-signal, per-core and per-region memory footprint estimate
+        self.footprint = FootprintEstimator()
+        # Field texts of the signals for the search bar above the signal table
+        self.search_index = SignalSearchIndex()
+        # Coalesced refreshes of the signal table, core tree, count and title
+        self.refresh = RefreshScheduler(self)
 
         # Map old UI element names to new ones
         # We'll check if the new UI elements exist and use them, otherwise fall back to old ones
@@ -92,6 +110,16 @@ class SignalMgrApp(QtWidgets.QMainWindow):
         self.code_gen = CodeGeneration(self)
         self.ui_helpers = UIHelpers(self)
 
+        # Live output of the code generators, shown when a generation starts
+        self.generation_log = GenerationLogDock(self)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.generation_log)
+        self.generation_log.hide()
+
+        # Estimated memory footprint, updated as signals are edited
+        self.footprint_dock = FootprintDock(self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.footprint_dock)
+        self.footprint_dock.hide()
+
         # Clear default "Enter Your Name" text before setting up connections
         if hasattr(self.ui, "EditorName"):
             self.ui.EditorName.setPlaceholderText("Enter your name")
@@ -522,9 +550,6 @@ class SignalMgrApp(QtWidgets.QMainWindow):
             redo_func = self.ui_helpers.redo_action
 
             # Code Generation menu functions
-            gen_signal_mgr_func = self.code_gen.generate_signal_mgr
-            gen_ipc_mgr_func = self.code_gen.generate_ipc_manager
-            gen_ipc_eth_func = self.code_gen.generate_ipc_eth_mgr
             gen_header_func = self.code_gen.generate_header_file
 
             # Help menu functions
@@ -555,13 +580,6 @@ class SignalMgrApp(QtWidgets.QMainWindow):
                 ("actionRedo", redo_func)
             ]
 
-            # Connect code generator menu actions
-            code_gen_connections = [
-                ("actionSignalMgr", gen_signal_mgr_func),
-                ("actionIpcManager", gen_ipc_mgr_func),
-                ("actionIpcOvEthMgr", gen_ipc_eth_func)
-            ]
-
             # Connect help menu actions
             help_menu_connections = [
                 ("actionAbout_Tool", about_func),
@@ -569,7 +587,7 @@ class SignalMgrApp(QtWidgets.QMainWindow):
             ]
 
             # Connect all actions in a batch
-            all_connections = file_menu_connections + edit_menu_connections + code_gen_connections + help_menu_connections
+            all_connections = file_menu_connections + edit_menu_connections + help_menu_connections
 
             for action_name, func in all_connections:
                 if self._connect_action(action_name, func):
@@ -577,6 +595,25 @@ class SignalMgrApp(QtWidgets.QMainWindow):
                 else:
                     print(f"Failed to connect {action_name}")
 
+            # Add Generate All action to the Code Generator menu
+            try:
+                action_gen_all = QtWidgets.QAction("Generate All...", self)
+                action_gen_all.setObjectName("actionGenerateAll")
+                action_gen_all.triggered.connect(self.code_gen.generate_all)
+                action_preview = QtWidgets.QAction("Preview Changes...", self)
+                action_preview.setObjectName("actionPreviewGeneration")
+                action_preview.triggered.connect(self.code_gen.preview_generation)
+                if hasattr(self.ui, "menuCode_Generator"):
+                    self.ui.menuCode_Generator.addAction(action_gen_all)
+                    self.ui.menuCode_Generator.addAction(action_preview)
+                    self.ui.menuCode_Generator.addAction(self.generation_log.toggleViewAction())
+                    self.ui.menuCode_Generator.addAction(self.footprint_dock.toggleViewAction())
+            except Exception as e:
+                print(f"Could not add generate all menu item: {e}")
+
+            # Generator targets, including plugins from the script directory
+            self.code_gen.connect_generator_menu()
+
             # Add Generate Header File action to the Code Generator menu
             try:
                 # Create action for Generate Header File
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox, QLabel,
+                            QLineEdit, QStackedWidget, QTreeWidget, QTreeWidgetItem)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal
+
+from Modules.RefreshScheduler import TITLE
+
+# API settings by section: (section title, ((key, label), ...))
+SMP_SECTIONS = (
+    ("SpinLock/Unlock API", (("spinlock_api", "SpinLock API:"),
+                             ("spinunlock_api", "SpinUnlock API:"),
+                             ("spinlock_header", "Header File:"))),
+    ("Semaphore API", (("semaphore_lock_api", "SemaphoreLock API:"),
+                       ("semaphore_unlock_api", "SemaphoreUnlock API:"),
+                       ("semaphore_header", "Header File:"))),
+    ("GetCoreId API", (("get_core_id_api", "GetCoreId API:"),
+                       ("get_core_id_header", "Header File:"))),
+)
+# A core of a multicore build has no GetCoreId API
+CORE_SECTIONS = SMP_SECTIONS[:2]
+
+SMP_KEYS = tuple(key for _, fields in SMP_SECTIONS for key, _ in fields)
+CORE_KEYS = tuple(key for _, fields in CORE_SECTIONS for key, _ in fields)
+
+
+def core_config_key(soc_name, core_name):
+    """Return the key of a core in api_config["multicore"]"""
+    return f"{soc_name}_{core_name}"
+
+
+def configured_cores(signals_data):
+    """Return the (soc, core) pairs of a project, in display order"""
+    core_info = signals_data.get("core_info") or {}
+    return [(soc_name, core_name) for soc_name, cores in core_info.items()
+            if isinstance(cores, dict) for core_name in cores]
+
+
+class ApiConfigModel:
+    """The api_config of the current project
+
+        {"smp": {key: text}, "multicore": {"<soc>_<core>": {key: text}}}
+
+    The dict lives in signals_data["project_specific"] and is looked up on
+    every call, as opening a file or undoing replaces signals_data. A core
+    of None stands for the SMP settings.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def config(self, create=False):
+        project = self.app.signals_data.get("project_specific")
+        if not create:
+            return (project or {}).get("api_config") or {}
+        if project is None:
+            project = self.app.signals_data["project_specific"] = {}
+        return project.setdefault("api_config", {})
+
+    def settings(self, core=None):
+        """Return {key: text} of a core, or of the SMP build for None"""
+        config = self.config()
+        if core is None:
+            return config.get("smp") or {}
+        return (config.get("multicore") or {}).get(core) or {}
+
+    def _entry(self, core):
+        """Return the settings dict of a core with every key present, creating it"""
+        config = self.config(create=True)
+        if core is None:
+            entry, keys = config.setdefault("smp", {}), SMP_KEYS
+        else:
+            entry, keys = config.setdefault("multicore", {}).setdefault(core, {}), CORE_KEYS
+        for key in keys:
+            entry.setdefault(key, "")
+        return entry
+
+    def set_value(self, core, key, text):
+        """Store one setting; return whether it changed"""
+        entry = self._entry(core)
+        if entry[key] == text:
+            return False
+        entry[key] = text
+        return True
+
+    def complete(self):
+        """Give the SMP build, or every core of a multicore build, all its keys
+
+        Projects are saved with the full set of keys, also for settings
+        that were never edited.
+        """
+        if self.app.signals_data.get("build_type", "SMP") == "SMP":
+            self._entry(None)
+        else:
+            for soc_name, core_name in configured_cores(self.app.signals_data):
+                self._entry(core_config_key(soc_name, core_name))
+
+    def clear(self):
+        project = self.app.signals_data.get("project_specific")
+        if project and "api_config" in project:
+            project["api_config"] = {}
+
+
+class ApiSettingsForm(QWidget):
+    """Line edits for one set of API settings, grouped by section"""
+
+    # key, text of a setting the user edited
+    edited = pyqtSignal(str, str)
+
+    def __init__(self, sections, parent=None):
+        super(ApiSettingsForm, self).__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.edits = {}
+        for title, fields in sections:
+            section = QGroupBox(title)
+            section_layout = QFormLayout(section)
+            for key, label in fields:
+                edit = self.edits[key] = QLineEdit()
+                # textEdited is not emitted by setText, so binding writes nothing back
+                edit.textEdited.connect(lambda text, key=key: self.edited.emit(key, text))
+                section_layout.addRow(label, edit)
+            layout.addWidget(section)
+        layout.addStretch()
+
+    def set_values(self, values):
+        for key, edit in self.edits.items():
+            text = str(values.get(key, "") or "")
+            if edit.text() != text:
+                edit.setText(text)
+
+
+class ApiConfigPanel(QWidget):
+    """API configuration of the project, shown in the APIscrollArea
+
+    Built once. An SMP build has one form; a multicore build lists its
+    cores and shows a single form for the selected core, so switching the
+    build type or adding cores creates no editors. Edits go straight into
+    ApiConfigModel.
+    """
+
+    def __init__(self, app, parent=None):
+        super(ApiConfigPanel, self).__init__(parent)
+        self.app = app
+        self.model = ApiConfigModel(app)
+        # Key of the core shown in core_form, None when no core is selected
+        self.core = None
+        # (soc, core) pairs listed in core_tree
+        self._cores = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        self.stack = QStackedWidget()
+        layout.addWidget(self.stack)
+
+        self.smp_page = QGroupBox("SMP API Configuration")
+        smp_layout = QVBoxLayout(self.smp_page)
+        self.smp_form = ApiSettingsForm(SMP_SECTIONS)
+        self.smp_form.edited.connect(lambda key, text: self._store(None, key, text))
+        smp_layout.addWidget(self.smp_form)
+        self.stack.addWidget(self.smp_page)
+
+        self.multicore_page = QGroupBox("Multi-core API Configuration")
+        multicore_layout = QHBoxLayout(self.multicore_page)
+        self.core_tree = QTreeWidget()
+        self.core_tree.setHeaderLabels(["Core"])
+        self.core_tree.setMaximumWidth(220)
+        self.core_tree.currentItemChanged.connect(self._core_selected)
+        multicore_layout.addWidget(self.core_tree)
+
+        core_widget = QWidget()
+        core_layout = QVBoxLayout(core_widget)
+        core_layout.setContentsMargins(0, 0, 0, 0)
+        self.core_label = QLabel()
+        label_font = QFont()
+        label_font.setBold(True)
+        self.core_label.setFont(label_font)
+        core_layout.addWidget(self.core_label)
+        self.core_form = ApiSettingsForm(CORE_SECTIONS)
+        self.core_form.edited.connect(self._store_core_value)
+        core_layout.addWidget(self.core_form)
+        multicore_layout.addWidget(core_widget, 1)
+        self.stack.addWidget(self.multicore_page)
+
+        self.no_cores_label = QLabel("No cores configured. Please configure cores first.")
+        self.no_cores_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.stack.addWidget(self.no_cores_label)
+
+    def refresh(self):
+        """Show the page of the current build type with the current values"""
+        if self.app.signals_data.get("build_type", "SMP") == "SMP":
+            self.smp_form.set_values(self.model.settings())
+            self.stack.setCurrentWidget(self.smp_page)
+            return
+
+        cores = configured_cores(self.app.signals_data)
+        if cores != self._cores:
+            self._list_cores(cores)
+        if not cores:
+            self.stack.setCurrentWidget(self.no_cores_label)
+            return
+        self._bind(self.core)
+        self.stack.setCurrentWidget(self.multicore_page)
+
+    def clear(self):
+        """Forget the listed cores and show empty values"""
+        self._cores = None
+        self.core = None
+        self.core_tree.clear()
+        self.refresh()
+
+    def _list_cores(self, cores):
+        """Fill core_tree, keeping the selected core if it still exists"""
+        selected = self.core
+        self._cores = cores
+        self.core_tree.blockSignals(True)
+        try:
+            self.core_tree.clear()
+            soc_items = {}
+            current = None
+            for soc_name, core_name in cores:
+                soc_item = soc_items.get(soc_name)
+                if soc_item is None:
+                    soc_item = soc_items[soc_name] = QTreeWidgetItem(self.core_tree, [f"SOC: {soc_name}"])
+                    soc_item.setFlags(soc_item.flags() & ~Qt.ItemIsSelectable)
+                    soc_item.setExpanded(True)
+                key = core_config_key(soc_name, core_name)
+                item = QTreeWidgetItem(soc_item, [core_name])
+                item.setData(0, Qt.UserRole, key)
+                if current is None or key == selected:
+                    current = item
+            if current is not None:
+                self.core_tree.setCurrentItem(current)
+            self.core = None if current is None else current.data(0, Qt.UserRole)
+        finally:
+            self.core_tree.blockSignals(False)
+
+    def _core_selected(self, item, previous=None):
+        key = None if item is None else item.data(0, Qt.UserRole)
+        if key is not None:
+            self._bind(key)
+
+    def _bind(self, key):
+        """Show the settings of the core with key in core_form"""
+        self.core = key
+        item = self.core_tree.currentItem()
+        if key is None or item is None or item.parent() is None:
+            self.core_label.setText("")
+        else:
+            self.core_label.setText(f"{item.parent().text(0)}, Core: {item.text(0)}")
+        self.core_form.setEnabled(key is not None)
+        self.core_form.set_values({} if key is None else self.model.settings(key))
+
+    def _store_core_value(self, key, text):
+        if self.core is not None:
+            self._store(self.core, key, text)
+
+    def _store(self, core, key, text):
+        if self.model.set_value(core, key, text):
+            self.app.modified = True
+            self.app.refresh.mark(TITLE)
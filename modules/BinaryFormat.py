@@ -0,0 +1,366 @@
+"""
+Compact binary container for signal manager projects (.sgmb)
+
+Layout (all integers little endian):
+
+    "SGMB"  u16 format version
+    u64 length + atom table      every distinct scalar (property names, signal names,
+                                 values such as "DDR" or 10) stored once
+    u64 length + document        top level object; each entry is an atom index
+                                 followed by a u64 length prefixed value
+
+Values are either a reference to the atom table or a nested list/object.
+The "signals" object is stored as a table: every signal is a row of u32
+atom references laid out according to its key shape, so loading a signal
+costs one struct unpack instead of one decode per property. Nested signal
+properties such as struct_fields are stored as compact JSON text atoms.
+"""
+
+import gc
+import json
+import struct
+from collections.abc import Mapping
+
+
+MAGIC = b"SGMB"
+FORMAT_VERSION = 1
+FILE_EXTENSION = ".sgmb"
+
+# Atom tags
+_ATOM_NULL = 0
+_ATOM_FALSE = 1
+_ATOM_TRUE = 2
+_ATOM_INT = 3
+_ATOM_FLOAT = 4
+_ATOM_STR = 5
+
+# Value tags
+_VALUE_ATOM = 0
+_VALUE_LIST = 1
+_VALUE_OBJECT = 2
+_VALUE_SIGNAL_TABLE = 3
+
+_U16 = struct.Struct("<H")
+_U64 = struct.Struct("<Q")
+_F64 = struct.Struct("<d")
+_ROW_HEADER = struct.Struct("<II")
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf, offset):
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+class _Encoder:
+    """Collects atoms while encoding the document body"""
+
+    def __init__(self):
+        self.atoms = []
+        self.atom_index = {}
+
+    def atom(self, value):
+        # bool/int/float compare equal to each other, so the type is part of the key
+        key = (type(value), value)
+        index = self.atom_index.get(key)
+        if index is None:
+            index = len(self.atoms)
+            self.atom_index[key] = index
+            self.atoms.append(value)
+        return index
+
+    def encode_value(self, out, value):
+        if isinstance(value, Mapping):
+            out.append(_VALUE_OBJECT)
+            _write_varint(out, len(value))
+            for key, item in value.items():
+                _write_varint(out, self.atom(key))
+                self.encode_value(out, item)
+        elif isinstance(value, (list, tuple)):
+            out.append(_VALUE_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self.encode_value(out, item)
+        elif value is None or isinstance(value, (str, int, float)):
+            out.append(_VALUE_ATOM)
+            _write_varint(out, self.atom(value))
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+    def encode_signal_table(self, out, signals):
+        shapes = []
+        shape_index = {}
+        rows = []
+
+        for name, properties in signals.items():
+            cells = [self.atom(name), 0]
+            nested = []
+            for position, value in enumerate(properties.values()):
+                if isinstance(value, (dict, list, tuple)):
+                    # Nested values (e.g. struct_fields) are kept as compact JSON text so
+                    # identical layouts share one atom but decode to independent objects
+                    value = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+                    nested.append(position)
+                cells.append(self.atom(value))
+
+            shape_key = (tuple(properties.keys()), tuple(nested))
+            shape = shape_index.get(shape_key)
+            if shape is None:
+                shape = len(shapes)
+                shape_index[shape_key] = shape
+                shapes.append(shape_key)
+            cells[1] = shape
+            rows.append(cells)
+
+        out.append(_VALUE_SIGNAL_TABLE)
+        _write_varint(out, len(shapes))
+        for keys, nested in shapes:
+            _write_varint(out, len(keys))
+            for key in keys:
+                _write_varint(out, self.atom(key))
+            _write_varint(out, len(nested))
+            for position in nested:
+                _write_varint(out, position)
+
+        _write_varint(out, len(rows))
+        for cells in rows:
+            out += struct.pack(f"<{len(cells)}I", *cells)
+
+    def encode_atoms(self):
+        out = bytearray()
+        _write_varint(out, len(self.atoms))
+        for value in self.atoms:
+            if value is None:
+                out.append(_ATOM_NULL)
+            elif value is True:
+                out.append(_ATOM_TRUE)
+            elif value is False:
+                out.append(_ATOM_FALSE)
+            elif isinstance(value, int):
+                out.append(_ATOM_INT)
+                # Zigzag encoding keeps small negative numbers short
+                _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+            elif isinstance(value, float):
+                out.append(_ATOM_FLOAT)
+                out += _F64.pack(value)
+            else:
+                encoded = value.encode("utf-8")
+                out.append(_ATOM_STR)
+                _write_varint(out, len(encoded))
+                out += encoded
+        return out
+
+
+class _Decoder:
+    def __init__(self, buf):
+        self.buf = buf
+        self.atoms = []
+
+    def decode_atoms(self, offset, end):
+        buf = self.buf
+        count, offset = _read_varint(buf, offset)
+        atoms = []
+        append = atoms.append
+        for _ in range(count):
+            tag = buf[offset]
+            offset += 1
+            if tag == _ATOM_STR:
+                length, offset = _read_varint(buf, offset)
+                append(str(buf[offset:offset + length], "utf-8"))
+                offset += length
+            elif tag == _ATOM_INT:
+                value, offset = _read_varint(buf, offset)
+                append(value >> 1 if not value & 1 else -((value + 1) >> 1))
+            elif tag == _ATOM_FLOAT:
+                append(_F64.unpack_from(buf, offset)[0])
+                offset += 8
+            elif tag == _ATOM_NULL:
+                append(None)
+            elif tag == _ATOM_TRUE:
+                append(True)
+            elif tag == _ATOM_FALSE:
+                append(False)
+            else:
+                raise ValueError(f"Unknown atom tag {tag} at offset {offset - 1}")
+        if offset != end:
+            raise ValueError("Atom table length mismatch")
+        self.atoms = atoms
+
+    def decode_value(self, offset):
+        buf = self.buf
+        atoms = self.atoms
+        tag = buf[offset]
+        offset += 1
+        if tag == _VALUE_ATOM:
+            index, offset = _read_varint(buf, offset)
+            return atoms[index], offset
+        if tag == _VALUE_OBJECT:
+            count, offset = _read_varint(buf, offset)
+            result = {}
+            for _ in range(count):
+                key, offset = _read_varint(buf, offset)
+                result[atoms[key]], offset = self.decode_value(offset)
+            return result, offset
+        if tag == _VALUE_LIST:
+            count, offset = _read_varint(buf, offset)
+            result = []
+            for _ in range(count):
+                item, offset = self.decode_value(offset)
+                result.append(item)
+            return result, offset
+        if tag == _VALUE_SIGNAL_TABLE:
+            return self.decode_signal_table(offset)
+        raise ValueError(f"Unknown value tag {tag} at offset {offset - 1}")
+
+    def decode_signal_table(self, offset):
+        buf = self.buf
+        atoms = self.atoms
+
+        shape_count, offset = _read_varint(buf, offset)
+        shapes = []
+        for _ in range(shape_count):
+            key_count, offset = _read_varint(buf, offset)
+            keys = []
+            for _ in range(key_count):
+                key, offset = _read_varint(buf, offset)
+                keys.append(atoms[key])
+            nested_count, offset = _read_varint(buf, offset)
+            nested_keys = []
+            for _ in range(nested_count):
+                position, offset = _read_varint(buf, offset)
+                nested_keys.append(keys[position])
+            shapes.append((tuple(keys), nested_keys, struct.Struct(f"<{key_count}I")))
+
+        signal_count, offset = _read_varint(buf, offset)
+        signals = {}
+        lookup = atoms.__getitem__
+        unpack_header = _ROW_HEADER.unpack_from
+        # Call the C scanner directly; the nested texts are always well formed
+        scan_once = json.JSONDecoder().scan_once
+        for _ in range(signal_count):
+            name, shape = unpack_header(buf, offset)
+            offset += 8
+            keys, nested_keys, row_struct = shapes[shape]
+            properties = dict(zip(keys, map(lookup, row_struct.unpack_from(buf, offset))))
+            for key in nested_keys:
+                properties[key] = scan_once(properties[key], 0)[0]
+            signals[atoms[name]] = properties
+            offset += row_struct.size
+        return signals, offset
+
+
+def dumps(data):
+    """Encode a project dictionary to .sgmb bytes"""
+    encoder = _Encoder()
+    body = bytearray()
+    _write_varint(body, len(data))
+    for key, value in data.items():
+        _write_varint(body, encoder.atom(key))
+        encoded = bytearray()
+        signal_table = (key == "signals" and isinstance(value, dict)
+                        and all(isinstance(props, Mapping) for props in value.values()))
+        if signal_table:
+            encoder.encode_signal_table(encoded, value)
+        else:
+            encoder.encode_value(encoded, value)
+        body += _U64.pack(len(encoded))
+        body += encoded
+
+    atoms = encoder.encode_atoms()
+    return b"".join([
+        MAGIC, _U16.pack(FORMAT_VERSION),
+        _U64.pack(len(atoms)), atoms,
+        _U64.pack(len(body)), body,
+    ])
+
+
+def loads(buf):
+    """Decode .sgmb bytes back to a project dictionary"""
+    buf = memoryview(buf)
+    if bytes(buf[:4]) != MAGIC:
+        raise ValueError("Not a signal manager binary file")
+    version = _U16.unpack_from(buf, 4)[0]
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary format version {version}")
+
+    # Decoding allocates many containers; pausing the cyclic GC avoids repeated collections
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode_document(buf)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _decode_document(buf):
+    decoder = _Decoder(buf)
+    offset = 6
+    atoms_length = _U64.unpack_from(buf, offset)[0]
+    offset += 8
+    decoder.decode_atoms(offset, offset + atoms_length)
+    offset += atoms_length
+
+    body_length = _U64.unpack_from(buf, offset)[0]
+    offset += 8
+    if offset + body_length > len(buf):
+        raise ValueError("Truncated binary file")
+
+    data = {}
+    count, offset = _read_varint(buf, offset)
+    for _ in range(count):
+        key, offset = _read_varint(buf, offset)
+        length = _U64.unpack_from(buf, offset)[0]
+        offset += 8
+        value, end = decoder.decode_value(offset)
+        if end != offset + length:
+            raise ValueError(f"Section '{decoder.atoms[key]}' length mismatch")
+        data[decoder.atoms[key]] = value
+        offset = end
+    return data
+
+
+def dump(data, file_path):
+    """Write a project dictionary to a .sgmb file"""
+    with open(file_path, 'wb') as f:
+        f.write(dumps(data))
+
+
+def load(file_path):
+    """Read a project dictionary from a .sgmb file"""
+    with open(file_path, 'rb') as f:
+        return loads(f.read())
+
+
+def is_binary_file(file_path):
+    """Return True if the path refers to a .sgmb project"""
+    return str(file_path).lower().endswith(FILE_EXTENSION)
+
+
+def json_to_binary(json_path, binary_path):
+    """Convert a JSON project file to the binary format"""
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    dump(data, binary_path)
+    return data
+
+
+def binary_to_json(binary_path, json_path):
+    """Convert a binary project file back to the JSON format used by save_file"""
+    data = load(binary_path)
+    with open(json_path, 'w') as f:
+        json.dump(data, f, indent=4)
+    return data
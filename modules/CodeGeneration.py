@@ -1,375 +1,395 @@
 import os
-from PyQt5.QtWidgets import QMessageBox, QFileDialog
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import QMessageBox, QFileDialog, QAction
+from PyQt5.QtCore import Qt
+
+from Modules import SignalMgrCore, HeaderGenerator, GeneratorRuntime, GeneratorRegistry
+from Modules.GenerateAllDialog import GenerateAllDialog, GenerationWorker
+from Modules.GenerationDiffDialog import GenerationDiffDialog
+from Modules.GenerationPipeline import GenerationPipeline, plan_jobs, DEFAULT_MAX_WORKERS
+from Modules.UndoHistory import share_copy
 
 class CodeGeneration:
     def __init__(self, app):
         self.app = app
-        self.script_paths = {
-            "signal_mgr": "/usr/local/bin/signal_mgr_generator.py",
-            "ipc_manager": "/usr/local/bin/ipc_manager_generator.py",
-            "ipc_eth_mgr": "/usr/local/bin/ipc_eth_mgr_generator.py"
-        }
-        # Load saved script paths if available
-        self.load_script_paths()
-
-    def load_script_paths(self):
-        """Load script paths from configuration"""
-        if "script_paths" in self.app.signals_data:
-            self.script_paths.update(self.app.signals_data["script_paths"])
-
-    def save_script_paths(self):
-        """Save script paths to configuration"""
-        self.app.signals_data["script_paths"] = self.script_paths
-        self.app.modified = True
-
-    def check_script_path(self, script_type):
-        """Check if script exists, prompt for path if not found"""
-        script_path = self.script_paths.get(script_type, "")
-
-        if not script_path or not os.path.isfile(script_path):
-            QMessageBox.information(
-                self.app,
-                "Script Not Found",
-                f"The script for {script_type} generation was not found. Please select the script file."
-            )
+        # Warm generator processes, kept for the whole session once started
+        self.worker_pool = None
+        # Background generation run, see _start_generation()
+        self.generation_thread = None
+        self.generation_worker = None
+        # QActions created for plugin targets, by target name
+        self.plugin_actions = {}
+        self._menu_connected = False
+
+    def _script_directory(self):
+        """Return the script directory shown in the UI, without validating it"""
+        ui = self.app.ui
+        if hasattr(ui, 'lineEdit_scripts_dir'):
+            return ui.lineEdit_scripts_dir.text()
+        if hasattr(ui, 'ScriptPathLineEdit'):
+            return ui.ScriptPathLineEdit.text()
+        return ""
 
-            file_path, _ = QFileDialog.getOpenFileName(
-                self.app,
-                f"Select {script_type.replace('_', ' ').title()} Script",
-                "",
-                "Python Files (*.py);;All Files (*)"
-            )
+    def generator_registry(self):
+        """Return the generator targets of the current script directory"""
+        return GeneratorRegistry.load(self._script_directory())
 
-            if file_path:
-                self.script_paths[script_type] = file_path
-                self.save_script_paths()
-                return file_path
-            else:
-                return None
+    def connect_generator_menu(self):
+        """Connect the built-in generator actions; plugin targets are added when the menu opens
 
-        return script_path
+        Called from SignalMgrApp.setup_connections. Looking up the plugins
+        waits until the Code Generator menu is first shown, so it does not
+        slow down startup.
+        """
+        for target in GeneratorRegistry.builtin_targets():
+            action = getattr(self.app.ui, target.action, None)
+            if action is not None:
+                action.triggered.connect(lambda checked=False, name=target.name: self.generate_target(name))
+        menu = getattr(self.app.ui, 'menuCode_Generator', None)
+        if menu is not None and not self._menu_connected:
+            menu.aboutToShow.connect(self.update_generator_menu)
+            self._menu_connected = True
+
+    def update_generator_menu(self):
+        """Add an action for every plugin target of the script directory, drop stale ones"""
+        menu = getattr(self.app.ui, 'menuCode_Generator', None)
+        if menu is None:
+            return
+        registry = self.generator_registry()
+        for name in list(self.plugin_actions):
+            target = registry.get(name)
+            if target is None or target.action is not None:
+                menu.removeAction(self.plugin_actions.pop(name))
+
+        # Plugin actions go before Generate All, after the built-in targets
+        before = next((action for action in menu.actions()
+                       if action.objectName() == "actionGenerateAll"), None)
+        for target in registry:
+            if target.action is not None:
+                continue
+            action = self.plugin_actions.get(target.name)
+            if action is None:
+                action = QAction(target.display_name, self.app)
+                action.setObjectName(f"actionGenerate_{target.name}")
+                action.triggered.connect(lambda checked=False, name=target.name: self.generate_target(name))
+                self.plugin_actions[target.name] = action
+                if before is not None:
+                    menu.insertAction(before, action)
+                else:
+                    menu.addAction(action)
+            action.setText(target.display_name)
 
     def check_get_required_details_for_generation(self) -> tuple:
+        """Return (script_directory, board_name, output_dir) from the UI, or None"""
+        if self.app.file_ops.refuse_while_loading("Generating code"):
+            return None
+
         # Check version information before exporting
         if not self.app.ui_helpers.check_version_for_export():
-            return
+            return None
 
-        # Get UI paths and settings
-        ui = self.app.ui_helpers
-        if not hasattr(self.app, 'ui_helpers'):
-            QMessageBox.critical(self.app, "Error", "UI helpers not initialized.")
-            return
+        ui = self.app.ui
 
         # Get script directory path
-        if hasattr(ui, 'ScriptPathLineEdit'):
-            script_directory = ui.ScriptPathLineEdit.text()
-        else:
+        if not hasattr(ui, 'lineEdit_scripts_dir') and not hasattr(ui, 'ScriptPathLineEdit'):
             QMessageBox.critical(self.app, "Error", "ScriptPathLineEdit not found.")
-            return
+            return None
+        script_directory = self._script_directory()
 
         if not script_directory or not os.path.exists(script_directory):
             QMessageBox.critical(self.app, "Error", "Script directory path is not configured.")
-            return
+            return None
 
         # Get board name
-        if hasattr(ui, 'boardListComboBox'):
-            board_name = ui.boardListComboBox.currentText()
-            if not board_name:
-                QMessageBox.critical(self.app, "Error", "No board selected.")
-                return
+        if hasattr(ui, 'BoardSelect'):
+            board_name = ui.BoardSelect.currentText()
         else:
-            QMessageBox.critical(self.app, "Error", "boardListComboBox not found.")
-            return
+            board_name = self.app.signals_data.get("selected_board", "")
+        if not board_name:
+            QMessageBox.critical(self.app, "Error", "No board selected.")
+            return None
 
         # Get output directory
-        if hasattr(ui, 'OutPutPathLineEdit'):
-            output_dir = ui.OutPutPathLineEdit.text()
+        if hasattr(ui, 'lineEdit_output_dir'):
+            output_dir = ui.lineEdit_output_dir.text()
+        elif hasattr(ui, 'OutputPathLineEdit'):
+            output_dir = ui.OutputPathLineEdit.text()
         else:
-            QMessageBox.critical(self.app, "Error", "OutPutPathLineEdit not found.")
-            return
+            output_dir = ""
 
         if not output_dir:
             output_dir = QFileDialog.getExistingDirectory(self.app, "Select Output Directory", os.path.expanduser("~/"))
             if not output_dir:
-                return
-            if hasattr(ui, 'OutPutPathLineEdit'):
-                ui.OutPutPathLineEdit.setText(output_dir)
+                return None
+            if hasattr(ui, 'OutputPathLineEdit'):
+                ui.OutputPathLineEdit.setText(output_dir)
+
+        return (script_directory, board_name, output_dir)
+
+    def _runtime_settings(self):
+        return self.app.signals_data.setdefault("project_specific", {}).setdefault("generator_runtime", {})
+
+    def _python_command(self):
+        """Return the interpreter used to run the generator scripts, or None"""
+        runtime = self._runtime_settings()
+        python_cmd = GeneratorRuntime.resolve_python(runtime.get("python"))
+        if python_cmd and runtime.get("python") != python_cmd:
+            # Remembered with the project, so the next session skips the lookup
+            runtime["python"] = python_cmd
+        return python_cmd
+
+    def _worker_pool(self, python_cmd):
+        """Return the session's warm worker pool for python_cmd"""
+        if self.worker_pool is None or self.worker_pool.python_cmd != python_cmd:
+            if self.worker_pool is not None:
+                self.worker_pool.close()
+            self.worker_pool = GeneratorRuntime.WorkerPool(python_cmd, DEFAULT_MAX_WORKERS)
+        return self.worker_pool
+
+    def _runner(self, python_cmd):
+        """Return the warm worker pool if the project enables it, else None"""
+        if self._runtime_settings().get("warm_worker", False):
+            return self._worker_pool(python_cmd)
+        return None
+
+    def update_runtime_settings(self, settings):
+        """Store generator runtime settings ("warm_worker", "timeout") in the project"""
+        self._runtime_settings().update(settings)
+        if not settings.get("warm_worker", True) and self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
+        self.app.modified = True
+        self.app.ui_helpers.update_window_title()
 
-        if output_dir and script_directory and board_name:
-            return (script_directory, board_name, output_dir)
-        else:
-            return None
+    def _data_snapshot(self):
+        """Return a copy of the project that stays stable while generators run"""
+        return share_copy(self.app.signals_data)
 
-    def generate_signal_mgr(self):
-        """Generate Signal Manager code"""
+    def generate_target(self, name):
+        """Export the project and run one generator target in the background
 
-        #check and get required parameters
+        The output streams into the generation log panel while editing
+        continues; the panel's Cancel button stops the generator.
+        """
+        if self._generation_running():
+            return
+
+        # Check and get required parameters
         details = self.check_get_required_details_for_generation()
         if not details:
             return
 
-        output_dir, board_name, script_directory = details
-
-        # Export data to Excel using existing function
-        excel_path = os.path.join(output_dir, "signal_data.xlsx")
-        if hasattr(self.app, 'file_ops') and hasattr(self.app.file_ops, 'export_to_excel'):
-            success = self.app.file_ops.export_to_excel(excel_path)
-            if not success or not os.path.exists(excel_path):
-                QMessageBox.critical(self.app, "Error", "Failed to export data to Excel.")
-                return
-            else:
-                # Determine python command
-                python_cmd = "python"
-                try:
-                    import subprocess
-                    result = subprocess.run(["python", "--version"], capture_output=True, text=True)
-                    if result.returncode != 0:
-                        result = subprocess.run(["python3", "--version"], capture_output=True, text=True)
-                        if result.returncode == 0:
-                            python_cmd = "python3"
-                        else:
-                            QMessageBox.critical(self.app, "Error", "Python command not available.")
-                            return
-                except Exception:
-                    pass
-
-                # Run the generator script
-                try:
-                    script_path = os.path.join(script_directory, "main.py")
-                    if not os.path.isfile(script_path):
-                        QMessageBox.critical(self.app, "Error", f"Script not found: {script_path}")
-                        return
-
-                    cmd = [python_cmd, script_path, "-f", excel_path, "-i", "SigM", "-B", board_name, "-O", output_dir]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-
-                    if result.returncode == 0:
-                        QMessageBox.information(self.app, "Success", f"Signal Manager code generated in {output_dir}")
-                    else:
-                        QMessageBox.critical(self.app, "Error", f"Failed to generate code:\n{result.stderr}")
-                except Exception as e:
-                    QMessageBox.critical(self.app, "Error", f"Error: {str(e)}")
+        script_directory, board_name, output_dir = details
 
-        else:
-            QMessageBox.critical(self.app, "Error", "Export function not available.")
+        python_cmd = self._python_command()
+        if python_cmd is None:
+            QMessageBox.critical(self.app, "Error", "Python command not available.")
             return
 
-    def generate_ipc_manager(self):
-        """Generate IPC Manager code"""
+        try:
+            target = SignalMgrCore.generator_target(name, script_directory)
+            SignalMgrCore.check_generation_inputs(target, script_directory, board_name, output_dir,
+                                                  SignalMgrCore.generator_input_format(self.app.signals_data))
+        except SignalMgrCore.SignalMgrError as e:
+            QMessageBox.critical(self.app, "Error", str(e))
+            return
+        display_name = target.display_name
+
+        # Make sure the exported Version sheet carries the values shown in the UI
+        self.app.ui_helpers.update_version_info(skip_validation=True)
+
+        runtime = self._runtime_settings()
+        pipeline = GenerationPipeline(self._data_snapshot(), script_directory, output_dir, python_cmd,
+                                      runner=self._runner(python_cmd), timeout=runtime.get("timeout"))
+        jobs = plan_jobs([target], [board_name], output_dir)
+        self._start_generation(f"{display_name} [{board_name}] -> {output_dir}", pipeline, jobs,
+                               lambda job: self._generation_finished(job, display_name))
+
+    def _generation_running(self):
+        if self.app.generation_log.running or self.generation_thread is not None:
+            QMessageBox.warning(self.app, "Warning", "A generation is already running.")
+            return True
+        return False
+
+    def _start_generation(self, title, pipeline, jobs, on_job_finished, on_finished=None):
+        """Run jobs of pipeline on a worker thread, streaming into the generation log"""
+        log_dock = self.app.generation_log
+        worker = GenerationWorker(pipeline, jobs)
+        thread = QtCore.QThread(self.app)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.job_output.connect(log_dock.append_output)
+        worker.job_finished.connect(on_job_finished)
+        worker.failed.connect(self._generation_failed)
+        if on_finished is not None:
+            worker.finished.connect(on_finished)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(self._generation_thread_done)
+        self.generation_thread, self.generation_worker = thread, worker
+
+        log_dock.start(title, pipeline)
+        thread.start()
+
+    def preview_generation(self):
+        """Run all generators for the selected board without writing, then show the diff"""
+        if self._generation_running():
+            return
 
-        #check and get required parameters
         details = self.check_get_required_details_for_generation()
         if not details:
             return
 
-        output_dir, board_name, script_directory = details
-
-        # Export data to Excel using existing function
-        excel_path = os.path.join(output_dir, "signal_data.xlsx")
-        if hasattr(self.app, 'file_ops') and hasattr(self.app.file_ops, 'export_to_excel'):
-            success = self.app.file_ops.export_to_excel(excel_path)
-            if not success or not os.path.exists(excel_path):
-                QMessageBox.critical(self.app, "Error", "Failed to export data to Excel.")
-                return
-            else:
-                # Determine python command
-                python_cmd = "python"
-                try:
-                    import subprocess
-                    result = subprocess.run(["python", "--version"], capture_output=True, text=True)
-                    if result.returncode != 0:
-                        result = subprocess.run(["python3", "--version"], capture_output=True, text=True)
-                        if result.returncode == 0:
-                            python_cmd = "python3"
-                        else:
-                            QMessageBox.critical(self.app, "Error", "Python command not available.")
-                            return
-                except Exception:
-                    pass
-
-                # Run the generator script
-                try:
-                    script_path = os.path.join(script_directory, "main.py")
-                    if not os.path.isfile(script_path):
-                        QMessageBox.critical(self.app, "Error", f"Script not found: {script_path}")
-                        return
-
-                    cmd = [python_cmd, script_path, "-f", excel_path, "-i", "IPC", "-B", board_name, "-O", output_dir]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-
-                    if result.returncode == 0:
-                        QMessageBox.information(self.app, "Success", f"IpcManager code generated in {output_dir}")
-                    else:
-                        QMessageBox.critical(self.app, "Error", f"Failed to generate code:\n{result.stderr}")
-                except Exception as e:
-                    QMessageBox.critical(self.app, "Error", f"Error: {str(e)}")
+        script_directory, board_name, output_dir = details
+        python_cmd = self._python_command()
+        if python_cmd is None:
+            QMessageBox.critical(self.app, "Error", "Python command not available.")
+            return
 
-        else:
-            QMessageBox.critical(self.app, "Error", "Export function not available.")
+        targets = list(GeneratorRegistry.load(script_directory))
+        input_format = SignalMgrCore.generator_input_format(self.app.signals_data)
+        try:
+            for target in targets:
+                SignalMgrCore.check_generation_inputs(target, script_directory, board_name, output_dir,
+                                                      input_format)
+        except SignalMgrCore.SignalMgrError as e:
+            QMessageBox.critical(self.app, "Error", str(e))
             return
 
-    def generate_ipc_eth_mgr(self):
-        """Generate IPC over Ethernet Manager code"""
+        self.app.ui_helpers.update_version_info(skip_validation=True)
+
+        runtime = self._runtime_settings()
+        pipeline = GenerationPipeline(self._data_snapshot(), script_directory, output_dir, python_cmd,
+                                      runner=self._runner(python_cmd), timeout=runtime.get("timeout"),
+                                      dry_run=True)
+        jobs = plan_jobs(targets, [board_name], output_dir)
+        log_dock = self.app.generation_log
+
+        def job_finished(job):
+            log_dock.append(f"{job.label}: {job.status} ({job.statistics})")
+
+        def finished():
+            if not log_dock.running:
+                return  # _generation_failed already reported it
+            log_dock.finish("Preview ready")
+            dialog = GenerationDiffDialog(pipeline, jobs, self.app)
+            dialog.setAttribute(Qt.WA_DeleteOnClose)
+            dialog.show()
+
+        self._start_generation(f"Preview [{board_name}] -> {output_dir}", pipeline, jobs,
+                               job_finished, finished)
+
+    def _generation_finished(self, job, display_name):
+        log_dock = self.app.generation_log
+        if job.skipped:
+            message = f"{display_name} code in {job.output_dir} is up to date"
+        elif job.ok:
+            message = (f"{display_name} code generated in {job.output_dir}: {len(job.written_files)} files "
+                       f"written, {len(job.unchanged_files)} unchanged ({job.statistics})")
+        else:
+            message = f"{display_name}: {job.status} ({job.statistics})"
+            if job.error is not None:
+                log_dock.append(job.error)
+        log_dock.append(message)
+        log_dock.finish(message)
+        if hasattr(self.app.ui, 'statusBar'):
+            self.app.ui.statusBar.showMessage(message, 10000)
+
+    def _generation_failed(self, message):
+        log_dock = self.app.generation_log
+        log_dock.append(f"Error: {message}")
+        log_dock.finish("Failed")
+        QMessageBox.critical(self.app, "Error", message)
+
+    def _generation_thread_done(self):
+        self.generation_thread = None
+        self.generation_worker = None
+
+    def generate_all(self):
+        """Generate several targets for several boards in parallel"""
+        if self._generation_running():
+            return
 
-        #check and get required parameters
         details = self.check_get_required_details_for_generation()
         if not details:
             return
 
-        output_dir, board_name, script_directory = details
-
-        # Export data to Excel using existing function
-        excel_path = os.path.join(output_dir, "signal_data.xlsx")
-        if hasattr(self.app, 'file_ops') and hasattr(self.app.file_ops, 'export_to_excel'):
-            success = self.app.file_ops.export_to_excel(excel_path)
-            if not success or not os.path.exists(excel_path):
-                QMessageBox.critical(self.app, "Error", "Failed to export data to Excel.")
-                return
-            else:
-                # Determine python command
-                python_cmd = "python"
-                try:
-                    import subprocess
-                    result = subprocess.run(["python", "--version"], capture_output=True, text=True)
-                    if result.returncode != 0:
-                        result = subprocess.run(["python3", "--version"], capture_output=True, text=True)
-                        if result.returncode == 0:
-                            python_cmd = "python3"
-                        else:
-                            QMessageBox.critical(self.app, "Error", "Python command not available.")
-                            return
-                except Exception:
-                    pass
-
-                # Run the generator script
-                try:
-                    script_path = os.path.join(script_directory, "main.py")
-                    if not os.path.isfile(script_path):
-                        QMessageBox.critical(self.app, "Error", f"Script not found: {script_path}")
-                        return
-
-                    cmd = [python_cmd, script_path, "-f", excel_path, "-i", "IpcOvEth", "-B", board_name, "-O", output_dir]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-
-                    if result.returncode == 0:
-                        QMessageBox.information(self.app, "Success", f"Signal Manager code generated in {output_dir}")
-                    else:
-                        QMessageBox.critical(self.app, "Error", f"Failed to generate code:\n{result.stderr}")
-                except Exception as e:
-                    QMessageBox.critical(self.app, "Error", f"Error: {str(e)}")
+        script_directory, board_name, output_dir = details
+        python_cmd = self._python_command()
+        if python_cmd is None:
+            QMessageBox.critical(self.app, "Error", "Python command not available.")
+            return
 
+        self.app.ui_helpers.update_version_info(skip_validation=True)
+
+        if hasattr(self.app.ui, 'BoardSelect'):
+            boards = [self.app.ui.BoardSelect.itemText(i) for i in range(self.app.ui.BoardSelect.count())]
         else:
-            QMessageBox.critical(self.app, "Error", "Export function not available.")
-            return
+            boards = list(self.app.signals_data.get("board_options", [board_name]))
+
+        # The generators run while editing continues, on a snapshot taken per run
+        dialog = GenerateAllDialog(self._data_snapshot, boards, board_name, script_directory, output_dir,
+                                   python_cmd, self.app, self._worker_pool(python_cmd),
+                                   self.app.generation_log)
+        dialog.input_format_changed.connect(self.set_generator_input_format)
+        dialog.runtime_changed.connect(self.update_runtime_settings)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.show()
+
+    def set_generator_input_format(self, input_format):
+        """Remember the generator input format ("excel" or "json") in the project"""
+        self.app.signals_data.setdefault("project_specific", {})["generator_input"] = input_format
+        self.app.modified = True
+        self.app.ui_helpers.update_window_title()
 
     def generate_header_file(self, output_path=None):
         """
-        Generate a header file (.h) containing signal definitions.
+        Generate a C header (.h) and source (.c) file for the signals of the project.
 
         Args:
             output_path (str, optional): Path where the header file should be saved.
-                If None, a file dialog will prompt for the location.
+                If None, a file dialog will prompt for the location. The source
+                file is written next to it.
 
         Returns:
             bool: True if the operation was successful, False otherwise.
         """
+        if self.app.file_ops.refuse_while_loading("Generating code"):
+            return False
+
         try:
-            if output_path is None:
-                # Get the default directory from settings or use a default
-                default_dir = self.settings.get('last_export_dir', '')
-                # Open file dialog to get the save location
+            # The menu action passes its checked state
+            if not isinstance(output_path, str) or not output_path:
+                paths = self.app.signals_data.get("project_specific", {}).get("paths", {})
+                default_path = os.path.join(paths.get("output_path", ""), "signal_definitions.h")
                 output_path, _ = QFileDialog.getSaveFileName(
-                    self.parent,
+                    self.app,
                     "Save Header File",
-                    default_dir,
+                    default_path,
                     "Header Files (*.h)"
                 )
 
                 if not output_path:  # User canceled
                     return False
 
-                # Save the directory for next time
-                self.settings['last_export_dir'] = os.path.dirname(output_path)
-
             # Ensure the file has the correct extension
             if not output_path.lower().endswith('.h'):
                 output_path += '.h'
+            source_path = os.path.splitext(output_path)[0] + '.c'
 
-            # Generate the header file content
-            header_content = self._generate_header_content()
-
-            # Write to file
-            with open(output_path, 'w') as file:
-                file.write(header_content)
+            signals = self.app.signals_data.get("signals") or {}
+            HeaderGenerator.write_header(signals, output_path, source_path)
 
             QMessageBox.information(
-                self.parent,
+                self.app,
                 "Success",
-                f"Header file generated successfully at:\n{output_path}"
+                f"Header file generated successfully at:\n{output_path}\n{source_path}"
             )
             return True
 
         except Exception as e:
             QMessageBox.critical(
-                self.parent,
+                self.app,
                 "Error",
                 f"Failed to generate header file:\n{str(e)}"
             )
             return False
-
-    def _generate_header_content(self):
-        """
-        Generate the content for the header file.
-
-        Returns:
-            str: The content of the header file.
-        """
-        # Get the current date and time
-        now = datetime.datetime.now()
-        date_str = now.strftime("%Y-%m-%d")
-
-        # Start with the header guard and includes
-        header = f"""/**
-        * @file signal_definitions.h
-        * @brief Auto-generated signal definitions
-        * @date {date_str}
-        */
-
-        #ifndef SIGNAL_DEFINITIONS_H
-        #define SIGNAL_DEFINITIONS_H
-
-        #include <stdint.h>
-
-        """
-
-        # Add signal definitions
-        # This will depend on your specific requirements and data structure
-        signals = self._get_signals()
-
-        # Add enum or define statements for each signal
-        header += "/* Signal Definitions */\n"
-        header += "typedef enum {\n"
-
-        for i, signal in enumerate(signals):
-            header += f"    {signal['name']} = {signal['id']},\n"
-
-        header += "    SIGNAL_COUNT\n"
-        header += "} SignalId_t;\n\n"
-
-        # Add any additional structures or declarations
-
-        # Close the header guard
-        header += "\n#endif /* SIGNAL_DEFINITIONS_H */\n"
-
-        return header
-
-    def _get_signals(self):
-        """
-        Get the list of signals to include in the header file.
-
-        Returns:
-            list: A list of signal dictionaries.
-        """
-        # This implementation will depend on how signals are stored in your application
-        # For now, return a placeholder
-        return self.parent.signal_model.get_all_signals() if hasattr(self.parent, 'signal_model') else []
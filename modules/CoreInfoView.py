@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtWidgets import QTreeWidgetItem
+
+EMPTY_TEXT = "No core information available"
+_UNSET = object()
+
+# Flags of a core shown as "<name>: Yes" when set
+CORE_FLAGS = (
+    ("is_qnx", "QNX Core"),
+    ("is_autosar", "Autosar Compliant"),
+    ("is_sim", "Simulation Core"),
+)
+
+
+def core_detail_lines(core_props):
+    """Return the texts of the detail rows shown below a core"""
+    if not isinstance(core_props, dict):
+        return [str(core_props)]
+    lines = [f"Role: {'Master' if core_props.get('is_master', False) else 'Slave'}",
+             f"OS: {core_props.get('os', 'Unknown')}"]
+    family = str(core_props.get("soc_family", "Unknown"))
+    if family and family != "Unknown":
+        lines.append(f"SOC Family: {family}")
+    lines.extend(f"{display_name}: Yes" for prop_name, display_name in CORE_FLAGS
+                 if core_props.get(prop_name, False))
+    return lines
+
+
+def _set_children(parent, texts):
+    """Make the leaf children of parent show texts, reusing the existing items"""
+    for index, text in enumerate(texts):
+        if index < parent.childCount():
+            child = parent.child(index)
+            if child.text(0) != text:
+                child.setText(0, text)
+        else:
+            QTreeWidgetItem(parent, [text])
+    while parent.childCount() > len(texts):
+        parent.removeChild(parent.child(parent.childCount() - 1))
+
+
+class _Node:
+    """A tree item with its child nodes by key, in display order"""
+
+    __slots__ = ("item", "children", "value")
+
+    def __init__(self, item):
+        self.item = item
+        self.children = {}
+        self.value = _UNSET
+
+
+class CoreInfoView:
+    """Keeps the Core Info tree widget in step with signals_data["core_info"]
+
+    update() compares the new core_info with the one shown last and only
+    adds, removes, moves or relabels the SOC, core and detail items that
+    differ, so expanded nodes stay expanded and an unchanged core costs a
+    dict comparison.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        # soc name -> _Node whose children are the cores, by name
+        self.socs = {}
+        self._empty_item = None
+
+    def clear(self):
+        self.tree.clear()
+        self.socs = {}
+        self._empty_item = None
+
+    def update(self, core_info):
+        core_info = core_info or {}
+        if not core_info:
+            if self._empty_item is None:
+                self.clear()
+                self._empty_item = QTreeWidgetItem([EMPTY_TEXT])
+                self.tree.addTopLevelItem(self._empty_item)
+            return
+        if self._empty_item is not None:
+            self.clear()
+
+        root = self.tree.invisibleRootItem()
+        for soc_name in [name for name in self.socs if name not in core_info]:
+            root.removeChild(self.socs.pop(soc_name).item)
+
+        for index, (soc_name, cores) in enumerate(core_info.items()):
+            soc_node = self.socs.get(soc_name)
+            if soc_node is None:
+                soc_node = self.socs[soc_name] = _Node(QTreeWidgetItem([f"SOC: {soc_name}"]))
+                root.insertChild(index, soc_node.item)
+                soc_node.item.setExpanded(True)
+            else:
+                self._place(root, soc_node.item, index)
+            self._update_cores(soc_node, cores if isinstance(cores, dict) else {})
+
+        # Keep the dict in display order for the next comparison
+        self.socs = {soc_name: self.socs[soc_name] for soc_name in core_info}
+
+    def _update_cores(self, soc_node, cores):
+        soc_item = soc_node.item
+        for core_name in [name for name in soc_node.children if name not in cores]:
+            soc_item.removeChild(soc_node.children.pop(core_name).item)
+
+        for index, (core_name, core_props) in enumerate(cores.items()):
+            core_node = soc_node.children.get(core_name)
+            if core_node is None:
+                core_node = soc_node.children[core_name] = _Node(QTreeWidgetItem([f"Core: {core_name}"]))
+                soc_item.insertChild(index, core_node.item)
+            else:
+                self._place(soc_item, core_node.item, index)
+            if core_node.value is _UNSET or core_node.value != core_props:
+                _set_children(core_node.item, core_detail_lines(core_props))
+                # Copy, as the dialogs edit core_info in place
+                core_node.value = dict(core_props) if isinstance(core_props, dict) else core_props
+
+        soc_node.children = {core_name: soc_node.children[core_name] for core_name in cores}
+
+    @staticmethod
+    def _place(parent, item, index):
+        """Move item to position index of parent if it is elsewhere"""
+        if parent.indexOfChild(item) != index:
+            # Qt forgets the expansion of items taken out of the tree
+            items = [item] + [item.child(i) for i in range(item.childCount())]
+            expanded = [child.isExpanded() for child in items]
+            parent.removeChild(item)
+            parent.insertChild(index, item)
+            for child, was_expanded in zip(items, expanded):
+                child.setExpanded(was_expanded)
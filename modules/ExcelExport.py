@@ -0,0 +1,213 @@
+import datetime
+from itertools import zip_longest
+
+from Modules.RoutingMatrix import CORE_INDEX, core_key, route_mask
+
+# Projects with at least this many signals are exported with xlsxwriter's
+# constant_memory option, which flushes every row to disk once it is written.
+# The LookUpTable rows are then also generated one at a time, see signal_rows().
+CONSTANT_MEMORY_MIN_SIGNALS = 20000
+
+# Extra characters added to the widest cell of a column
+COLUMN_PADDING = 2
+
+HEADER_FORMAT = {
+    'align': 'center',
+    'valign': 'vcenter',
+    'bg_color': '#c6efce',  # Light green color for headers
+    'bold': True,
+    'border': 1  # Add border to all cells
+}
+
+DATA_FORMAT = {
+    'align': 'center',
+    'valign': 'vcenter',
+    'bg_color': '#c0c0c0',   # Darker gray color
+    'border': 1  # Add border to all cells
+}
+
+# LookUpTable columns before the per-core destination columns: (header, property, default)
+SIGNAL_COLUMNS = (
+    ('Variable_Port_Name', 'Variable_Port_Name', ''),
+    ('Memory Region', 'Memory Region', ''),
+    ('Buffer count_IPC', 'Buffer count_IPC', ''),
+    ('Type', 'Type', ''),
+    ('InitValue', 'InitValue', ''),
+    ('Notifiers', 'Notifiers', False),
+    ('Source', 'Source', ''),
+    ('Impl_Approach', 'Impl_Approach', ''),
+    ('GetObjRef', 'GetObjRef', False),
+    ('SM_Buff_Count', 'SM_Buff_Count', ''),
+    ('Timeout', 'Timeout', ''),
+    ('Periodicity', 'Periodicity', ''),
+    ('ASIL', 'ASIL', ''),
+    ('Checksum', 'Checksum', ''),
+    ('DataType', 'DataType', 'INT32'),
+)
+
+# Columns exported as Yes/No
+YES_NO_COLUMNS = {'Notifiers', 'GetObjRef'}
+
+
+def workbook_options(signal_count):
+    """Return the xlsxwriter Workbook options for a project with signal_count signals"""
+    if signal_count >= CONSTANT_MEMORY_MIN_SIGNALS:
+        return {'constant_memory': True}
+    return {}
+
+
+def _cell(value):
+    """Return value in a form xlsxwriter can write"""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def signal_header(available_cores):
+    """Return the header of the LookUpTable sheet"""
+    return ['Index', 'Data_Type'] + [column[0] for column in SIGNAL_COLUMNS] + list(available_cores) + ['description']
+
+
+def signal_rows(signals, available_cores):
+    """Yield the rows of the LookUpTable sheet one at a time
+
+    Each row starts with its 1-based index, followed by the signal name,
+    the SIGNAL_COLUMNS properties, one Yes/No column per core in
+    available_cores and the description.
+    """
+    core_bits = [CORE_INDEX.bit(core_key(core)) for core in available_cores]
+    for index, (signal_name, signal_info) in enumerate(signals.items(), 1):
+        get = signal_info.get
+        row = [index, signal_name]
+        for column, key, default in SIGNAL_COLUMNS:
+            value = get(key, default)
+            if column in YES_NO_COLUMNS:
+                value = 'Yes' if value else 'No'
+            elif column == 'Checksum' and not value:
+                value = 'None'
+            row.append(_cell(value))
+        routes = route_mask(signal_info)
+        row.extend(['Yes' if routes & bit else 'No' for bit in core_bits])
+        row.append(_cell(get('description', '')))
+        yield row
+
+
+VERSION_HEADER = ['Version', 'Date', 'Last Modified By', 'Description']
+SOC_BUILD_HEADER = ['SOC Name', 'TypeOfBin']
+CORE_HEADER = ['SOC', 'CORE', 'Master/Slave', 'Is Qnx Core ?', 'Is Autosar Compliant ?',
+               'Is Sim Core ?', 'OS', 'SOC Family']
+
+
+def version_rows(metadata):
+    """Return the rows of the Version sheet"""
+    date = metadata.get("date") or datetime.date.today().strftime('%Y-%m-%d')
+    return [[metadata.get("version", "1.0"), date, metadata.get("editor", ""), metadata.get("description", "")]]
+
+
+def config_tables(data):
+    """Return the (first_col, header, rows) tables of the Config sheet
+
+    SOC/Build Type go to columns A-B and the cores, if any, from column E.
+    Legacy cores stored as a plain description string are exported with
+    default properties.
+    """
+    tables = [(0, SOC_BUILD_HEADER, [[data.get('soc_type', ''), data.get('build_type', '')]])]
+    core_rows = []
+    for soc_name, cores in (data.get("core_info") or {}).items():
+        for core_name, core in cores.items():
+            if not isinstance(core, dict):
+                core = {}
+            core_rows.append([
+                soc_name,
+                core_name,
+                'Master' if core.get('is_master', False) else 'Slave',
+                'Yes' if core.get('is_qnx', False) else 'No',
+                'Yes' if core.get('is_autosar', False) else 'No',
+                'Yes' if core.get('is_sim', False) else 'No',
+                core.get('os', 'Unknown'),
+                core.get('soc_family', 'Unknown')
+            ])
+    if core_rows:
+        tables.append((4, CORE_HEADER, core_rows))
+    return tables
+
+
+def available_cores(data):
+    """Return all configured cores in the format 'soc.core'"""
+    return [f"{soc_name}.{core_name}"
+            for soc_name, cores in (data.get("core_info") or {}).items()
+            for core_name in cores]
+
+
+def workbook_tables(data, lazy=False):
+    """Return {sheet name: [(first_col, header, rows), ...]} for the exported sheets
+
+    With lazy=True the LookUpTable rows are a generator, for writing the
+    sheet once without holding all of its rows.
+    """
+    sheets = {
+        'Version': [(0, VERSION_HEADER, version_rows(data.get("metadata") or {}))],
+        'Config': config_tables(data),
+    }
+    signals = data.get("signals") or {}
+    if signals:
+        cores = available_cores(data)
+        rows = signal_rows(signals, cores) if lazy else list(signal_rows(signals, cores))
+        sheets['LookUpTable'] = [(0, signal_header(cores), rows)]
+    return sheets
+
+
+def write_workbook(data, file_path, sheets=None):
+    """Export a project to an Excel workbook without any GUI
+
+    Writes the Version, Config and LookUpTable sheets exactly like the
+    export of the main window, straight through xlsxwriter. sheets are the
+    tables from workbook_tables(data), if already built.
+    """
+    import xlsxwriter
+
+    signals = data.get("signals") or {}
+    workbook = xlsxwriter.Workbook(file_path, workbook_options(len(signals)))
+    try:
+        header_format = workbook.add_format(HEADER_FORMAT)
+        data_format = workbook.add_format(DATA_FORMAT)
+        for sheet_name, tables in (sheets or workbook_tables(data, lazy=True)).items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            write_tables(worksheet, tables, header_format, data_format)
+            if sheet_name == 'LookUpTable':
+                # Freeze the first three columns (Index, Data_Type, Variable_Port_Name)
+                worksheet.freeze_panes(1, 3)
+    finally:
+        workbook.close()
+
+
+def write_tables(worksheet, tables, header_format=None, data_format=None):
+    """Write tables that sit side by side on one worksheet
+
+    tables is a list of (first_col, header, rows), where rows may be any
+    iterable, e.g. signal_rows(). Every worksheet row is written once with
+    write_row, in ascending order, so the sheet can be written in
+    constant_memory mode. Column widths are measured as the rows go by and
+    set at the end, so no row is kept after it was written.
+    """
+    widths = []
+    for first_col, header, rows in tables:
+        worksheet.write_row(0, first_col, header, header_format)
+        widths.append([len(str(name)) for name in header])
+
+    for row_num, table_rows in enumerate(zip_longest(*(rows for _, _, rows in tables)), 1):
+        for (first_col, _, _), table_widths, row in zip(tables, widths, table_rows):
+            if row is None:
+                continue
+            worksheet.write_row(row_num, first_col, row, data_format)
+            lengths = list(map(len, map(str, row)))
+            table_widths[:len(lengths)] = map(max, table_widths, lengths)
+
+    for (first_col, _, _), table_widths in zip(tables, widths):
+        for offset, width in enumerate(table_widths):
+            worksheet.set_column(first_col + offset, first_col + offset, width + COLUMN_PADDING)
+
+
+def write_table(worksheet, header, rows, header_format=None, data_format=None, first_col=0):
+    """Write a single table with its header in the first row"""
+    write_tables(worksheet, [(first_col, header, rows)], header_format, data_format)
@@ -0,0 +1,237 @@
+import sys
+from itertools import repeat
+
+import pandas as pd
+
+# Sheets read from an exported workbook
+IMPORT_SHEETS = ('Version', 'Config', 'LookUpTable')
+
+# LookUpTable text columns: property -> default for empty cells
+SIGNAL_TEXT_COLUMNS = {
+    "Memory Region": "DDR",
+    "Type": "Concurrent",
+    "InitValue": "ZeroMemory",
+    "Source": "",
+    "Impl_Approach": "SharedMemory",
+    "ASIL": "QM",
+    "Checksum": "None",
+    "DataType": "INT32",
+    "description": "Imported signal",
+}
+
+# LookUpTable integer columns: property -> default for empty cells
+SIGNAL_INT_COLUMNS = {
+    "Buffer count_IPC": 1,
+    "SM_Buff_Count": 1,
+    "Timeout": 10,
+    "Periodicity": 10,
+}
+
+# LookUpTable Yes/No columns
+SIGNAL_BOOL_COLUMNS = ("Notifiers", "GetObjRef")
+
+# Every other LookUpTable column is a destination core
+STANDARD_SIGNAL_COLUMNS = (
+    {"Index", "Data_Type", "Variable_Port_Name"}
+    | set(SIGNAL_TEXT_COLUMNS) | set(SIGNAL_INT_COLUMNS) | set(SIGNAL_BOOL_COLUMNS)
+)
+
+
+def read_sheets(file_path, sheet_names=IMPORT_SHEETS):
+    """Parse the given sheets of a workbook, opening the file only once
+
+    Returns {sheet name: DataFrame} for the sheets that exist.
+    """
+    with pd.ExcelFile(file_path) as workbook:
+        return {name: workbook.parse(name) for name in sheet_names if name in workbook.sheet_names}
+
+
+def _text(df, column, default):
+    """Return a column as a list of str, using default for empty or missing cells"""
+    if column not in df.columns:
+        return [default] * len(df)
+    values = df[column]
+    return values.astype(str).where(values.notna(), default).tolist()
+
+
+def _integers(df, column, default):
+    """Return a column as a list of int, using default for empty or missing cells"""
+    if column not in df.columns:
+        return [default] * len(df)
+    values = pd.to_numeric(df[column]).fillna(default).astype("int64")
+    return values.tolist()
+
+
+def _yes_no(df, column, true_text="yes"):
+    """Return a column as a list of bool, True where the cell reads true_text (any case)"""
+    if column not in df.columns:
+        return [False] * len(df)
+    values = df[column]
+    return (values.astype(str).str.lower().eq(true_text) & values.notna()).tolist()
+
+
+def read_version(version_df, metadata):
+    """Update metadata from the first row of the Version sheet"""
+    if version_df.empty:
+        return
+    row = version_df.iloc[0]
+    if pd.notna(row.get('Version')):
+        metadata["version"] = str(row['Version'])
+    if pd.notna(row.get('Date')):
+        # Try to format the date properly
+        try:
+            metadata["date"] = pd.to_datetime(row['Date']).strftime('%Y-%m-%d')
+        except (ValueError, TypeError):
+            # If date parsing fails, keep default
+            pass
+    if pd.notna(row.get('Last Modified By')):
+        metadata["editor"] = str(row['Last Modified By'])
+    elif pd.notna(row.get('Editor')):  # Try alternative column name
+        metadata["editor"] = str(row['Editor'])
+    for desc_column in ['Description', 'description', 'DESCRIPTION', 'Desc', 'DESC']:
+        if desc_column in version_df.columns and pd.notna(row.get(desc_column)):
+            metadata["description"] = str(row[desc_column])
+
+
+def read_config(config_df, config_data):
+    """Update soc_type, build_type, their lists and core_info from the Config sheet"""
+    if config_df.empty:
+        return
+    if 'SOC Name' in config_df.columns:
+        soc_name = config_df.iloc[0]['SOC Name']
+        if pd.notna(soc_name):
+            config_data["soc_type"] = str(soc_name)
+            if str(soc_name) not in config_data["soc_list"]:
+                config_data["soc_list"].append(str(soc_name))
+    if 'TypeOfBin' in config_df.columns:
+        build_type = config_df.iloc[0]['TypeOfBin']
+        if pd.notna(build_type):
+            config_data["build_type"] = str(build_type)
+            if str(build_type) not in config_data["build_list"]:
+                config_data["build_list"].append(str(build_type))
+
+    if 'SOC' not in config_df.columns or 'CORE' not in config_df.columns:
+        config_data["core_info"] = {}
+        return
+
+    # The core table can be shorter than the sheet; skip rows without a core
+    cores_df = config_df[config_df['SOC'].notna() & config_df['CORE'].notna()]
+    columns = zip(
+        _text(cores_df, 'SOC', ""),
+        _text(cores_df, 'CORE', ""),
+        _text(cores_df, 'Description', ""),
+        _yes_no(cores_df, 'Master/Slave', "master"),
+        _yes_no(cores_df, 'Is Qnx Core ?'),
+        _yes_no(cores_df, 'Is Autosar Compliant ?'),
+        _yes_no(cores_df, 'Is Sim Core ?'),
+        _text(cores_df, 'OS', "Unknown"),
+        _text(cores_df, 'SOC Family', "Unknown"),
+    )
+    core_info = {}
+    for soc_name, core_name, description, is_master, is_qnx, is_autosar, is_sim, os_name, soc_family in columns:
+        core_info.setdefault(soc_name, {})[core_name] = {
+            "description": description,
+            "is_master": is_master,
+            "is_qnx": is_qnx,
+            "is_autosar": is_autosar,
+            "is_sim": is_sim,
+            "os": os_name,
+            "soc_family": soc_family
+        }
+        if soc_name not in config_data["soc_list"]:
+            config_data["soc_list"].append(soc_name)
+    config_data["core_info"] = core_info
+
+
+def read_signals(signals_df):
+    """Return {signal name: properties} from the LookUpTable sheet
+
+    Every column is converted as a whole (defaults, Yes/No to bool, integer
+    coercion); Python code only runs once per signal to assemble the dicts.
+    """
+    if signals_df.empty or 'Data_Type' not in signals_df.columns:
+        return {}
+    signals_df = signals_df[signals_df['Data_Type'].notna()]
+    names = signals_df['Data_Type'].astype(str)
+
+    if 'Variable_Port_Name' in signals_df.columns:
+        port_names = signals_df['Variable_Port_Name']
+        port_names = port_names.astype(str).where(port_names.notna(), names).tolist()
+    else:
+        port_names = names.tolist()
+
+    columns = {
+        "Variable_Port_Name": port_names,
+        "Memory Region": _text(signals_df, "Memory Region", SIGNAL_TEXT_COLUMNS["Memory Region"]),
+        "Type": _text(signals_df, "Type", SIGNAL_TEXT_COLUMNS["Type"]),
+        "InitValue": _text(signals_df, "InitValue", SIGNAL_TEXT_COLUMNS["InitValue"]),
+        "Notifiers": _yes_no(signals_df, "Notifiers"),
+        "Source": _text(signals_df, "Source", SIGNAL_TEXT_COLUMNS["Source"]),
+        "Impl_Approach": _text(signals_df, "Impl_Approach", SIGNAL_TEXT_COLUMNS["Impl_Approach"]),
+        "GetObjRef": _yes_no(signals_df, "GetObjRef"),
+    }
+    for column, default in SIGNAL_INT_COLUMNS.items():
+        columns[column] = _integers(signals_df, column, default)
+    for column in ("ASIL", "Checksum", "DataType", "description"):
+        columns[column] = _text(signals_df, column, SIGNAL_TEXT_COLUMNS[column])
+    columns["is_struct"] = repeat(False)  # Default to non-struct
+    columns["struct_fields"] = ({} for _ in range(len(port_names)))  # Empty struct fields
+
+    # Destination cores: the 'Soc.Core' column header becomes the core_Soc_Core key
+    for core_col in signals_df.columns:
+        if core_col not in STANDARD_SIGNAL_COLUMNS:
+            columns[f"core_{str(core_col).replace('.', '_')}"] = _yes_no(signals_df, core_col)
+
+    keys = tuple(columns)
+    return {name: dict(zip(keys, values)) for name, *values in zip(names.tolist(), *columns.values())}
+
+
+def read_excel_config(file_path):
+    """Read a project from an exported workbook
+
+    Returns the configuration dict, or None if the workbook holds no usable data.
+    A sheet that cannot be parsed is reported on stderr and skipped; nothing
+    is printed to stdout, as the command line tool uses this module.
+    """
+    sheets = read_sheets(file_path)
+
+    # Initialize config data with default metadata
+    config_data = {
+        "metadata": {
+            "version": "1.0",
+            "date": pd.Timestamp('today').strftime('%Y-%m-%d'),
+            "editor": "",
+            "description": "Imported from Excel"
+        },
+        "soc_type": "Windows",  # Default SOC
+        "build_type": "SMP",    # Default Build Type
+        "soc_list": ["Windows"],    # List containing only the current SOC
+        "build_list": ["SMP"],      # List containing only the current build type
+        "core_info": {},
+        "signals": {}
+    }
+
+    if 'Version' in sheets:
+        try:
+            read_version(sheets['Version'], config_data["metadata"])
+        except Exception as e:
+            print(f"Error parsing Version sheet: {str(e)}", file=sys.stderr)
+
+    if 'Config' in sheets:
+        try:
+            read_config(sheets['Config'], config_data)
+        except Exception as e:
+            print(f"Error parsing Config sheet: {str(e)}", file=sys.stderr)
+
+    if 'LookUpTable' in sheets:
+        try:
+            config_data["signals"] = read_signals(sheets['LookUpTable'])
+        except Exception as e:
+            print(f"Error parsing LookUpTable sheet: {str(e)}", file=sys.stderr)
+
+    # If we have at least some data, return the configuration
+    if not (config_data["soc_type"] or config_data["signals"]):
+        return None
+    if not config_data["metadata"].get("description"):
+        config_data["metadata"]["description"] = "Imported from Excel"
+    return config_data
@@ -1,16 +1,74 @@
 import os
 import json
 import pandas as pd
-import numpy as np
-import copy  # Make sure this import is at the top
 from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtWidgets import QMessageBox, QFileDialog
 from icecream import ic
 from datetime import datetime
+import threading
+
+from Modules.JsonStream import JsonStreamReader
+from Modules import BinaryFormat
+from Modules.ProjectWriter import IncrementalJsonWriter, atomic_write
+from Modules.SignalModel import Signal, signals_from_json
+from Modules import ExcelExport, ExcelImport
+from Modules.RefreshScheduler import TABLE, CORE_INFO, COUNT, TITLE
+
+# Files at least this large are loaded with the streaming loader
+STREAMING_THRESHOLD_BYTES = 1024 * 1024
+
+
+class StreamingLoadWorker(QtCore.QObject):
+    """Parse a configuration file in a worker thread and emit it piece by piece"""
+
+    section_loaded = QtCore.pyqtSignal(str, object)
+    signals_loaded = QtCore.pyqtSignal(list)
+    finished = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
+
+    # Maximum number of signal batches waiting for the GUI thread
+    MAX_PENDING_BATCHES = 4
+
+    def __init__(self, file_path, batch_size=500):
+        super(StreamingLoadWorker, self).__init__()
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self._pending = threading.Semaphore(self.MAX_PENDING_BATCHES)
+        self._cancelled = False
+
+    def run(self):
+        try:
+            reader = JsonStreamReader(self.file_path, batch_size=self.batch_size)
+            for event in reader.iter_events():
+                if self._cancelled:
+                    break
+                if event[0] == "signals":
+                    # Block until the GUI thread has consumed earlier batches
+                    self._pending.acquire()
+                    self.signals_loaded.emit([(name, Signal.from_dict(properties))
+                                              for name, properties in event[1]])
+                else:
+                    self.section_loaded.emit(event[1], event[2])
+            self.finished.emit()
+        except Exception as e:
+            print(f"Error in streaming loader: {e}")
+            self.failed.emit(str(e))
+
+    def batch_consumed(self):
+        """Called from the GUI thread once a signal batch has been displayed"""
+        self._pending.release()
+
+    def cancel(self):
+        self._cancelled = True
+        self._pending.release()
+
 
 class FileOperations:
     def __init__(self, app):
         self.app = app
+        self._streaming_load_active = False
+        # Caches encoded signals so saves only re-encode what changed
+        self.project_writer = IncrementalJsonWriter()
 
     def open_file(self, specified_file_path=None):
         """Open signal manager file and load data"""
@@ -24,12 +82,15 @@ class FileOperations:
                     self.app,
                     "Open Signal Manager File",
                     "",
-                    "Signal Manager Files (*.sgm *.json);;All Files (*)"
+                    "Signal Manager Files (*.sgm *.sgmb *.json);;All Files (*)"
                 )
 
             if not file_path:
                 return False  # User cancelled
 
+            if self.refuse_while_loading("Opening a file"):
+                return False
+
             print(f"Open file operation starting")
 
             # Disconnect UI signals to prevent crashes during loading
@@ -40,17 +101,29 @@ class FileOperations:
             except Exception as e:
                 print(f"Error disconnecting UI signals: {e}") """
 
-            # Make sure UI is responsive during file loading
-            QtWidgets.QApplication.processEvents()
-
-            # Load file content
-            with open(file_path, 'r') as f:
-                loaded_data = json.load(f)
+            # Load file content, streaming large files so the table fills progressively
+            rows_populated = False
+            if BinaryFormat.is_binary_file(file_path):
+                loaded_data = BinaryFormat.load(file_path)
+            elif os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES:
+                loaded_data = self._load_file_streaming(file_path)
+                if loaded_data is None:
+                    return False
+                rows_populated = True
+            else:
+                with open(file_path, 'r') as f:
+                    loaded_data = json.load(f)
 
             print("File loaded successfully")
 
+            # Keep signals in the compact Signal model instead of per-signal dicts
+            if loaded_data.get("signals") and not rows_populated:
+                loaded_data["signals"] = signals_from_json(loaded_data["signals"])
+
             # Update the app with loaded data
             self.app.signals_data = loaded_data
+            self.app.signal_ops.signals_replaced()
+            self.app.history.clear()
             self.app.modified = False
             self.app.current_file = file_path
 
@@ -61,24 +134,14 @@ class FileOperations:
             if "current_section" in metadata:
                 self.app.current_section = metadata["current_section"]
 
-            # Process events to keep UI responsive
-            QtWidgets.QApplication.processEvents()
-
             # Ensure SOC and Build type lists are populated
             self.app.ui_helpers.populate_soc_list()
             self.app.ui_helpers.populate_build_types()
 
-            # Process events again before refreshing tree
-            QtWidgets.QApplication.processEvents()
-
-            print("Refreshing signal tree")
-            self.app.ui_helpers.refresh_signal_tree()
-
-            # Process events before updating core info
-            QtWidgets.QApplication.processEvents()
-
-            print("Updating core info")
-            self.app.ui_helpers.update_core_info()
+            # The table, core info, count and title are refreshed together once the load returns
+            self.app.refresh.mark(CORE_INFO, COUNT, TITLE)
+            if not rows_populated:
+                self.app.refresh.mark(TABLE)
 
             # Initialize version fields from metadata without validation
             print("Initializing version fields")
@@ -111,48 +174,6 @@ class FileOperations:
                 elif hasattr(self.app.ui.VersionDescription, 'setText'):
                     self.app.ui.VersionDescription.setText(description)
 
-            # Update signal count and window title - this is a critical section
-            # that might cause the segfault
-            print("Updating signal count display")
-            try:
-                # Process events before attempting to update UI
-                QtWidgets.QApplication.processEvents()
-
-                # First ensure SignalCnt exists or is properly set up
-                # This is a defensive approach where we double-check that
-                # the signal count widget exists before accessing it
-                if not hasattr(self.app.ui, 'SignalCnt') or self.app.ui.SignalCnt is None:
-                    print("Initializing SignalCnt widget before updating")
-                    # Find the widget by name/type in the UI
-                    signal_cnt = self.app.findChild(QtWidgets.QSpinBox, "SignalCnt")
-                    if signal_cnt:
-                        print("Found SignalCnt widget via search")
-                        self.app.ui.SignalCnt = signal_cnt
-                    else:
-                        # If not found, try to create it
-                        self.app.ui_helpers._create_signal_count_widgets()
-
-                # Process events after widget setup
-                QtWidgets.QApplication.processEvents()
-
-                # Once we're sure widget exists, calculate and set the count
-                if hasattr(self.app.ui, 'SignalCnt') and self.app.ui.SignalCnt is not None:
-                    signal_count = len(self.app.signals_data.get("signals", {}))
-                    self.app.ui.SignalCnt.setValue(signal_count)
-                    print(f"Signal count updated to {signal_count}")
-                else:
-                    print("WARNING: SignalCnt widget not available after init attempt")
-
-                # Update window title separately from signal count
-                self.app.ui_helpers.update_window_title()
-            except Exception as e:
-                print(f"Error updating UI after file load: {e}")
-                import traceback
-                traceback.print_exc()
-
-            # Make sure UI is responsive during file loading complete
-            QtWidgets.QApplication.processEvents()
-
             # Reconnect UI signals
             try:
                 if hasattr(self.app.ui_helpers, '_reconnect_ui_signals'):
@@ -161,15 +182,12 @@ class FileOperations:
             except Exception as e:
                 print(f"Error reconnecting UI signals: {e}")
 
-            # Final processEvents to ensure UI is updated
-            QtWidgets.QApplication.processEvents()
-
             # Only show success message if file was opened via dialog
             if specified_file_path is None:
                 QMessageBox.information(self.app, "Success", f"File loaded: {file_path}")
 
             self.app.modified = False
-            self.app.ui_helpers.update_window_title()
+            self.app.refresh.mark(TITLE)
             return True
 
         except json.JSONDecodeError as e:
@@ -199,8 +217,118 @@ class FileOperations:
                 pass
             return False
 
+    def refuse_while_loading(self, action):
+        """Return True, telling the user, while a streaming load is running
+
+        The document is only partly loaded then; saving it or editing it
+        would lose data.
+        """
+        if not self._streaming_load_active:
+            return False
+        print(f"{action} refused: a file is still loading")
+        QMessageBox.information(self.app, "File Loading",
+                                f"{action} is not possible while a file is loading.")
+        return True
+
+    def _load_file_streaming(self, file_path):
+        """Load a large file in a worker thread, appending signal rows as they arrive
+
+        A window-modal progress dialog blocks the menus and editing for the
+        whole load; its Cancel button abandons the load.
+
+        Returns the loaded data, or None if another streaming load is running
+        or the load was cancelled. Raises json.JSONDecodeError if the file
+        could not be parsed.
+        """
+        if self._streaming_load_active:
+            print("Streaming load already in progress, ignoring request")
+            return None
+
+        print(f"Streaming load of {file_path}")
+        previous_data = self.app.signals_data
+        loaded_data = {}
+        errors = []
+
+        # Pending refreshes must not run against the partial document in the nested event loop
+        self.app.refresh.flush()
+
+        # Expose the partially loaded document so row selection works during the load
+        self.app.signals_data = loaded_data
+        self.app.ui_helpers.refresh_signal_tree()
+
+        thread = QtCore.QThread()
+        worker = StreamingLoadWorker(file_path)
+        worker.moveToThread(thread)
+        loop = QtCore.QEventLoop()
+        cancelled = []
+
+        progress = QtWidgets.QProgressDialog(f"Loading {os.path.basename(file_path)}...", "Cancel",
+                                             0, 0, self.app)
+        progress.setWindowTitle("Opening File")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        def on_section(key, value):
+            loaded_data[key] = value
+
+        def on_signals(batch):
+            signals = loaded_data.setdefault("signals", {})
+            signals.update(batch)
+            self.app.ui_helpers.append_signal_rows(batch)
+            progress.setLabelText(f"Loading {os.path.basename(file_path)}: {len(signals)} signals")
+            worker.batch_consumed()
+
+        def on_cancel():
+            cancelled.append(True)
+            loop.quit()
+
+        def on_failed(message):
+            errors.append(message)
+            loop.quit()
+
+        worker.section_loaded.connect(on_section)
+        worker.signals_loaded.connect(on_signals)
+        worker.finished.connect(loop.quit)
+        worker.failed.connect(on_failed)
+        thread.started.connect(worker.run)
+        progress.canceled.connect(on_cancel)
+
+        self._streaming_load_active = True
+        try:
+            progress.show()
+            thread.start()
+            # Keep the event loop running so rows are painted while the worker parses
+            loop.exec_()
+        finally:
+            worker.cancel()
+            thread.quit()
+            thread.wait()
+            # Closing the dialog emits canceled as well
+            progress.canceled.disconnect(on_cancel)
+            progress.close()
+            self._streaming_load_active = False
+
+        if cancelled:
+            print("Streaming load cancelled")
+            self.app.signals_data = previous_data
+            self.app.ui_helpers.refresh_signal_tree()
+            return None
+
+        if errors:
+            self.app.signals_data = previous_data
+            self.app.ui_helpers.refresh_signal_tree()
+            raise json.JSONDecodeError(errors[0], "", 0)
+
+        print(f"Streamed {len(loaded_data.get('signals', {}))} signals")
+        return loaded_data
+
     def save_file(self):
         """Save file with version check"""
+        if self.refuse_while_loading("Saving"):
+            return
+
         # Check version information before saving
         if not self.app.ui_helpers.check_version_for_export():
             return
@@ -239,16 +367,21 @@ class FileOperations:
             self.save_file_as()
         else:
             try:
-                with open(self.app.current_file, 'w') as file:
-                    json.dump(self.app.signals_data, file, indent=4)
+                # Both formats are written to a temporary file and renamed into place
+                if BinaryFormat.is_binary_file(self.app.current_file):
+                    atomic_write(self.app.current_file, BinaryFormat.dumps(self.app.signals_data))
+                    self.project_writer.reset()
+                    self.app.change_tracker.clear()
+                else:
+                    self.project_writer.save(self.app.signals_data, self.app.current_file,
+                                             self.app.change_tracker)
                 self.app.modified = False
 
                 # After saving, the file is no longer using default values
                 self.app.ui_helpers.using_default_values = False
 
-                # Store a copy of the saved state as the original for future comparisons
-                import copy
-                self.app.ui_helpers.original_signals_data = copy.deepcopy(self.app.signals_data)
+                # Remember the saved metadata for future comparisons
+                self.app.ui_helpers.snapshot_saved_state()
 
                 self.app.ui_helpers.update_window_title()
                 QMessageBox.information(self.app, "Success", f"File saved: {self.app.current_file}")
@@ -266,6 +399,9 @@ class FileOperations:
 
     def save_file_as(self):
         """Save file as with version check"""
+        if self.refuse_while_loading("Saving"):
+            return
+
         # Check version information before saving
         if not self.app.ui_helpers.check_version_for_export():
             return
@@ -274,12 +410,15 @@ class FileOperations:
         self.app.ui_helpers.update_version_info(skip_validation=True)
 
         file_path, _ = QFileDialog.getSaveFileName(self.app, "Save Signal Configuration", "",
-                                                  "JSON Files (*.json);;All Files (*)")
+                                                  "JSON Files (*.json);;Signal Manager Binary Files (*.sgmb);;All Files (*)")
         if file_path:
             self.app.current_file = file_path
             self.save_file()
 
     def create_new_file(self):
+        if self.refuse_while_loading("Creating a file"):
+            return
+
         if self.app.ui_helpers.check_unsaved_changes():
             # Clear current file path
             self.app.current_file = None
@@ -299,6 +438,8 @@ class FileOperations:
                 "core_info": {},
                 "signals": {}
             }
+            self.app.signal_ops.signals_replaced()
+            self.app.history.clear()
 
             # For create_new_file, we don't want to use default values automatically
             # Instead, let the user provide their own values
@@ -310,22 +451,23 @@ class FileOperations:
 
             # Update UI elements
             self.app.ui_helpers.initialize_version_fields()
-            self.app.ui_helpers.refresh_signal_tree()
-            self.app.ui_helpers.update_signal_count_display()
-            self.app.ui_helpers.update_window_title()
+            self.app.refresh.mark(TABLE, CORE_INFO, COUNT, TITLE)
 
             # Open configuration manager to set up the new file
             self.app.signal_ops.open_configuration_manager(is_new_file=True)
 
     def export_to_excel(self, excel_path=None):
         """Export to Excel with version check"""
+        if self.refuse_while_loading("Exporting"):
+            return False
+
         # Check version information before exporting
         if not self.app.ui_helpers.check_version_for_export():
-            return
+            return False
 
         if not self.app.signals_data:
             QMessageBox.warning(self.app, "Warning", "No configuration data to export")
-            return
+            return False
 
         # Get editor name from EditorName or VersionUpdateName
         editor_name = ""
@@ -344,7 +486,7 @@ class FileOperations:
                 QMessageBox.warning(self.app, "Required Field Missing",
                                    "Export stopped. Please enter your name in the name field and try again.")
                 QtCore.QTimer.singleShot(3000, lambda: field.setStyleSheet(""))
-                return
+                return False
 
         if excel_path is not None or excel_path == "":
             # Export to the specified path
@@ -354,30 +496,20 @@ class FileOperations:
                                                      "Excel Files (*.xlsx *.xls)")
         if file_path:
             try:
+                # Large projects are written in constant memory mode, row by row
+                signal_count = len(self.app.signals_data.get("signals") or {})
+                options = ExcelExport.workbook_options(signal_count)
+
                 # Create Excel writer with xlsxwriter
-                with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+                with pd.ExcelWriter(file_path, engine='xlsxwriter', engine_kwargs={'options': options}) as writer:
                     # Get workbook and create formats
                     workbook = writer.book
-
-                    # Create formatting options
-                    center_format = workbook.add_format({'align': 'center', 'valign': 'vcenter', 'border': 1})
-                    header_format = workbook.add_format({
-                        'align': 'center',
-                        'valign': 'vcenter',
-                        'bg_color': '#c6efce',  # Light green color for headers
-                        'bold': True,
-                        'border': 1  # Add border to all cells
-                    })
-                    data_format = workbook.add_format({
-                        'align': 'center',
-                        'valign': 'vcenter',
-                        'bg_color': '#c0c0c0',   # Darker gray color
-                        'border': 1  # Add border to all cells
-                    })
+                    header_format = workbook.add_format(ExcelExport.HEADER_FORMAT)
+                    data_format = workbook.add_format(ExcelExport.DATA_FORMAT)
 
                     # Export Version data to Version sheet
                     if not self.export_version_data(writer, 'Version', header_format, data_format):
-                        return  # Exit if version data export fails (missing fields)
+                        return False  # Exit if version data export fails (missing fields)
 
                     # Export configuration data to Config sheet
                     self.export_config_data(writer, 'Config', header_format, data_format)
@@ -387,10 +519,12 @@ class FileOperations:
                         self.export_signals_data(writer, 'LookUpTable', header_format, data_format)
 
                 QMessageBox.information(self.app, "Success", f"Exported to Excel: {file_path}")
+                return True
             except Exception as e:
                 QMessageBox.critical(self.app, "Error", f"Failed to export to Excel: {str(e)}")
                 import traceback
                 traceback.print_exc()  # Print detailed error for debugging
+        return False
 
     def export_version_data(self, writer, sheet_name, header_format=None, data_format=None):
         """Export version metadata to Excel"""
@@ -464,42 +598,12 @@ class FileOperations:
         editor = metadata.get("editor", "")
         description = metadata.get("description", "")
 
-        # Create DataFrame with version information
-        version_data = pd.DataFrame({
-            'Version': [version],
-            'Date': [date],
-            'Last Modified By': [editor],
-            'Description': [description]
-        })
-
-        # Don't write with pandas and then overwrite - use one approach
-        # Create the worksheet
+        # Create the worksheet and write the version information
         worksheet = writer.book.add_worksheet(sheet_name)
         writer.sheets[sheet_name] = worksheet
-
-        # Apply formatting if formats are provided
-        if header_format and data_format:
-            # Auto-fit column widths based on content
-            for i, col in enumerate(version_data.columns):
-                # Find the maximum length in the column (including header)
-                max_len = max(
-                    len(str(col)),
-                    version_data[col].astype(str).map(len).max()
-                )
-                # Set column width (add a little padding)
-                worksheet.set_column(i, i, max_len + 2)
-
-            # Apply header formatting
-            for col_num, col_name in enumerate(version_data.columns):
-                worksheet.write(0, col_num, col_name, header_format)
-
-            # Apply data formatting to all data cells
-            for row_num in range(1, len(version_data) + 1):
-                for col_num in range(len(version_data.columns)):
-                    worksheet.write(row_num, col_num, version_data.iloc[row_num-1, col_num], data_format)
-        else:
-            # If no formatting provided, just use pandas
-            version_data.to_excel(writer, sheet_name=sheet_name, index=False)
+        ExcelExport.write_table(worksheet, ExcelExport.VERSION_HEADER,
+                                [[version, date, editor, description]],
+                                header_format, data_format)
 
         if self.app.current_file is not None:
             # Update Window State
@@ -510,58 +614,21 @@ class FileOperations:
 
     def export_config_data(self, writer, sheet_name, header_format=None, data_format=None):
         """Export configuration data to Excel sheet"""
-        # Create a DataFrame with SOC and Build Type information
-        soc_build_data = {
-            'SOC Name': [self.app.signals_data.get('soc_type', '')],
-            'TypeOfBin': [self.app.signals_data.get('build_type', '')]
-        }
-        soc_build_df = pd.DataFrame(soc_build_data)
-
-        # Create a DataFrame with Core information
-        core_info = self.app.signals_data.get("core_info", {})
-        core_data = []
-
-        if core_info:
-            for soc_name, cores in core_info.items():
-                for core_name, core_data_entry in cores.items():
-                    # Check if it's a dictionary (updated format) or string (legacy format)
-                    if isinstance(core_data_entry, dict):
-                        # Extract core properties correctly from the dictionary
-                        core_data.append({
-                            'SOC': soc_name,
-                            'CORE': core_name,
-                            'Master/Slave': 'Master' if core_data_entry.get('is_master', False) else 'Slave',
-                            'Is Qnx Core ?': 'Yes' if core_data_entry.get('is_qnx', False) else 'No',
-                            'Is Autosar Compliant ?': 'Yes' if core_data_entry.get('is_autosar', False) else 'No',
-                            'Is Sim Core ?': 'Yes' if core_data_entry.get('is_sim', False) else 'No',
-                            'OS': core_data_entry.get('os', 'Unknown'),
-                            'SOC Family': core_data_entry.get('soc_family', 'Unknown')
-                        })
-                    else:
-                        # Legacy format with just a description string
-                        # Update in-memory representation for future operations
-                        legacy_props = {
-                            "description": str(core_data_entry),
-                            "is_master": False,
-                            "is_qnx": False,
-                            "is_autosar": False,
-                            "is_sim": False,
-                            "os": "Unknown",
-                            "soc_family": "Unknown"
-                        }
-                        self.app.signals_data["core_info"][soc_name][core_name] = legacy_props
-
-                        # Add to core_data for export
-                        core_data.append({
-                            'SOC': soc_name,
-                            'CORE': core_name,
-                            'Master/Slave': 'Slave',  # Default value
-                            'Is Qnx Core ?': 'No',
-                            'Is Autosar Compliant ?': 'No',
-                            'Is Sim Core ?': 'No',
-                            'OS': 'Unknown',
-                            'SOC Family': 'Unknown'
-                        })
+        # Convert cores in the legacy format (just a description string) so
+        # they are exported, and kept from now on, with default properties
+        for soc_name, cores in self.app.signals_data.get("core_info", {}).items():
+            for core_name, core_data_entry in cores.items():
+                if not isinstance(core_data_entry, dict):
+                    cores[core_name] = {
+                        "description": str(core_data_entry),
+                        "is_master": False,
+                        "is_qnx": False,
+                        "is_autosar": False,
+                        "is_sim": False,
+                        "os": "Unknown",
+                        "soc_family": "Unknown"
+                    }
+                    self.app.change_tracker.mark_soc(soc_name)
 
         # Create the worksheet before accessing it
         worksheet = writer.book.add_worksheet(sheet_name)
@@ -569,73 +636,13 @@ class FileOperations:
 
         # Create formatting if not provided
         if data_format is None:
-            data_format = writer.book.add_format({
-                'align': 'center',
-                'valign': 'vcenter',
-                'bg_color': '#c0c0c0',  # Darker gray background for data cells
-                'border': 1  # Add border for all cells
-            })
-
+            data_format = writer.book.add_format(ExcelExport.DATA_FORMAT)
         if header_format is None:
-            header_format = writer.book.add_format({
-                'align': 'center',
-                'valign': 'vcenter',
-                'bg_color': '#c6efce',  # Light green for headers
-                'bold': True,
-                'border': 1  # Add border for all cells
-            })
-
-        # Write SOC and Build Type to Excel
-        soc_build_df.to_excel(writer, sheet_name=sheet_name, startrow=0, startcol=0, index=False)
-
-        # Apply formatting to SOC and Build Type
-        # Auto-fit column widths for SOC and Build Type
-        for i, col in enumerate(soc_build_df.columns):
-            max_len = max(
-                len(str(col)),
-                soc_build_df[col].astype(str).map(len).max()
-            )
-            worksheet.set_column(i, i, max_len + 2)
-
-        # Apply header formatting for SOC and Build Type
-        for col_num, col_name in enumerate(soc_build_df.columns):
-            worksheet.write(0, col_num, col_name, header_format)
-
-        # Apply data formatting for SOC and Build Type - explicitly format each cell
-        for row_num in range(1, len(soc_build_df) + 1):
-            for col_num in range(len(soc_build_df.columns)):
-                cell_value = soc_build_df.iloc[row_num-1, col_num]
-                # Ensure empty cells still get formatting
-                if pd.isna(cell_value):
-                    cell_value = ""
-                worksheet.write(row_num, col_num, cell_value, data_format)
-
-        # Write Core data if available
-        if core_data:
-            cores_df = pd.DataFrame(core_data)
-            cores_df.to_excel(writer, sheet_name=sheet_name, startrow=0, startcol=4, index=False)
-
-            # Apply formatting to Core data
-            # Auto-fit column widths for core data
-            for i, col in enumerate(cores_df.columns):
-                max_len = max(
-                    len(str(col)),
-                    cores_df[col].astype(str).map(len).max()
-                )
-                worksheet.set_column(i+4, i+4, max_len + 2)
-
-            # Apply header formatting for core data
-            for col_num, col_name in enumerate(cores_df.columns):
-                worksheet.write(0, col_num+4, col_name, header_format)
+            header_format = writer.book.add_format(ExcelExport.HEADER_FORMAT)
 
-            # Apply data formatting for core data - explicitly format each cell
-            for row_num in range(1, len(cores_df) + 1):
-                for col_num in range(len(cores_df.columns)):
-                    cell_value = cores_df.iloc[row_num-1, col_num]
-                    # Ensure empty cells still get formatting
-                    if pd.isna(cell_value):
-                        cell_value = ""
-                    worksheet.write(row_num, col_num+4, cell_value, data_format)
+        # SOC/Build Type in columns A-B, core data from column E
+        ExcelExport.write_tables(worksheet, ExcelExport.config_tables(self.app.signals_data),
+                                 header_format, data_format)
 
     def export_signals_data(self, writer, sheet_name, header_format=None, data_format=None):
         """Export signal data to Excel sheet"""
@@ -644,94 +651,23 @@ class FileOperations:
         if not signals:
             return
 
-        # Get the list of all configured cores
+        # Rows are generated and written one at a time, see ExcelExport.signal_rows
         available_cores = self.app.ui_helpers.get_available_cores()
 
-        # Prepare data for DataFrame
-        signal_rows = []
-
-        for signal_name, signal_info in signals.items():
-            # Create base row without description first
-            row = {
-                'Data_Type': signal_name,
-                'Variable_Port_Name': signal_info.get('Variable_Port_Name', ''),
-                'Memory Region': signal_info.get('Memory Region', ''),
-                'Buffer count_IPC': signal_info.get('Buffer count_IPC', ''),
-                'Type': signal_info.get('Type', ''),
-                'InitValue': signal_info.get('InitValue', ''),
-                'Notifiers': 'Yes' if signal_info.get('Notifiers', False) else 'No',
-                'Source': signal_info.get('Source', ''),
-                'Impl_Approach': signal_info.get('Impl_Approach', ''),
-                'GetObjRef': 'Yes' if signal_info.get('GetObjRef', False) else 'No',
-                'SM_Buff_Count': signal_info.get('SM_Buff_Count', ''),
-                'Timeout': signal_info.get('Timeout', ''),
-                'Periodicity': signal_info.get('Periodicity', ''),
-                'ASIL': signal_info.get('ASIL', ''),
-                'Checksum': signal_info.get('Checksum', '') if signal_info.get('Checksum') else 'None',
-                'DataType': signal_info.get('DataType', 'INT32'),
-            }
-
-            # Add core destinations before description
-            for core in available_cores:
-                core_key = f"core_{core.replace('.', '_')}"
-                row[core] = 'Yes' if signal_info.get(core_key, False) else 'No'
-
-            # Add description at the end
-            row['description'] = signal_info.get('description', '')
-
-            signal_rows.append(row)
-
-        if signal_rows:
-            # Create DataFrame and write to Excel
-            signals_df = pd.DataFrame(signal_rows)
-            signals_df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-            # Apply formatting if formats are provided
-            if header_format and data_format:
-                worksheet = writer.sheets[sheet_name]
-
-                # Auto-fit column widths
-                for i, col in enumerate(signals_df.columns):
-                    # Find the maximum length in the column (including header)
-                    max_len = max(
-                        len(str(col)),
-                        signals_df[col].astype(str).map(len).max()
-                    )
-                    # Set column width (add a little padding)
-                    worksheet.set_column(i, i, max_len + 2)
-
-                # Write 'Index' header first, then the other headers (shifted right by 1)
-                worksheet.write(0, 0, 'Index', header_format)
-                for col_num, col_name in enumerate(signals_df.columns):
-                    worksheet.write(0, col_num + 1, col_name, header_format)
-
-                # Calculate max lengths for each column including the index column
-                col_widths = [len('Index')]  # For index column
-                for col in signals_df.columns:
-                    # Find max length between column name and data
-                    max_len = max(
-                        len(str(col)),
-                        signals_df[col].astype(str).map(len).max()
-                    )
-                    col_widths.append(max_len)
-
-                # Set column widths (adding padding)
-                for col_num, width in enumerate(col_widths):
-                    worksheet.set_column(col_num, col_num, width + 2)
-
-                # Write row number as index, then the data (shifted right by 1)
-                for row_num in range(1, len(signals_df) + 1):
-                    # Write the row number in column 0 as 'Index'
-                    worksheet.write(row_num, 0, row_num, data_format)
-                    # Write the actual data shifted right by 1
-                    for col_num in range(len(signals_df.columns)):
-                        worksheet.write(row_num, col_num + 1, signals_df.iloc[row_num-1, col_num], data_format)
+        worksheet = writer.book.add_worksheet(sheet_name)
+        writer.sheets[sheet_name] = worksheet
+        ExcelExport.write_table(worksheet, ExcelExport.signal_header(available_cores),
+                                ExcelExport.signal_rows(signals, available_cores),
+                                header_format, data_format)
 
-                # Freeze the first three columns (Index, Data_Type, Variable_Port_Name)
-                worksheet.freeze_panes(1, 3)
+        # Freeze the first three columns (Index, Data_Type, Variable_Port_Name)
+        worksheet.freeze_panes(1, 3)
 
     def import_from_excel(self):
         """Import signal data from an Excel file"""
+        if self.refuse_while_loading("Importing"):
+            return False
+
         # Only prompt to save if:
         # 1. Modified flag is True AND
         # 2. There's a current file OR actual signal data
@@ -801,8 +737,7 @@ class FileOperations:
 
                     # Per user requirement: mark as NOT modified after import
                     # Store the current state as the baseline to prevent detecting changes
-                    import copy
-                    self.app.ui_helpers.original_signals_data = copy.deepcopy(self.app.signals_data)
+                    self.app.ui_helpers.snapshot_saved_state()
 
                     # Set to unmodified state (no changes)
                     self.app.modified = False
@@ -843,192 +778,8 @@ class FileOperations:
     def read_excel_config(self, file_path):
         """Read configuration from Excel file"""
         try:
-            # Get all sheet names
-            xl = pd.ExcelFile(file_path)
-            sheet_names = xl.sheet_names
-
-            # Initialize config data with default metadata
-            current_date = pd.Timestamp('today').strftime('%Y-%m-%d')
-            config_data = {
-                "metadata": {
-                    "version": "1.0",
-                    "date": current_date,
-                    "editor": "",
-                    "description": "Imported from Excel"
-                },
-                "soc_type": "Windows",  # Default SOC
-                "build_type": "SMP",    # Default Build Type
-                "soc_list": ["Windows"],    # List containing only the current SOC
-                "build_list": ["SMP"],      # List containing only the current build type
-                "core_info": {},
-                "signals": {}
-            }
-
-            # Try to read Version sheet first
-            if 'Version' in sheet_names:
-                try:
-                    version_df = pd.read_excel(file_path, sheet_name='Version')
-                    if not version_df.empty:
-                        # Extract version data from first row
-                        row = version_df.iloc[0]
-                        if pd.notna(row.get('Version')):
-                            config_data["metadata"]["version"] = str(row['Version'])
-                        if pd.notna(row.get('Date')):
-                            # Try to format the date properly
-                            try:
-                                date_value = pd.to_datetime(row['Date'])
-                                config_data["metadata"]["date"] = date_value.strftime('%Y-%m-%d')
-                            except:
-                                # If date parsing fails, keep default
-                                pass
-                        if pd.notna(row.get('Last Modified By')):
-                            config_data["metadata"]["editor"] = str(row['Last Modified By'])
-                        elif pd.notna(row.get('Editor')):  # Try alternative column name
-                            config_data["metadata"]["editor"] = str(row['Editor'])
-                        # Ensure Description is captured and preserved
-                        for desc_column in ['Description', 'description', 'DESCRIPTION', 'Desc', 'DESC']:
-                            if desc_column in version_df.columns and pd.notna(row.get(desc_column)):
-                                config_data["metadata"]["description"] = str(row[desc_column])
-                                print(f"Found description in column '{desc_column}': {config_data['metadata']['description']}")  # Debug print to help troubleshoot
-                        print(f"Imported metadata: {config_data['metadata']}")  # Debug print
-                except Exception as e:
-                    print(f"Error parsing Version sheet: {str(e)}")
-
-            # Check if Config sheet exists
-            if 'Config' in sheet_names:
-                try:
-                    config_df = pd.read_excel(file_path, sheet_name='Config')
-                    if not config_df.empty:
-                        if 'SOC Name' in config_df.columns:
-                            soc_name = config_df.iloc[0]['SOC Name']
-                            if pd.notna(soc_name):
-                                config_data["soc_type"] = str(soc_name)
-                                if str(soc_name) not in config_data["soc_list"]:
-                                    config_data["soc_list"].append(str(soc_name))
-                        if 'TypeOfBin' in config_df.columns:
-                            build_type = config_df.iloc[0]['TypeOfBin']
-                            if pd.notna(build_type):
-                                config_data["build_type"] = str(build_type)
-                                if str(build_type) not in config_data["build_list"]:
-                                    config_data["build_list"].append(str(build_type))
-
-                        # Check if core columns exist
-                        core_cols = ['SOC', 'CORE']
-                        if all(col in config_df.columns for col in core_cols):
-                            # Initialize core_info structure
-                            core_info = {}
-                            for _, row in config_df.iterrows():
-                                soc_name = str(row['SOC'])
-                                core_name = str(row['CORE'])
-
-                                # Initialize SOC in core_info if not exists
-                                if soc_name not in core_info:
-                                    core_info[soc_name] = {}
-
-                                # Convert NaN to appropriate values for boolean fields
-                                is_master = str(row.get('Master/Slave', '')).lower() == "master" if pd.notna(row.get('Master/Slave', '')) else False
-                                is_qnx = str(row.get('Is Qnx Core ?', '')).lower() == "yes" if pd.notna(row.get('Is Qnx Core ?', '')) else False
-                                is_autosar = str(row.get('Is Autosar Compliant ?', '')).lower() == "yes" if pd.notna(row.get('Is Autosar Compliant ?', '')) else False
-                                is_sim = str(row.get('Is Sim Core ?', '')).lower() == "yes" if pd.notna(row.get('Is Sim Core ?', '')) else False
-
-                                # Create core properties
-                                core_props = {
-                                    "description": str(row.get('Description', "")) if pd.notna(row.get('Description', '')) else "",
-                                    "is_master": is_master,
-                                    "is_qnx": is_qnx,
-                                    "is_autosar": is_autosar,
-                                    "is_sim": is_sim,
-                                    "os": str(row.get('OS', "Unknown")) if pd.notna(row.get('OS', '')) else "Unknown",
-                                    "soc_family": str(row.get('SOC Family', "Unknown")) if pd.notna(row.get('SOC Family', '')) else "Unknown"
-                                }
-
-                                # Add core to SOC
-                                core_info[soc_name][core_name] = core_props
-
-                                # Make sure SOC is in soc_list
-                                if soc_name not in config_data["soc_list"]:
-                                    config_data["soc_list"].append(soc_name)
-
-                        # Add core_info to config_data
-                        config_data["core_info"] = core_info
-                except Exception as e:
-                    print(f"Error parsing Config sheet: {str(e)}")
-
-            # Check if LookUpTable sheet exists
-            if 'LookUpTable' in sheet_names:
-                try:
-                    signals_df = pd.read_excel(file_path, sheet_name='LookUpTable')
-                    if not signals_df.empty and 'Data_Type' in signals_df.columns:
-                        signals = {}
-
-                        # Get all the potential core columns
-                        standard_fields = {
-                            'Data_Type', 'Variable_Port_Name', 'Memory Region',
-                            'Buffer count_IPC', 'Type', 'InitValue', 'Notifiers',
-                            'Source', 'Impl_Approach', 'GetObjRef', 'SM_Buff_Count',
-                            'Timeout', 'Periodicity', 'ASIL', 'Checksum', 'DataType', 'description'
-                        }
-                        potential_core_cols = [col for col in signals_df.columns if col not in standard_fields]
-
-                        for _, row in signals_df.iterrows():
-                            if pd.isna(row.get('Data_Type', np.nan)):
-                                continue
-
-                            signal_name = str(row['Data_Type'])
-                            # Handle boolean fields correctly by checking if the value is Yes/No
-                            notifiers = str(row.get('Notifiers', 'No')).lower() == "yes" if pd.notna(row.get('Notifiers', '')) else False
-                            get_obj_ref = str(row.get('GetObjRef', 'No')).lower() == "yes" if pd.notna(row.get('GetObjRef', '')) else False
-                            buffer_count = int(row.get('Buffer count_IPC', 1)) if pd.notna(row.get('Buffer count_IPC', '')) else 1
-                            sm_buff_count = int(row.get('SM_Buff_Count', 1)) if pd.notna(row.get('SM_Buff_Count', '')) else 1
-                            timeout = int(row.get('Timeout', 10)) if pd.notna(row.get('Timeout', '')) else 10
-                            periodicity = int(row.get('Periodicity', 10)) if pd.notna(row.get('Periodicity', '')) else 10
-
-                            # Create signal properties dictionary with proper default values
-                            signal_props = {
-                                "Variable_Port_Name": str(row.get('Variable_Port_Name', signal_name)) if pd.notna(row.get('Variable_Port_Name', '')) else signal_name,
-                                "Memory Region": str(row.get('Memory Region', "DDR")) if pd.notna(row.get('Memory Region', '')) else "DDR",
-                                "Type": str(row.get('Type', "Concurrent")) if pd.notna(row.get('Type', '')) else "Concurrent",
-                                "InitValue": str(row.get('InitValue', "ZeroMemory")) if pd.notna(row.get('InitValue', '')) else "ZeroMemory",
-                                "Notifiers": notifiers,
-                                "Source": str(row.get('Source', "")) if pd.notna(row.get('Source', '')) else "",
-                                "Impl_Approach": str(row.get('Impl_Approach', "SharedMemory")) if pd.notna(row.get('Impl_Approach', '')) else "SharedMemory",
-                                "GetObjRef": get_obj_ref,
-                                "Buffer count_IPC": buffer_count,
-                                "SM_Buff_Count": sm_buff_count,
-                                "Timeout": timeout,
-                                "Periodicity": periodicity,
-                                "ASIL": str(row.get('ASIL', "QM")) if pd.notna(row.get('ASIL', '')) else "QM",
-                                "Checksum": str(row.get('Checksum', "None")) if pd.notna(row.get('Checksum', '')) else "None",
-                                "DataType": str(row.get('DataType', "INT32")) if pd.notna(row.get('DataType', '')) else "INT32",
-                                "description": str(row.get('description', "Imported signal")) if pd.notna(row.get('description', '')) else "Imported signal",
-                                "is_struct": False,  # Default to non-struct
-                                "struct_fields": {}  # Empty struct fields
-                            }
-
-                            # Process potential core destinations
-                            for core_col in potential_core_cols:
-                                # If column value is "Yes", mark it as a destination
-                                core_key = f"core_{core_col.replace('.', '_')}"
-                                signal_props[core_key] = str(row.get(core_col, "No")).lower() == "yes" if pd.notna(row.get(core_col, '')) else False
-
-                            # Add signal to signals dictionary
-                            signals[signal_name] = signal_props
-
-                        # Add signals to config_data
-                        config_data["signals"] = signals
-                except Exception as e:
-                    print(f"Error parsing LookUpTable sheet: {str(e)}")
-
-            # If we have at least some data, return the configuration
-            if config_data["soc_type"] or config_data["signals"]:
-                final_config = copy.deepcopy(config_data)
-
-                # Double check description is present
-                if "description" not in final_config["metadata"] or not final_config["metadata"]["description"]:
-                    final_config["metadata"]["description"] = "Imported from Excel"
-                return final_config
-            else:
-                return None
+            # All sheets are parsed from a single open of the workbook
+            return ExcelImport.read_excel_config(file_path)
         except Exception as e:
             print(f"Error reading Excel file: {str(e)}")
             import traceback
@@ -1045,7 +796,10 @@ class FileOperations:
                 # Find the SignalAttributeSection scroll area
                 attr_scroll = details_frame.findChild(QtWidgets.QScrollArea, "SignalAttributeSection")
 
-                if attr_scroll:
+                if attr_scroll and hasattr(attr_scroll.widget(), "bind"):
+                    # The persistent SignalAttributePanel is installed; just empty it
+                    attr_scroll.widget().clear()
+                elif attr_scroll:
                     # Create an empty widget to replace the current content
                     empty_widget = QtWidgets.QWidget()
                     empty_layout = QtWidgets.QVBoxLayout(empty_widget)
@@ -1066,6 +820,9 @@ class FileOperations:
 
     def close_file(self):
         """Close the current file and reset the UI state"""
+        if self.refuse_while_loading("Closing the file"):
+            return False
+
         if self.app.modified:
             reply = QMessageBox.question(
                 self.app,
@@ -1126,8 +883,9 @@ class FileOperations:
             print("Reset signals data to empty state")
 
             # Store the clean state as the original state to avoid marking as modified
-            import copy
-            self.app.ui_helpers.original_signals_data = copy.deepcopy(self.app.signals_data)
+            self.app.signal_ops.signals_replaced()
+            self.app.history.clear()
+            self.app.ui_helpers.snapshot_saved_state()
 
             # Set the flags to use default values
             self.app.ui_helpers.using_default_values = True
@@ -1166,29 +924,8 @@ class FileOperations:
             # Process events after version field update
             QtWidgets.QApplication.processEvents()
 
-            # 3. Clear the signal tree
-            if hasattr(self.app.ui_helpers, 'refresh_signal_tree'):
-                self.app.ui_helpers.refresh_signal_tree()
-                print("Refreshed signal tree")
-
-            # Process events after refreshing tree
-            QtWidgets.QApplication.processEvents()
-
-            # 4. Update signal count display
-            if hasattr(self.app.ui_helpers, 'update_signal_count_display'):
-                self.app.ui_helpers.update_signal_count_display()
-                print("Updated signal count")
-
-            # Process events after updating signal count
-            QtWidgets.QApplication.processEvents()
-
-            # 5. Clear core info display
-            if hasattr(self.app.ui_helpers, 'update_core_info'):
-                self.app.ui_helpers.update_core_info()
-                print("Cleared core info display")
-
-            # Process events after updating core info
-            QtWidgets.QApplication.processEvents()
+            # 3.-5. Clear the signal table, signal count and core info display
+            self.app.refresh.mark(TABLE, COUNT, CORE_INFO)
 
             # 6. Clear signal attribute section
             if hasattr(self.app.ui_helpers, 'clear_signal_attribute_section'):
@@ -1214,18 +951,9 @@ class FileOperations:
             if hasattr(self.app.ui, 'VersionDescription'):
                 self.app.ui.VersionDescription.setPlainText("")
 
-            # Process events after final field clearing
-            QtWidgets.QApplication.processEvents()
-
-            # 7. Update window title
-            if hasattr(self.app.ui_helpers, 'update_window_title'):
-                # Ensure modified flag is still False after all UI updates
-                self.app.modified = False
-                self.app.ui_helpers.update_window_title()
-                print("Updated window title")
-
-            # Final process events
-            QtWidgets.QApplication.processEvents()
+            # 7. Update window title; the marked regions are refreshed in one pass
+            self.app.modified = False
+            self.app.refresh.mark(TITLE)
 
             # Show success message
             QMessageBox.information(self.app, "File Closed", "File closed successfully.")
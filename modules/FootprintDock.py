@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QLabel, QTreeWidget,
+                            QTreeWidgetItem, QTabWidget, QInputDialog, QHeaderView)
+from PyQt5.QtGui import QColor, QBrush
+
+from Modules.ExcelExport import available_cores
+from Modules.ProcessRunner import format_memory
+from Modules.RoutingMatrix import core_key
+
+OVERRUN_BRUSH = QBrush(QColor("#f4c7c3"))
+
+
+class FootprintDock(QDockWidget):
+    """Dockable panel with the estimated memory footprint of the project
+
+    Shows the bytes used per memory region (split by core) against the
+    region budgets stored in the project, and the largest signals. The
+    figures come from app.footprint, which SignalOperations keeps current;
+    the view is refreshed shortly after the last change.
+    """
+
+    # Signals listed on the Largest Signals tab
+    LARGEST_COUNT = 100
+    # Milliseconds to wait for further edits before refreshing
+    REFRESH_DELAY = 200
+
+    def __init__(self, app):
+        super(FootprintDock, self).__init__("Memory Footprint", app)
+        self.setObjectName("footprintDock")
+        self.app = app
+        self._overruns = {}
+
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(4, 4, 4, 4)
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        tabs = QTabWidget()
+        self.region_tree = QTreeWidget()
+        self.region_tree.setHeaderLabels(["Region / Core", "Used", "Budget", "Usage"])
+        self.region_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.region_tree.setToolTip("Double-click a region to set its budget")
+        tabs.addTab(self.region_tree, "Regions")
+
+        self.signal_tree = QTreeWidget()
+        self.signal_tree.setHeaderLabels(["Signal", "Bytes", "Region"])
+        self.signal_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.signal_tree.setRootIsDecorated(False)
+        tabs.addTab(self.signal_tree, "Largest Signals")
+        layout.addWidget(tabs)
+        self.setWidget(widget)
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        self.region_tree.itemDoubleClicked.connect(self.edit_budget)
+        self.visibilityChanged.connect(lambda visible: visible and self.refresh())
+
+    def budgets(self):
+        """Return {region: bytes} budgets of the project"""
+        return self.app.signals_data.get("project_specific", {}).get("memory_budgets", {})
+
+    def schedule_refresh(self):
+        """Refresh once the current burst of edits is over"""
+        self._refresh_timer.start()
+
+    def refresh(self):
+        footprint = self.app.footprint
+        budgets = self.budgets()
+        overruns = footprint.overruns(budgets)
+        self._report_new_overruns(overruns)
+        if not self.isVisible():
+            return
+
+        core_names = {core_key(name): name for name in available_cores(self.app.signals_data)}
+        core_names[""] = "(no source core)"
+
+        self.region_tree.clear()
+        for region, used in sorted(footprint.regions.items()):
+            budget = budgets.get(region)
+            usage = f"{100.0 * used / budget:.1f}%" if budget else ""
+            item = QTreeWidgetItem([region, format_memory(used),
+                                    format_memory(budget) if budget else "", usage])
+            item.setData(0, QtCore.Qt.UserRole, region)
+            if region in overruns:
+                for column in range(4):
+                    item.setBackground(column, OVERRUN_BRUSH)
+            for (item_region, key), size in sorted(footprint.region_cores.items()):
+                if item_region == region and size:
+                    item.addChild(QTreeWidgetItem([core_names.get(key, key), format_memory(size)]))
+            self.region_tree.addTopLevelItem(item)
+
+        self.signal_tree.clear()
+        for name, signal_footprint in footprint.largest(self.LARGEST_COUNT):
+            self.signal_tree.addTopLevelItem(QTreeWidgetItem(
+                [name, str(signal_footprint.total), signal_footprint.region]))
+
+        summary = f"{format_memory(footprint.total)} in {len(footprint.signals)} signals"
+        if footprint.unknown:
+            summary += f"; {len(footprint.unknown)} signals have types of unknown size (counted as 0 bytes)"
+        if overruns:
+            summary += "; over budget: " + ", ".join(sorted(overruns))
+        self.summary_label.setText(summary)
+
+    def _report_new_overruns(self, overruns):
+        """Show a status bar warning when a region goes over its budget"""
+        new_regions = set(overruns) - set(self._overruns)
+        self._overruns = overruns
+        if new_regions and hasattr(self.app.ui, 'statusBar'):
+            text = ", ".join(f"{region} {format_memory(overruns[region][0])} of {format_memory(overruns[region][1])}"
+                             for region in sorted(new_regions))
+            self.app.ui.statusBar.showMessage(f"Memory budget exceeded: {text}", 10000)
+
+    def edit_budget(self, item, column=0):
+        region = item.data(0, QtCore.Qt.UserRole)
+        if region is None:
+            return
+        current = self.budgets().get(region, 0) / 1024
+        value, ok = QInputDialog.getDouble(self, "Memory Budget", f"Budget of {region} in KiB (0 for none):",
+                                           current, 0, 1024 * 1024 * 1024, 1)
+        if not ok:
+            return
+        budgets = self.app.signals_data.setdefault("project_specific", {}).setdefault("memory_budgets", {})
+        if value:
+            budgets[region] = int(value * 1024)
+        else:
+            budgets.pop(region, None)
+        self.app.modified = True
+        self.app.ui_helpers.update_window_title()
+        self.refresh()
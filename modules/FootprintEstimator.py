@@ -0,0 +1,220 @@
+"""Target memory footprint of the signals of a project
+
+The size of every data type is computed with the natural C alignment the
+generated code gets (see HeaderGenerator): scalars are aligned to their
+size, arrays to their element, structs to their largest field and padded
+to a multiple of it.
+
+Each signal then costs, in its Memory Region:
+
+    SharedMemory            payload x SM_Buff_Count, owned by the source core
+    IPC / IPCOverEthernet   payload on the source core, plus
+                            payload x Buffer count_IPC on every destination core
+
+FootprintEstimator keeps the per-signal, per-core and per-region totals up
+to date as single signals change, like RoutingMatrix does for routing.
+"""
+import re
+import heapq
+from functools import lru_cache
+
+from Modules.RoutingMatrix import CORE_INDEX, core_key, route_mask
+from Modules.HeaderGenerator import STRING_LENGTH
+
+# Size in bytes of the scalar data types; they are aligned to their size
+SCALAR_SIZES = {
+    "INT8": 1, "UINT8": 1, "BOOLEAN": 1, "BOOL": 1, "CHAR": 1,
+    "INT16": 2, "UINT16": 2,
+    "INT32": 4, "UINT32": 4, "FLOAT32": 4,
+    "INT64": 8, "UINT64": 8, "FLOAT64": 8,
+    "SINT8": 1, "SINT16": 2, "SINT32": 4, "SINT64": 8,
+    "BOOL_T": 1, "CHAR_T": 1,
+}
+
+SHARED_MEMORY = "SharedMemory"
+
+_ARRAY_OF = re.compile(r"^ARRAY\s*\[\s*(\d+)\s*\]\s*OF\s+(\w+)$", re.IGNORECASE)
+_ARRAY_OF_SIZE = re.compile(r"^ARRAY\s*\[\s*(\w+)\s*\]\s*\[\s*(\d+)\s*\]$", re.IGNORECASE)
+_ENUM = re.compile(r"^ENUM\s*<\s*(\d)\s*BYTES?\s*>", re.IGNORECASE)
+
+
+def _align(offset, alignment):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+@lru_cache(maxsize=4096)
+def type_layout(type_text):
+    """Return (size, alignment) of a scalar, ENUM, STRING or ARRAY type, or None if unknown"""
+    type_text = str(type_text or "").strip()
+    upper = type_text.upper()
+    size = SCALAR_SIZES.get(upper)
+    if size is not None:
+        return size, size
+    match = _ENUM.match(type_text)
+    if match:
+        size = int(match.group(1))
+        return size, size
+    if upper == "STRING":
+        return STRING_LENGTH, 1
+    match = _ARRAY_OF.match(type_text)
+    if match:
+        count, element = int(match.group(1)), match.group(2)
+    else:
+        match = _ARRAY_OF_SIZE.match(type_text)
+        if not match:
+            return None
+        element, count = match.group(1), int(match.group(2))
+    layout = type_layout(element)
+    if layout is None:
+        return None
+    return layout[0] * count, layout[1]
+
+
+@lru_cache(maxsize=1024)
+def struct_layout(field_types):
+    """Return (size, alignment, unknown) of a struct with the given field types
+
+    Fields of unknown type count as zero bytes; unknown is True if there
+    were any. Empty structs get the one reserved byte of the generated code.
+    """
+    offset, alignment, unknown = 0, 1, False
+    for type_text in field_types:
+        layout = type_layout(type_text)
+        if layout is None:
+            unknown = True
+            continue
+        size, field_alignment = layout
+        offset = _align(offset, field_alignment) + size
+        alignment = max(alignment, field_alignment)
+    if not field_types:
+        return 1, 1, False
+    return _align(offset, alignment), alignment, unknown
+
+
+def payload_size(signal):
+    """Return (bytes, unknown) of one instance of a signal's data type"""
+    get = signal.get
+    data_type = str(get("DataType", "INT32") or "INT32").strip()
+    upper = data_type.upper()
+    if get("is_struct", False) or upper == "STRUCT":
+        field_types = tuple(str((field or {}).get("type") or "")
+                            for field in (get("struct_fields") or {}).values())
+        size, _, unknown = struct_layout(field_types)
+        return size, unknown
+    if upper == "ARRAY":
+        array_config = get("array_config") or {}
+        layout = type_layout(array_config.get("base_type", "UINT8"))
+        count = _count(array_config.get("size", 1))
+        return (layout[0] * count, False) if layout else (0, True)
+    layout = type_layout(data_type)
+    return (layout[0], False) if layout else (0, True)
+
+
+def _count(value, default=1):
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class SignalFootprint:
+    """Bytes one signal takes in its memory region, split by core"""
+
+    __slots__ = ("payload", "region", "cores", "unknown")
+
+    def __init__(self, signal):
+        self.payload, self.unknown = payload_size(signal)
+        self.region = str(signal.get("Memory Region", "DDR") or "DDR")
+        source = signal.get("Source", "")
+        source_key = core_key(source) if source else ""
+        # core key -> bytes; "" collects buffers of signals without a source core
+        self.cores = {}
+        if signal.get("Impl_Approach", SHARED_MEMORY) == SHARED_MEMORY:
+            self.cores[source_key] = self.payload * _count(signal.get("SM_Buff_Count", 1))
+        else:
+            self.cores[source_key] = self.payload
+            receive = self.payload * _count(signal.get("Buffer count_IPC", 1))
+            for key in CORE_INDEX.keys_in(route_mask(signal)):
+                self.cores[key] = self.cores.get(key, 0) + receive
+
+    @property
+    def total(self):
+        return sum(self.cores.values())
+
+
+def _bump(totals, key, delta):
+    """Add delta to totals[key], dropping entries that fall to zero"""
+    value = totals.get(key, 0) + delta
+    if value or delta > 0:
+        totals[key] = value
+    else:
+        totals.pop(key, None)
+
+
+class FootprintEstimator:
+    """Per-signal, per-core and per-region byte footprints of a project
+
+    Updated by SignalOperations whenever a signal is added, edited,
+    renamed or removed, so the totals never need a full recount.
+    """
+
+    def __init__(self, signals=None):
+        self.rebuild(signals or {})
+
+    def rebuild(self, signals):
+        """Recompute everything from a {name: signal} mapping"""
+        self.signals = {}
+        self.regions = {}
+        self.cores = {}
+        # (region, core key) -> bytes
+        self.region_cores = {}
+        self.unknown = set()
+        for name, signal in signals.items():
+            self.set_signal(name, signal)
+
+    def set_signal(self, name, signal):
+        """Insert or update the footprint of a signal"""
+        self.remove_signal(name)
+        footprint = SignalFootprint(signal)
+        self.signals[name] = footprint
+        self._add(footprint, 1)
+        if footprint.unknown:
+            self.unknown.add(name)
+
+    def remove_signal(self, name):
+        footprint = self.signals.pop(name, None)
+        if footprint is not None:
+            self._add(footprint, -1)
+            self.unknown.discard(name)
+
+    def rename_signal(self, old_name, new_name):
+        footprint = self.signals.pop(old_name, None)
+        if footprint is not None:
+            self.signals[new_name] = footprint
+            if old_name in self.unknown:
+                self.unknown.discard(old_name)
+                self.unknown.add(new_name)
+
+    def _add(self, footprint, sign):
+        region = footprint.region
+        for key, size in footprint.cores.items():
+            _bump(self.regions, region, sign * size)
+            _bump(self.cores, key, sign * size)
+            _bump(self.region_cores, (region, key), sign * size)
+
+    @property
+    def total(self):
+        return sum(self.regions.values())
+
+    def signal_bytes(self, name):
+        footprint = self.signals.get(name)
+        return footprint.total if footprint is not None else 0
+
+    def largest(self, count=100):
+        """Return [(name, SignalFootprint)] of the count largest signals"""
+        return heapq.nlargest(count, self.signals.items(), key=lambda item: item[1].total)
+
+    def overruns(self, budgets):
+        """Return {region: (used, budget)} for regions over their byte budget"""
+        return {region: (used, budgets[region]) for region, used in self.regions.items()
+                if budgets.get(region) and used > budgets[region]}
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                            QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem,
+                            QPlainTextEdit, QSpinBox, QGroupBox, QMessageBox, QHeaderView,
+                            QComboBox, QCheckBox)
+from PyQt5.QtCore import Qt
+
+from Modules import GeneratorRegistry
+from Modules.SignalMgrCore import GENERATOR_INPUT_FILES, generator_input_format
+from Modules.GeneratorRuntime import runtime_settings
+from Modules.ProcessRunner import format_memory
+from Modules.GenerationPipeline import GenerationPipeline, plan_jobs, DEFAULT_MAX_WORKERS
+
+
+class GenerationWorker(QtCore.QObject):
+    """Run a GenerationPipeline in a worker thread and report every job"""
+
+    job_started = QtCore.pyqtSignal(object)
+    job_finished = QtCore.pyqtSignal(object)
+    # job, "stdout" or "stderr", line
+    job_output = QtCore.pyqtSignal(object, str, str)
+    finished = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, pipeline, jobs):
+        super(GenerationWorker, self).__init__()
+        self.pipeline = pipeline
+        self.jobs = jobs
+
+    def run(self):
+        try:
+            self.pipeline.run(self.jobs, self.job_started.emit, self.job_finished.emit, self.job_output.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+        self.finished.emit()
+
+
+class GenerateAllDialog(QDialog):
+    """Select targets and boards, then generate them in parallel with live progress
+
+    The dialog stays usable (and the main window editable) while the
+    generators run; each job reports its status, duration and output.
+    A run is registered with the generation log panel, so only one
+    generation at a time writes to the output directory. snapshot returns
+    a stable copy of the project and is called by every run, so a run
+    generates the project as it is when Start is pressed.
+    """
+
+    COLUMNS = ["Target", "Board", "Status", "Time", "Peak Memory"]
+
+    # Emitted with the generator input format chosen in the dialog
+    input_format_changed = QtCore.pyqtSignal(str)
+    # Emitted with the generator runtime settings changed in the dialog
+    runtime_changed = QtCore.pyqtSignal(dict)
+
+    def __init__(self, snapshot, boards, selected_board, script_directory, output_root,
+                 python_cmd=None, parent=None, worker_pool=None, generation_log=None):
+        super(GenerateAllDialog, self).__init__(parent)
+        self.snapshot = snapshot
+        self.script_directory = script_directory
+        self.output_root = output_root
+        self.python_cmd = python_cmd
+        self.worker_pool = worker_pool
+        self.generation_log = generation_log
+        self.pipeline = None
+        self.thread = None
+        self.worker = None
+        self._row_of_job = {}
+        self.setup_ui(boards, selected_board, snapshot())
+
+    def setup_ui(self, boards, selected_board, data):
+        self.setWindowTitle("Generate All")
+        self.resize(760, 560)
+        self.setWindowModality(Qt.NonModal)
+
+        main_layout = QVBoxLayout(self)
+
+        # Target and board selection
+        selection_layout = QHBoxLayout()
+        target_group = QGroupBox("Generators")
+        target_layout = QVBoxLayout(target_group)
+        self.target_list = QListWidget()
+        for target in GeneratorRegistry.load(self.script_directory):
+            item = QListWidgetItem(target.display_name)
+            item.setData(Qt.UserRole, target)
+            item.setCheckState(Qt.Checked)
+            self.target_list.addItem(item)
+        target_layout.addWidget(self.target_list)
+        selection_layout.addWidget(target_group)
+
+        board_group = QGroupBox("Boards")
+        board_layout = QVBoxLayout(board_group)
+        self.board_list = QListWidget()
+        for board in boards:
+            item = QListWidgetItem(board)
+            item.setCheckState(Qt.Checked if board == selected_board else Qt.Unchecked)
+            self.board_list.addItem(item)
+        board_layout.addWidget(self.board_list)
+        selection_layout.addWidget(board_group)
+        main_layout.addLayout(selection_layout)
+
+        workers_layout = QHBoxLayout()
+        workers_layout.addWidget(QLabel("Parallel generators:"))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 16)
+        self.workers_spin.setValue(DEFAULT_MAX_WORKERS)
+        workers_layout.addWidget(self.workers_spin)
+        workers_layout.addWidget(QLabel("Generator input:"))
+        self.input_format_combo = QComboBox()
+        for input_format, file_name in GENERATOR_INPUT_FILES.items():
+            self.input_format_combo.addItem(file_name, input_format)
+        self.input_format_combo.setCurrentIndex(
+            self.input_format_combo.findData(generator_input_format(data)))
+        workers_layout.addWidget(self.input_format_combo)
+        self.force_check = QCheckBox("Regenerate unchanged")
+        self.force_check.setToolTip("Run every generator, even if its inputs did not change since the last run")
+        workers_layout.addWidget(self.force_check)
+        self.warm_check = QCheckBox("Warm workers")
+        self.warm_check.setToolTip("Run the generators in worker processes that are kept running, "
+                                   "so their imports are loaded once per session")
+        self.warm_check.setChecked(runtime_settings(data).get("warm_worker", False))
+        self.warm_check.setEnabled(self.worker_pool is not None)
+        workers_layout.addWidget(self.warm_check)
+        workers_layout.addWidget(QLabel("Timeout:"))
+        self.timeout_spin = QSpinBox()
+        self.timeout_spin.setRange(0, 24 * 3600)
+        self.timeout_spin.setSuffix(" s")
+        self.timeout_spin.setSpecialValueText("None")
+        self.timeout_spin.setValue(int(runtime_settings(data).get("timeout") or 0))
+        workers_layout.addWidget(self.timeout_spin)
+        workers_layout.addStretch()
+        main_layout.addLayout(workers_layout)
+
+        # Per job progress
+        self.job_table = QTableWidget(0, len(self.COLUMNS))
+        self.job_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.job_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.job_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        main_layout.addWidget(self.job_table)
+
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        main_layout.addWidget(self.log_view)
+
+        button_layout = QHBoxLayout()
+        self.start_button = QPushButton("Generate")
+        self.cancel_button = QPushButton("Cancel")
+        self.close_button = QPushButton("Close")
+        self.cancel_button.setEnabled(False)
+        button_layout.addStretch()
+        button_layout.addWidget(self.start_button)
+        button_layout.addWidget(self.cancel_button)
+        button_layout.addWidget(self.close_button)
+        main_layout.addLayout(button_layout)
+
+        self.start_button.clicked.connect(self.start)
+        self.cancel_button.clicked.connect(self.cancel)
+        self.close_button.clicked.connect(self.close)
+
+    def _checked(self, list_widget, role=Qt.DisplayRole):
+        return [list_widget.item(i).data(role) for i in range(list_widget.count())
+                if list_widget.item(i).checkState() == Qt.Checked]
+
+    def start(self):
+        targets = self._checked(self.target_list, Qt.UserRole)
+        boards = self._checked(self.board_list)
+        if not targets or not boards:
+            QMessageBox.warning(self, "Warning", "Select at least one generator and one board.")
+            return
+        if self.generation_log is not None and self.generation_log.running:
+            QMessageBox.warning(self, "Warning", "A generation is already running.")
+            return
+
+        data = self.snapshot()
+        input_format = self.input_format_combo.currentData()
+        if input_format != generator_input_format(data):
+            self.input_format_changed.emit(input_format)
+        warm = self.warm_check.isChecked() and self.worker_pool is not None
+        timeout = self.timeout_spin.value() or None
+        runtime = runtime_settings(data)
+        if warm != runtime.get("warm_worker", False) or timeout != runtime.get("timeout"):
+            self.runtime_changed.emit({"warm_worker": warm, "timeout": timeout})
+
+        jobs = plan_jobs(targets, boards, self.output_root)
+        self.job_table.setRowCount(len(jobs))
+        self._row_of_job = {}
+        for row, job in enumerate(jobs):
+            self._row_of_job[id(job)] = row
+            for column, text in enumerate([job.generator.display_name, job.board_name, "Queued", "", ""]):
+                self.job_table.setItem(row, column, QTableWidgetItem(text))
+        self.log_view.clear()
+        self.log_view.appendPlainText(f"Exporting generator input to {self.output_root} ...")
+
+        self.pipeline = GenerationPipeline(data, self.script_directory, self.output_root,
+                                           self.python_cmd, self.workers_spin.value(), input_format,
+                                           self.force_check.isChecked(),
+                                           self.worker_pool if warm else None, timeout)
+        self.worker = GenerationWorker(self.pipeline, jobs)
+        self.thread = QtCore.QThread(self)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.job_started.connect(self.on_job_started)
+        self.worker.job_finished.connect(self.on_job_finished)
+        self.worker.job_output.connect(self.on_job_output)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.finished.connect(self.thread.quit)
+
+        self.start_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.target_list.setEnabled(False)
+        self.board_list.setEnabled(False)
+        self.input_format_combo.setEnabled(False)
+        self.force_check.setEnabled(False)
+        self.warm_check.setEnabled(False)
+        self.timeout_spin.setEnabled(False)
+        if self.generation_log is not None:
+            # Its Cancel button stops this run as well
+            self.generation_log.start(f"Generate All -> {self.output_root}", self.pipeline)
+        self.thread.start()
+
+    def cancel(self):
+        if self.pipeline is not None:
+            self.pipeline.cancel()
+            self.log_view.appendPlainText("Cancelling: running generators are stopped, queued ones are skipped")
+
+    def _set_status(self, job, status):
+        row = self._row_of_job.get(id(job))
+        if row is None:
+            return
+        self.job_table.item(row, 2).setText(status)
+        if job.elapsed is not None:
+            self.job_table.item(row, 3).setText(f"{job.elapsed:.2f}s")
+        if job.peak_memory is not None:
+            self.job_table.item(row, 4).setText(format_memory(job.peak_memory))
+
+    def on_job_started(self, job):
+        self._set_status(job, "Running")
+
+    def on_job_output(self, job, stream, line):
+        line = line.rstrip("\n")
+        self.log_view.appendPlainText(f"[{job.label}] {line}" if stream == "stdout"
+                                      else f"[{job.label}] stderr: {line}")
+
+    def on_job_finished(self, job):
+        status = job.status
+        self._set_status(job, status)
+        self.log_view.appendPlainText(f"===== {job.label}: {status} ({job.statistics}) =====")
+        if self.generation_log is not None and self.generation_log.pipeline is self.pipeline:
+            self.generation_log.append(f"{job.label}: {status} ({job.statistics})")
+        if job.ok and not job.skipped:
+            self.log_view.appendPlainText(f"{len(job.written_files)} files written, "
+                                          f"{len(job.unchanged_files)} unchanged")
+        if job.error is not None:
+            self.log_view.appendPlainText(job.error)
+
+    def on_failed(self, message):
+        self.log_view.appendPlainText(f"Error: {message}")
+
+    def on_finished(self):
+        self.start_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.target_list.setEnabled(True)
+        self.board_list.setEnabled(True)
+        self.input_format_combo.setEnabled(True)
+        self.force_check.setEnabled(True)
+        self.warm_check.setEnabled(self.worker_pool is not None)
+        self.timeout_spin.setEnabled(True)
+        self.log_view.appendPlainText("Generation finished")
+        self._release_generation_log("Generate All finished")
+
+    def _release_generation_log(self, status):
+        if self.generation_log is not None and self.pipeline is not None \
+                and self.generation_log.pipeline is self.pipeline:
+            self.generation_log.finish(status)
+
+    def closeEvent(self, event):
+        # Keep the dialog alive until the worker thread has stopped
+        if self.thread is not None and self.thread.isRunning():
+            self.cancel()
+            self.thread.quit()
+            self.thread.wait()
+        # on_finished may not run once the dialog is closed
+        self._release_generation_log("Generate All cancelled")
+        super(GenerateAllDialog, self).closeEvent(event)
@@ -0,0 +1,310 @@
+"""Content-hash cache for incremental code generation
+
+Every generator job gets a fingerprint of everything it depends on: the
+exported tables, the generator input format, the target, the board, the
+generator scripts and the API configuration. The fingerprints and the
+files each job produced are kept in a manifest in the output directory.
+A job whose fingerprint is unchanged and whose output files are still
+in place is skipped. A job that does run writes into a staging directory
+first, and only the files whose content changed are moved into the
+output directory, so untouched files keep their timestamps and a build
+system picking them up recompiles nothing. compare() gives the same
+verdict per file without touching the output directory, for previews.
+"""
+import os
+import json
+import shutil
+import hashlib
+import difflib
+import tempfile
+import threading
+
+# Manifest and staging area inside the output directory
+MANIFEST_FILE = ".signalmgr_cache.json"
+STAGING_DIR = ".signalmgr_staging"
+
+# FileChange.status values
+ADDED = "added"
+MODIFIED = "modified"
+UNCHANGED = "unchanged"
+
+# Bump when the fingerprint contents change, to invalidate old manifests
+CACHE_VERSION = 1
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _sha256(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _canonical(value):
+    """Return value as JSON text that does not depend on dict order"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def tables_digest(sheets):
+    """Return the digest of the tables returned by ExcelExport.workbook_tables()"""
+    return _sha256(_canonical(sheets))
+
+
+def file_digest(file_path):
+    """Return the SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scripts_digest(script_directory):
+    """Return the digest of the generator scripts (every .py file below script_directory)
+
+    Editing, adding or removing a script changes the digest, which stands
+    in for a version number the scripts do not have.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(script_directory):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__" and not d.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, script_directory).replace(os.sep, "/").encode("utf-8"))
+                digest.update(b"\0")
+                digest.update(file_digest(path).encode("ascii"))
+    return digest.hexdigest()
+
+
+def job_key(target, board_name, output_dir, output_root):
+    """Return the manifest key of one generator job"""
+    relative_dir = os.path.relpath(output_dir, output_root).replace(os.sep, "/")
+    return f"{target}|{board_name}|{relative_dir}"
+
+
+def job_fingerprint(input_digest, input_format, target, board_name, script_digest, api_config):
+    """Return the fingerprint of everything one generator job depends on"""
+    return _sha256(CACHE_VERSION, input_digest, input_format, target, board_name,
+                   script_digest, _canonical(api_config or {}))
+
+
+def _file_record(path, digest):
+    stat = os.stat(path)
+    return {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _record_matches(path, record):
+    """True if path still has the size and timestamp it had when it was recorded"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_size == record.get("size") and stat.st_mtime_ns == record.get("mtime_ns")
+
+
+class GenerationCache:
+    """Fingerprints and output files of the jobs generated into one output directory
+
+    Jobs of a pipeline run in several threads and share one cache; the
+    manifest is only written by save().
+    """
+
+    def __init__(self, output_root):
+        self.output_root = output_root
+        self.manifest_path = os.path.join(output_root, MANIFEST_FILE)
+        self._lock = threading.Lock()
+        self._manifest = self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {"version": CACHE_VERSION, "input": {}, "jobs": {}}
+        if not isinstance(manifest, dict) or manifest.get("version") != CACHE_VERSION:
+            return {"version": CACHE_VERSION, "input": {}, "jobs": {}}
+        manifest.setdefault("input", {})
+        manifest.setdefault("jobs", {})
+        return manifest
+
+    def save(self):
+        """Write the manifest next to the generated files"""
+        from Modules.ProjectWriter import atomic_write
+
+        with self._lock:
+            text = json.dumps(self._manifest, indent=1, sort_keys=True)
+        os.makedirs(self.output_root, exist_ok=True)
+        atomic_write(self.manifest_path, text)
+
+    def _path(self, relative_path):
+        return os.path.join(self.output_root, *relative_path.split("/"))
+
+    def _relative(self, path):
+        return os.path.relpath(path, self.output_root).replace(os.sep, "/")
+
+    # Generator input
+
+    def input_is_current(self, input_path, input_digest):
+        """True if input_path was written from tables with input_digest and is unchanged"""
+        with self._lock:
+            record = self._manifest["input"].get(self._relative(input_path))
+        return bool(record) and record.get("tables") == input_digest and _record_matches(input_path, record)
+
+    def record_input(self, input_path, input_digest):
+        stat = os.stat(input_path)
+        record = {"tables": input_digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        with self._lock:
+            self._manifest["input"][self._relative(input_path)] = record
+
+    # Generator jobs
+
+    def is_current(self, key, fingerprint):
+        """True if the job already ran with fingerprint and its files are untouched"""
+        with self._lock:
+            entry = self._manifest["jobs"].get(key)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        return all(_record_matches(self._path(relative_path), record)
+                   for relative_path, record in entry.get("files", {}).items())
+
+    def forget(self, key):
+        with self._lock:
+            self._manifest["jobs"].pop(key, None)
+
+    def staging_directory(self, key, staging_root=None):
+        """Create an empty directory for one job to generate into"""
+        staging_root = staging_root or os.path.join(self.output_root, STAGING_DIR)
+        os.makedirs(staging_root, exist_ok=True)
+        prefix = "".join(c if c.isalnum() else "_" for c in key) + "-"
+        return tempfile.mkdtemp(prefix=prefix, dir=staging_root)
+
+    def discard_staging(self, staging_dir):
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        try:
+            os.rmdir(os.path.dirname(staging_dir))
+        except OSError:
+            pass  # Other jobs are still staging
+
+    def _known_digest(self, path, relative_path):
+        """Return the recorded digest of an unchanged output file, without reading it"""
+        with self._lock:
+            for entry in self._manifest["jobs"].values():
+                record = entry.get("files", {}).get(relative_path)
+                if record and _record_matches(path, record):
+                    return record["sha256"]
+        return None
+
+    def _status(self, target_path, digest, size):
+        """Return ADDED, MODIFIED or UNCHANGED for a generated file with digest and size
+
+        Files of another size are modified without reading them, otherwise
+        the recorded or computed digest of the file on disk decides.
+        """
+        try:
+            current_size = os.path.getsize(target_path)
+        except OSError:
+            return ADDED
+        if current_size != size:
+            return MODIFIED
+        current = self._known_digest(target_path, self._relative(target_path)) or file_digest(target_path)
+        return UNCHANGED if current == digest else MODIFIED
+
+    def compare(self, staging_dir, output_dir):
+        """Compare the files of a staged job with output_dir, without changing anything
+
+        Returns a FileChange per generated file; added and modified ones keep
+        their new content in memory.
+        """
+        changes = []
+        for staged_path, target_path in _staged_files(staging_dir, output_dir):
+            with open(staged_path, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            status = self._status(target_path, digest, len(data))
+            changes.append(FileChange(target_path, status, digest, None if status == UNCHANGED else data))
+        return changes
+
+    def commit(self, key, fingerprint, staging_dir, output_dir):
+        """Move the changed files of a staged job into output_dir
+
+        Files whose content is already in output_dir are left alone. Returns
+        (written, unchanged) lists of the output files, and records the job.
+        """
+        written, unchanged, files = [], [], {}
+        for staged_path, target_path in _staged_files(staging_dir, output_dir):
+            digest = file_digest(staged_path)
+            if self._status(target_path, digest, os.path.getsize(staged_path)) == UNCHANGED:
+                unchanged.append(target_path)
+            else:
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                os.replace(staged_path, target_path)
+                written.append(target_path)
+            files[self._relative(target_path)] = _file_record(target_path, digest)
+        self._record_job(key, fingerprint, files)
+        return written, unchanged
+
+    def apply(self, key, fingerprint, changes):
+        """Write the added and modified files of a compare() result and record the job
+
+        Returns (written, unchanged) lists of the output files.
+        """
+        from Modules.ProjectWriter import atomic_write
+
+        written, unchanged, files = [], [], {}
+        for change in changes:
+            if change.status == UNCHANGED:
+                unchanged.append(change.path)
+            else:
+                os.makedirs(os.path.dirname(change.path), exist_ok=True)
+                atomic_write(change.path, change.data)
+                written.append(change.path)
+            files[self._relative(change.path)] = _file_record(change.path, change.digest)
+        self._record_job(key, fingerprint, files)
+        return written, unchanged
+
+    def _record_job(self, key, fingerprint, files):
+        with self._lock:
+            self._manifest["jobs"][key] = {"fingerprint": fingerprint, "files": files}
+
+
+def _staged_files(staging_dir, output_dir):
+    """Yield (staged path, path in output_dir) for every file of a staged job"""
+    for root, dirs, names in os.walk(staging_dir):
+        dirs.sort()
+        for name in sorted(names):
+            staged_path = os.path.join(root, name)
+            yield staged_path, os.path.join(output_dir, os.path.relpath(staged_path, staging_dir))
+
+
+class FileChange:
+    """A freshly generated file compared with the one in the output directory"""
+
+    __slots__ = ("path", "status", "digest", "data")
+
+    def __init__(self, path, status, digest, data=None):
+        self.path = path
+        self.status = status
+        self.digest = digest
+        # New content of added and modified files
+        self.data = data
+
+    def diff(self, context=3):
+        """Return a unified diff from the file on disk to the new content"""
+        if self.status == UNCHANGED:
+            return ""
+        old_data = b""
+        if self.status == MODIFIED:
+            with open(self.path, "rb") as f:
+                old_data = f.read()
+        if b"\0" in old_data or b"\0" in self.data:
+            return f"Binary file {self.path} differs\n"
+        old_lines = old_data.decode("utf-8", "replace").splitlines(True)
+        new_lines = self.data.decode("utf-8", "replace").splitlines(True)
+        for lines in (old_lines, new_lines):
+            if lines and not lines[-1].endswith("\n"):
+                lines[-1] += "\n"
+        from_file = self.path if self.status == MODIFIED else "/dev/null"
+        return "".join(difflib.unified_diff(old_lines, new_lines, from_file, self.path, n=context))
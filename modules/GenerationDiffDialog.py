@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QSplitter, QTreeWidget,
+                            QTreeWidgetItem, QPlainTextEdit, QPushButton, QCheckBox, QLabel,
+                            QMessageBox, QHeaderView)
+from PyQt5.QtGui import QFont, QColor, QTextCharFormat, QSyntaxHighlighter
+from PyQt5.QtCore import Qt
+
+from Modules.GenerationCache import ADDED, MODIFIED, UNCHANGED
+
+STATUS_TEXT = {ADDED: "Added", MODIFIED: "Modified", UNCHANGED: "Unchanged"}
+
+
+class DiffHighlighter(QSyntaxHighlighter):
+    """Colour the added, removed and hunk header lines of a unified diff"""
+
+    def __init__(self, document):
+        super(DiffHighlighter, self).__init__(document)
+        self.formats = {}
+        for prefix, color in (("+", "#006400"), ("-", "#b22222"), ("@", "#1e3a8a")):
+            text_format = QTextCharFormat()
+            text_format.setForeground(QColor(color))
+            self.formats[prefix] = text_format
+
+    def highlightBlock(self, text):
+        if text.startswith(("+++", "---")):
+            return
+        text_format = self.formats.get(text[:1])
+        if text_format is not None:
+            self.setFormat(0, len(text), text_format)
+
+
+class GenerationDiffDialog(QDialog):
+    """Show what a dry run would change in the output directories
+
+    The files of each job are listed with their status; selecting one
+    shows its diff, computed only when it is selected. Apply Changes
+    writes the added and modified files without running the generators
+    again.
+    """
+
+    def __init__(self, pipeline, jobs, parent=None):
+        super(GenerationDiffDialog, self).__init__(parent)
+        self.pipeline = pipeline
+        self.jobs = jobs
+        self.setup_ui()
+        self.populate()
+
+    def setup_ui(self):
+        self.setWindowTitle("Preview Generated Code")
+        self.resize(1000, 640)
+        self.setWindowModality(Qt.NonModal)
+
+        main_layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        main_layout.addWidget(self.summary_label)
+
+        splitter = QSplitter(Qt.Horizontal)
+        self.file_tree = QTreeWidget()
+        self.file_tree.setHeaderLabels(["File", "Status"])
+        self.file_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.file_tree.header().setStretchLastSection(False)
+        splitter.addWidget(self.file_tree)
+
+        self.diff_view = QPlainTextEdit()
+        self.diff_view.setReadOnly(True)
+        self.diff_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.diff_view.setFont(QFont("Courier New", 9))
+        self.highlighter = DiffHighlighter(self.diff_view.document())
+        splitter.addWidget(self.diff_view)
+        splitter.setSizes([350, 650])
+        main_layout.addWidget(splitter)
+
+        button_layout = QHBoxLayout()
+        self.unchanged_check = QCheckBox("Show unchanged files")
+        button_layout.addWidget(self.unchanged_check)
+        button_layout.addStretch()
+        self.apply_button = QPushButton("Apply Changes")
+        self.close_button = QPushButton("Close")
+        button_layout.addWidget(self.apply_button)
+        button_layout.addWidget(self.close_button)
+        main_layout.addLayout(button_layout)
+
+        self.file_tree.currentItemChanged.connect(self.show_diff)
+        self.unchanged_check.toggled.connect(self.populate)
+        self.apply_button.clicked.connect(self.apply_changes)
+        self.close_button.clicked.connect(self.close)
+
+    def populate(self):
+        """Fill the file tree from the jobs of the dry run"""
+        self.file_tree.clear()
+        self.diff_view.clear()
+        show_unchanged = self.unchanged_check.isChecked()
+        counts = {ADDED: 0, MODIFIED: 0, UNCHANGED: 0}
+
+        for job in self.jobs:
+            job_item = QTreeWidgetItem([job.label, job.status])
+            job_item.setData(0, Qt.UserRole + 1, job)
+            self.file_tree.addTopLevelItem(job_item)
+            if not job.ok:
+                job_item.setForeground(1, QColor("#b22222"))
+            for change in job.changes:
+                counts[change.status] += 1
+                if change.status == UNCHANGED and not show_unchanged:
+                    continue
+                item = QTreeWidgetItem([change.path, STATUS_TEXT[change.status]])
+                item.setData(0, Qt.UserRole, change)
+                job_item.addChild(item)
+            job_item.setExpanded(True)
+
+        changed = counts[ADDED] + counts[MODIFIED]
+        self.summary_label.setText(f"{counts[ADDED]} added, {counts[MODIFIED]} modified, "
+                                   f"{counts[UNCHANGED]} unchanged")
+        self.apply_button.setEnabled(changed > 0)
+
+    def show_diff(self, item, previous=None):
+        if item is None:
+            return
+        change = item.data(0, Qt.UserRole)
+        if change is None:
+            # A job: show why it failed
+            job = item.data(0, Qt.UserRole + 1)
+            self.diff_view.setPlainText(job.log if not job.ok else "")
+            return
+        try:
+            text = change.diff()
+        except OSError as e:
+            text = f"Could not read {change.path}: {e}"
+        self.diff_view.setPlainText(text or "No changes")
+
+    def apply_changes(self):
+        try:
+            self.pipeline.apply(self.jobs)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not write the generated files: {e}")
+            return
+        written = sum(len(job.written_files) for job in self.jobs)
+        QMessageBox.information(self, "Success", f"{written} generated files written.")
+        self.accept()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                            QPushButton, QPlainTextEdit)
+from PyQt5.QtGui import QFont
+
+
+class GenerationLogDock(QDockWidget):
+    """Dockable panel showing the output of running generators as it arrives
+
+    Lines are collected and appended in batches by a timer, so a chatty
+    generator cannot flood the event loop. Cancel stops the pipeline
+    the panel is attached to.
+    """
+
+    # Lines kept in the view; older lines are dropped
+    MAX_LINES = 20000
+    # Milliseconds between two updates of the view
+    FLUSH_INTERVAL = 100
+
+    def __init__(self, parent=None):
+        super(GenerationLogDock, self).__init__("Generation Log", parent)
+        self.setObjectName("generationLogDock")
+        self.pipeline = None
+        self._pending = []
+
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        header_layout = QHBoxLayout()
+        self.status_label = QLabel("Idle")
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.clear_button = QPushButton("Clear")
+        header_layout.addWidget(self.status_label)
+        header_layout.addStretch()
+        header_layout.addWidget(self.cancel_button)
+        header_layout.addWidget(self.clear_button)
+        layout.addLayout(header_layout)
+
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(self.MAX_LINES)
+        self.log_view.setFont(QFont("Courier New", 9))
+        layout.addWidget(self.log_view)
+        self.setWidget(widget)
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
+
+        self.cancel_button.clicked.connect(self.cancel)
+        self.clear_button.clicked.connect(self.log_view.clear)
+
+    @property
+    def running(self):
+        return self.pipeline is not None
+
+    def start(self, title, pipeline):
+        """Show the panel for a new generation run of pipeline"""
+        self.pipeline = pipeline
+        self.cancel_button.setEnabled(True)
+        self.status_label.setText(f"Running: {title}")
+        self.append(f"===== {title} =====")
+        self._flush_timer.start()
+        self.show()
+        self.raise_()
+
+    def append(self, text):
+        """Queue text for the view; one or more lines, without the trailing newline"""
+        self._pending.append(text)
+
+    def append_output(self, job, stream, line):
+        line = line.rstrip("\n")
+        self.append(f"[{job.label}] {line}" if stream == "stdout" else f"[{job.label}] stderr: {line}")
+
+    def flush(self):
+        if self._pending:
+            text, self._pending = "\n".join(self._pending), []
+            self.log_view.appendPlainText(text)
+
+    def finish(self, status):
+        """Mark the current run as done"""
+        self.flush()
+        self._flush_timer.stop()
+        self.pipeline = None
+        self.cancel_button.setEnabled(False)
+        self.status_label.setText(status)
+
+    def cancel(self):
+        if self.pipeline is not None:
+            self.pipeline.cancel()
+            self.append("Cancelling: running generators are stopped, queued ones are skipped")
@@ -0,0 +1,314 @@
+import os
+import time
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Modules import SignalMgrCore, ExcelExport
+from Modules.ProcessRunner import format_memory
+from Modules.GenerationCache import (GenerationCache, tables_digest, scripts_digest,
+                                     job_key, job_fingerprint)
+
+# Generator scripts running at the same time; each job is its own process
+DEFAULT_MAX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+
+class GenerationJob:
+    """One generator target for one board"""
+
+    def __init__(self, target, board_name, output_dir, variant=None):
+        # GeneratorTarget to run; self.target is its name
+        self.generator = target
+        self.target = target.name
+        self.board_name = board_name
+        self.output_dir = output_dir
+        # (SoC, build type) of a matrix cell; None for the project's own
+        self.variant = variant
+        self.result = None
+        self.error = None
+        self.elapsed = None
+        # Set when the cache showed the outputs are up to date and nothing ran
+        self.skipped = False
+        self.written_files = []
+        self.unchanged_files = []
+        # Dry runs: FileChange per generated file, and the fingerprint to record on apply
+        self.changes = []
+        self.fingerprint = None
+
+    @property
+    def cell(self):
+        """Board, SoC and build type the job generates for, as text"""
+        if self.variant is None:
+            return self.board_name
+        return f"{self.board_name}, {self.variant[0]}/{self.variant[1]}"
+
+    @property
+    def label(self):
+        return f"{self.generator.display_name} [{self.cell}]"
+
+    @property
+    def ok(self):
+        if self.error is not None:
+            return False
+        return self.skipped or (self.result is not None and self.result.ok)
+
+    @property
+    def status(self):
+        if self.error == "Cancelled" or (self.result is not None and self.result.cancelled):
+            return "Cancelled"
+        if self.result is not None and self.result.timed_out:
+            return "Timed out"
+        if self.skipped:
+            return "Up to date"
+        return "Done" if self.ok else "Failed"
+
+    @property
+    def peak_memory(self):
+        """Peak memory of the generator process in bytes, None if unknown"""
+        return self.result.peak_memory if self.result is not None else None
+
+    @property
+    def statistics(self):
+        """Wall-clock time and peak memory of the job as text"""
+        if self.elapsed is None:
+            return ""
+        if self.peak_memory is None:
+            return f"{self.elapsed:.2f}s"
+        return f"{self.elapsed:.2f}s, peak {format_memory(self.peak_memory)}"
+
+    @property
+    def log(self):
+        """Combined generator output, or the error that kept the job from running"""
+        if self.error is not None:
+            return self.error
+        if self.result is None:
+            return ""
+        return (self.result.stdout or "") + (self.result.stderr or "")
+
+
+def plan_jobs(targets, boards, output_root):
+    """Return the jobs for every target x board
+
+    targets are GeneratorTarget objects, see GeneratorRegistry. With a single board the output goes straight to output_root, otherwise
+    every board gets its own subdirectory.
+    """
+    jobs = []
+    for board_name in boards:
+        output_dir = output_root if len(boards) == 1 else os.path.join(output_root, board_name)
+        for target in targets:
+            jobs.append(GenerationJob(target, board_name, output_dir))
+    return jobs
+
+
+def plan_matrix(targets, boards, socs, builds, output_root):
+    """Return the jobs for every target x board x SoC x build type
+
+    Each cell generates into output_root/<SoC>/<build type>/<board>, from a
+    generator input whose Config sheet names that SoC and build type.
+    """
+    jobs = []
+    for soc in socs:
+        for build in builds:
+            for board_name in boards:
+                output_dir = os.path.join(output_root, soc, build, board_name)
+                for target in targets:
+                    jobs.append(GenerationJob(target, board_name, output_dir, (soc, build)))
+    return jobs
+
+
+def matrix_summary(jobs):
+    """Return one dict per matrix cell with the outcome and timings of its jobs
+
+    elapsed is the summed generator time of the cell and peak_memory the
+    largest peak of its generators (None if unknown).
+    """
+    cells = {}
+    for job in jobs:
+        soc, build = job.variant or ("", "")
+        cell = cells.setdefault((soc, build, job.board_name), {
+            "soc": soc, "build": build, "board": job.board_name, "output_dir": job.output_dir,
+            "jobs": 0, "failed": 0, "up_to_date": 0, "elapsed": 0.0, "peak_memory": None,
+            "generators": {},
+        })
+        cell["jobs"] += 1
+        cell["failed"] += 0 if job.ok else 1
+        cell["up_to_date"] += 1 if job.skipped else 0
+        cell["elapsed"] += job.elapsed or 0.0
+        if job.peak_memory is not None:
+            cell["peak_memory"] = max(cell["peak_memory"] or 0, job.peak_memory)
+        cell["generators"][job.target] = {"status": job.status, "elapsed": job.elapsed,
+                                          "peak_memory": job.peak_memory}
+    return list(cells.values())
+
+
+class GenerationPipeline:
+    """Run several generator jobs on one shared export of the project
+
+    The generator input is exported once into output_root and handed to
+    every job; matrix jobs (see plan_matrix) get one input per SoC and
+    build type, built from the same tables. Jobs then run as separate generator processes, at most
+    max_workers at a time; the pool threads only wait for those processes.
+
+    Jobs whose inputs did not change since the last run are skipped, and
+    only output files with new content are rewritten (see GenerationCache).
+    force=True runs every job regardless. With a runner (a
+    GeneratorRuntime.WorkerPool) the scripts run in warm worker processes.
+    A generator still running after timeout seconds is killed, as are the
+    running ones on cancel().
+
+    A dry run generates into a temporary directory and only compares the
+    result with the output directory (job.changes); apply() then writes
+    the changed files without running the generators again.
+    """
+
+    def __init__(self, data, script_directory, output_root, python_cmd=None,
+                 max_workers=DEFAULT_MAX_WORKERS, input_format=None, force=False, runner=None,
+                 timeout=None, dry_run=False):
+        self.data = data
+        self.script_directory = script_directory
+        self.output_root = output_root
+        self.python_cmd = python_cmd
+        self.max_workers = max(1, max_workers)
+        self.input_format = input_format or SignalMgrCore.generator_input_format(data)
+        self.force = force
+        self.runner = runner
+        self.timeout = timeout or None
+        self.dry_run = dry_run
+        self._preview_dir = None
+        self.input_path = None
+        self.cache = None
+        self._sheets = None
+        # variant -> (input path, digest of its tables)
+        self._inputs = {}
+        self._input_digest = None
+        self._script_digest = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop the running generators and skip the jobs that have not started yet"""
+        self._cancelled.set()
+
+    def prepare(self, jobs=()):
+        """Export the generator inputs of jobs, or the shared one if there are none
+
+        The tables are built once; the inputs of matrix cells only differ in
+        their Config table. A file is only rewritten when its tables changed.
+        Returns the path of the shared input, if it was exported.
+        """
+        if self.cache is None:
+            self.cache = GenerationCache(self.output_root)
+            self._sheets = ExcelExport.workbook_tables(self.data)
+            self._input_digest = tables_digest(self._sheets)
+            self._script_digest = scripts_digest(self.script_directory)
+            if self.dry_run:
+                # Nothing is written to the output directory before apply()
+                self._preview_dir = tempfile.mkdtemp(prefix="signalmgr-preview-")
+
+        for variant in {job.variant for job in jobs} or {None}:
+            if variant not in self._inputs:
+                self._inputs[variant] = self._export_input(variant)
+        if None in self._inputs:
+            self.input_path = self._inputs[None][0]
+        return self.input_path
+
+    def _export_input(self, variant):
+        """Write the generator input of a variant; returns (path, digest)"""
+        data, sheets, digest, directory = self.data, self._sheets, self._input_digest, self.output_root
+        if variant is not None:
+            soc, build = variant
+            data = dict(self.data, soc_type=soc, build_type=build)
+            config = ExcelExport.config_tables(data)
+            sheets = dict(self._sheets, Config=config)
+            # The shared tables are already hashed; only add the Config table
+            digest = tables_digest({"tables": self._input_digest, "Config": config})
+            directory = os.path.join(self.output_root, soc, build)
+
+        if self.dry_run:
+            directory = os.path.join(self._preview_dir, *variant) if variant else self._preview_dir
+            return SignalMgrCore.export_generator_input(data, directory, self.input_format, sheets), digest
+
+        input_path = SignalMgrCore.generator_input_path(data, directory, self.input_format)
+        if self.force or not self.cache.input_is_current(input_path, digest):
+            SignalMgrCore.export_generator_input(data, directory, self.input_format, sheets)
+            self.cache.record_input(input_path, digest)
+        return input_path, digest
+
+    def fingerprint(self, job):
+        """Return the fingerprint of a job's inputs; prepare() must have run for it"""
+        api_config = self.data.get("project_specific", {}).get("api_config", {})
+        return job_fingerprint(self._inputs[job.variant][1], self.input_format, job.target, job.board_name,
+                               self._script_digest, api_config)
+
+    def run(self, jobs, on_started=None, on_finished=None, on_output=None):
+        """Run jobs and return them with their results filled in
+
+        on_started(job), on_finished(job) and on_output(job, stream, line),
+        for every line a generator prints, are called from worker threads.
+        Raises SignalMgrError before anything runs if a job cannot be started.
+        """
+        for job in jobs:
+            SignalMgrCore.check_generation_inputs(job.generator, self.script_directory,
+                                                  job.board_name, job.output_dir, self.input_format)
+        self.prepare(jobs)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for job in jobs:
+                    pool.submit(self._run_job, job, on_started, on_finished, on_output)
+        finally:
+            if self.dry_run:
+                shutil.rmtree(self._preview_dir, ignore_errors=True)
+            else:
+                self.cache.save()
+        return jobs
+
+    def apply(self, jobs):
+        """Write the changes found by a dry run into the output directories"""
+        for job in jobs:
+            if job.ok and not job.skipped:
+                key = job_key(job.target, job.board_name, job.output_dir, self.output_root)
+                job.written_files, job.unchanged_files = self.cache.apply(key, job.fingerprint, job.changes)
+        self.cache.save()
+        return jobs
+
+    def _run_job(self, job, on_started, on_finished, on_output):
+        if self._cancelled.is_set():
+            job.error = "Cancelled"
+        else:
+            if on_started:
+                on_started(job)
+            start = time.perf_counter()
+            try:
+                self._generate(job, on_output)
+            except Exception as e:
+                job.error = str(e)
+            job.elapsed = time.perf_counter() - start
+        if on_finished:
+            on_finished(job)
+
+    def _generate(self, job, on_output):
+        key = job_key(job.target, job.board_name, job.output_dir, self.output_root)
+        fingerprint = self.fingerprint(job)
+        if not self.force and self.cache.is_current(key, fingerprint):
+            job.skipped = True
+            return
+
+        # Generate into a staging directory; a failed run leaves the output untouched
+        staging_dir = self.cache.staging_directory(key, self._preview_dir)
+        try:
+            output = (lambda stream, line: on_output(job, stream, line)) if on_output else None
+            input_path = self._inputs[job.variant][0]
+            job.result = SignalMgrCore.run_generator(job.generator, input_path, self.script_directory,
+                                                     job.board_name, staging_dir, self.python_cmd,
+                                                     self.runner, output, self.timeout, self._cancelled)
+            if job.result.ok and self.dry_run:
+                job.changes = self.cache.compare(staging_dir, job.output_dir)
+                job.fingerprint = fingerprint
+            elif job.result.ok:
+                job.written_files, job.unchanged_files = self.cache.commit(
+                    key, fingerprint, staging_dir, job.output_dir)
+            elif not self.dry_run:
+                self.cache.forget(key)
+        finally:
+            self.cache.discard_staging(staging_dir)
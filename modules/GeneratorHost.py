@@ -0,0 +1,148 @@
+"""Warm worker process for the generator scripts
+
+Started by GeneratorRuntime.WarmWorker with the generator interpreter and
+kept running between generations. Each request is one JSON line on stdin:
+
+    {"script": "/path/to/main.py", "args": ["-f", "...", "-i", "SigM", ...]}
+
+The script is run as __main__ with those arguments. Every line it prints
+is sent as it is written, then the returncode ends the answer:
+
+    {"stream": "stdout", "text": "Generating ...\n"}
+    {"returncode": 0}
+
+Modules the script
+imports (pandas, openpyxl, ...) stay loaded, so only the first request
+pays for the imports. Modules from the script directory are reloaded
+when one of its files changed.
+
+Only the standard library is used here: the generator interpreter does
+not have the Signal Manager modules on its path.
+"""
+import io
+import os
+import sys
+import json
+import runpy
+import threading
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+
+
+def _script_state(script_directory):
+    """Return {path: mtime} of the .py files below script_directory"""
+    state = {}
+    for root, dirs, files in os.walk(script_directory):
+        dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+        for name in files:
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                try:
+                    state[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    pass
+    return state
+
+
+def _forget_modules(script_directory):
+    """Drop the modules loaded from script_directory so they are imported again"""
+    prefix = os.path.normcase(os.path.abspath(script_directory)) + os.sep
+    for name, module in list(sys.modules.items()):
+        file_name = getattr(module, "__file__", None)
+        if file_name and os.path.normcase(os.path.abspath(file_name)).startswith(prefix):
+            del sys.modules[name]
+
+
+class _LineWriter(io.TextIOBase):
+    """File object passing every complete line written to it to emit(stream, line)"""
+
+    def __init__(self, stream, emit):
+        self.stream = stream
+        self.emit = emit
+        self._partial = ""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        *lines, self._partial = (self._partial + text).split("\n")
+        for line in lines:
+            self.emit(self.stream, line + "\n")
+        return len(text)
+
+    def finish(self):
+        """Send a last line without a newline"""
+        if self._partial:
+            self.emit(self.stream, self._partial)
+            self._partial = ""
+
+
+def run_script(script_path, args, emit):
+    """Run a generator script as __main__, passing its output to emit(stream, line); returns its returncode"""
+    stdout, stderr = _LineWriter("stdout", emit), _LineWriter("stderr", emit)
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.argv = [script_path] + list(args)
+    sys.path.insert(0, os.path.dirname(script_path))
+    returncode = 0
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+            except SystemExit as e:
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except BaseException:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        stdout.finish()
+        stderr.finish()
+    return returncode
+
+
+def main():
+    # Answers go to the original stdout; anything written to file descriptor 1
+    # by the scripts or their child processes is sent to stderr instead
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    protocol_lock = threading.Lock()
+
+    def send(message):
+        # Scripts may print from several threads
+        with protocol_lock:
+            protocol.write(json.dumps(message) + "\n")
+            protocol.flush()
+
+    def emit(stream, text):
+        send({"stream": stream, "text": text})
+
+    script_states = {}
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            script_path = request["script"]
+            script_directory = os.path.dirname(script_path)
+            state = _script_state(script_directory)
+            if script_states.get(script_directory, state) != state:
+                _forget_modules(script_directory)
+            script_states[script_directory] = state
+
+            returncode = run_script(script_path, request.get("args", []), emit)
+        except Exception:
+            emit("stderr", traceback.format_exc())
+            returncode = 1
+        send({"returncode": returncode})
+
+
+if __name__ == "__main__":
+    main()
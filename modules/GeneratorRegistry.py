@@ -0,0 +1,243 @@
+"""Code generator targets: built in, from the script directory and from entry points
+
+A generator plugin is a Python module with a GENERATOR declaration:
+
+    GENERATOR = {
+        "name": "diag_mgr",              # target name, e.g. for signalmgr generate -t
+        "display_name": "Diagnostic Manager",
+        "input_id": "DiagM",             # passed to the script with -i
+        "script": "main.py",             # run with the generator interpreter, relative
+                                         # to the script directory (default: main.py)
+        "inputs": ["excel", "json"],     # generator input formats it reads (default: all)
+    }
+
+and optionally arguments(input_path, input_id, board_name, output_dir) returning
+the script arguments, when the default -f/-i/-B/-O ones do not fit.
+
+Plugins are the .py files in the "generators" directory below the script
+directory and the modules named by "signalmgr.generators" entry points. The
+declaration is read from the source without importing the module, so a
+plugin costs a directory listing until its target runs; the module is only
+imported then, and only if the run needs its arguments() hook.
+"""
+import os
+import ast
+import threading
+import importlib.util
+
+# Directory below the script directory holding generator plugins
+PLUGIN_DIR = "generators"
+# Entry point group of installed generator plugins
+ENTRY_POINT_GROUP = "signalmgr.generators"
+# Name of the declaration in a plugin module
+DECLARATION = "GENERATOR"
+
+# Targets handled by the generator scripts shipped with every project;
+# action is the menu action of the main window that runs them
+BUILTIN_TARGETS = (
+    {"name": "signal_mgr", "display_name": "Signal Manager", "input_id": "SigM",
+     "action": "actionSignalMgr"},
+    {"name": "ipc_manager", "display_name": "IpcManager", "input_id": "IPC",
+     "action": "actionIpcManager"},
+    {"name": "ipc_eth_mgr", "display_name": "IPC over Ethernet Manager", "input_id": "IpcOvEth",
+     "action": "actionIpcOvEthMgr"},
+)
+
+_lock = threading.Lock()
+_registries = {}
+_entry_point_targets = None
+
+
+class GeneratorTarget:
+    """One code generator the user can select"""
+
+    def __init__(self, name, display_name=None, input_id=None, script=None, inputs=None,
+                 action=None, source=None, has_arguments=False):
+        self.name = name
+        self.display_name = display_name or name
+        self.input_id = input_id or name
+        # Script run by the generator interpreter; None for the script directory's main.py
+        self.script = script
+        # Generator input formats the script reads; None for all of them
+        self.inputs = tuple(inputs) if inputs else None
+        # objectName of the main window action running this target, if it has one
+        self.action = action
+        # Plugin module file the target was declared in; None for built-in targets
+        self.source = source
+        # Whether the plugin module defines arguments(); it is only imported then
+        self.has_arguments = has_arguments
+        self._module = None
+
+    def __repr__(self):
+        return f"GeneratorTarget({self.name!r})"
+
+    def accepts(self, input_format):
+        return self.inputs is None or input_format in self.inputs
+
+    def script_path(self, script_directory, default_script):
+        script = self.script or default_script
+        return script if os.path.isabs(script) else os.path.join(script_directory, script)
+
+    def arguments(self, input_path, board_name, output_dir):
+        """Return the arguments of the generator script for one run"""
+        if self.has_arguments:
+            module = self._load()
+            return [str(arg) for arg in module.arguments(input_path, self.input_id, board_name, output_dir)]
+        return ["-f", input_path, "-i", self.input_id, "-B", board_name, "-O", output_dir]
+
+    def _load(self):
+        """Import the plugin module the first time it is needed"""
+        if self._module is None:
+            module_name = f"signalmgr_generator_{self.name}"
+            spec = importlib.util.spec_from_file_location(module_name, self.source)
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+            except (Exception, SystemExit) as e:
+                raise RuntimeError(f"Could not load generator plugin {self.source}: {e}") from e
+            self._module = module
+        return self._module
+
+
+def read_declaration(path):
+    """Return the GENERATOR dict of a plugin file without importing it, or None
+
+    The dict gets a "has_arguments" entry telling whether the module
+    defines an arguments() function.
+    """
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"Skipping generator plugin {path}: {e}")
+        return None
+    declaration = None
+    has_arguments = False
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "arguments":
+            has_arguments = True
+        elif (declaration is None and isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == DECLARATION):
+            try:
+                declaration = ast.literal_eval(node.value)
+            except ValueError:
+                declaration = False
+    if not isinstance(declaration, dict) or not declaration.get("name"):
+        print(f"Skipping generator plugin {path}: no {DECLARATION} declaration with a name")
+        return None
+    return dict(declaration, has_arguments=has_arguments)
+
+
+def _target_from_declaration(declaration, source=None):
+    return GeneratorTarget(declaration["name"], declaration.get("display_name"),
+                           declaration.get("input_id"), declaration.get("script"),
+                           declaration.get("inputs"), declaration.get("action"), source,
+                           declaration.get("has_arguments", False))
+
+
+def _entry_points():
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=ENTRY_POINT_GROUP))
+    return list(entry_points.get(ENTRY_POINT_GROUP, []))
+
+
+def entry_point_targets():
+    """Return the targets of installed plugins; looked up once per session"""
+    global _entry_point_targets
+    with _lock:
+        if _entry_point_targets is None:
+            targets = []
+            try:
+                entry_points = _entry_points()
+            except Exception as e:
+                print(f"Could not read generator entry points: {e}")
+                entry_points = []
+            for entry_point in entry_points:
+                module_name = entry_point.value.split(":")[0]
+                try:
+                    spec = importlib.util.find_spec(module_name)
+                except (ImportError, ValueError):
+                    spec = None
+                if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+                    print(f"Skipping generator entry point {entry_point.name}: {module_name} not found")
+                    continue
+                declaration = read_declaration(spec.origin)
+                if declaration is not None:
+                    targets.append(_target_from_declaration(declaration, spec.origin))
+            _entry_point_targets = targets
+        return list(_entry_point_targets)
+
+
+def _plugin_state(plugin_dir):
+    """Return a tuple that changes whenever a plugin file is added, removed or edited"""
+    try:
+        names = sorted(name for name in os.listdir(plugin_dir)
+                       if name.endswith(".py") and not name.startswith(("_", ".")))
+    except OSError:
+        return ()
+    state = []
+    for name in names:
+        try:
+            state.append((name, os.stat(os.path.join(plugin_dir, name)).st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(state)
+
+
+class GeneratorRegistry:
+    """The targets available for one script directory, in menu order"""
+
+    def __init__(self, targets):
+        self._targets = {}
+        for target in targets:
+            # Plugins may replace a built-in target of the same name
+            previous = self._targets.get(target.name)
+            if previous is not None and target.action is None:
+                target.action = previous.action
+            self._targets[target.name] = target
+
+    def __contains__(self, name):
+        return name in self._targets
+
+    def __iter__(self):
+        return iter(self._targets.values())
+
+    def __len__(self):
+        return len(self._targets)
+
+    def names(self):
+        return list(self._targets)
+
+    def get(self, name):
+        """Return the target called name, or None"""
+        return self._targets.get(name)
+
+
+def builtin_targets():
+    return [_target_from_declaration(declaration) for declaration in BUILTIN_TARGETS]
+
+
+def load(script_directory=None):
+    """Return the registry for script_directory
+
+    The plugin directory is read again only when its files changed.
+    """
+    plugin_dir = os.path.join(script_directory, PLUGIN_DIR) if script_directory else None
+    state = _plugin_state(plugin_dir) if plugin_dir else ()
+    with _lock:
+        cached = _registries.get(plugin_dir)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+    targets = builtin_targets() + entry_point_targets()
+    for name, _ in state:
+        path = os.path.join(plugin_dir, name)
+        declaration = read_declaration(path)
+        if declaration is not None:
+            targets.append(_target_from_declaration(declaration, path))
+    registry = GeneratorRegistry(targets)
+    with _lock:
+        _registries[plugin_dir] = (state, registry)
+    return registry
@@ -0,0 +1,234 @@
+"""Interpreter discovery and warm worker processes for the generator scripts
+
+resolve_python() finds the interpreter for the generator scripts without
+starting any process in the common case and remembers it for the rest of
+the session. The main window also stores it in the project settings.
+
+WorkerPool keeps GeneratorHost processes running between generations, so
+the imports of the generator scripts are paid once per session instead of
+once per generation. Like ProcessRunner.run_streaming, a run streams the
+output lines as they are printed and kills the worker on timeout or
+cancel; the next run starts a fresh one.
+"""
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import threading
+import subprocess
+
+from Modules.ProcessRunner import ProcessResult, POLL_INTERVAL
+
+# Interpreters tried, in order, when sys.executable cannot be used
+PYTHON_CANDIDATES = ("python", "python3")
+
+
+def _host_script():
+    # Packaged builds ship the modules directory as data next to the executable
+    if getattr(sys, "frozen", False):
+        return os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(sys.executable)),
+                            "modules", "GeneratorHost.py")
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "GeneratorHost.py")
+
+
+# Script run by the warm workers
+HOST_SCRIPT = _host_script()
+
+_resolved = {}
+_resolved_lock = threading.Lock()
+
+
+def runtime_settings(data):
+    """Return the generator runtime settings stored in a project"""
+    return data.get("project_specific", {}).get("generator_runtime", {})
+
+
+def _usable(python_cmd):
+    """Return the full path of python_cmd if it can be started, without starting it"""
+    if not python_cmd:
+        return None
+    if os.path.isabs(python_cmd):
+        return python_cmd if os.path.isfile(python_cmd) and os.access(python_cmd, os.X_OK) else None
+    return shutil.which(python_cmd)
+
+
+def _answers_version(python_cmd):
+    try:
+        result = subprocess.run([python_cmd, "--version"], capture_output=True, text=True)
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def resolve_python(configured=None):
+    """Return the interpreter for the generator scripts, or None if there is none
+
+    Tries the configured interpreter, then sys.executable (unless this is a
+    packaged build, where it is the application itself), then python and
+    python3 on the PATH. Only the PATH candidates are started once, with
+    --version, to skip e.g. the Windows store alias. The result is cached
+    for the session.
+    """
+    with _resolved_lock:
+        if configured in _resolved:
+            return _resolved[configured]
+
+        python_cmd = _usable(configured)
+        if python_cmd is None and sys.executable and not getattr(sys, "frozen", False):
+            python_cmd = sys.executable
+        if python_cmd is None:
+            for candidate in PYTHON_CANDIDATES:
+                path = _usable(candidate)
+                if path and _answers_version(path):
+                    python_cmd = path
+                    break
+
+        _resolved[configured] = python_cmd
+        return python_cmd
+
+
+def forget_resolved():
+    """Resolve the interpreter again on the next call, e.g. after it was uninstalled"""
+    with _resolved_lock:
+        _resolved.clear()
+
+
+def _read_messages(stream, messages):
+    """Queue the protocol lines of a worker, then None once it exits"""
+    for line in iter(stream.readline, ""):
+        messages.put(line)
+    messages.put(None)
+
+
+class WarmWorker:
+    """One GeneratorHost process serving generation requests one at a time"""
+
+    def __init__(self, python_cmd):
+        self.python_cmd = python_cmd
+        self.process = None
+        self._messages = None
+
+    def _start(self):
+        self.process = subprocess.Popen(
+            [self.python_cmd, "-u", HOST_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8")
+        # A reader thread, so waiting for the answer can time out on every platform
+        self._messages = queue.Queue()
+        threading.Thread(target=_read_messages, args=(self.process.stdout, self._messages),
+                         daemon=True).start()
+
+    def run(self, script_path, args, on_output=None, timeout=None, cancel_event=None):
+        """Run a generator script in the worker; returns a ProcessResult
+
+        Output lines are passed to on_output(stream, line) as the script
+        prints them. The worker is killed after timeout seconds or once
+        cancel_event is set.
+        """
+        request = json.dumps({"script": script_path, "args": list(args)}) + "\n"
+        start = time.perf_counter()
+        output = {"stdout": [], "stderr": []}
+        for attempt in range(2):
+            if self.process is None or self.process.poll() is not None:
+                self._start()
+            try:
+                self.process.stdin.write(request)
+                self.process.stdin.flush()
+            except OSError:
+                self.kill()
+                continue
+
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return self._stopped(output, start, cancelled=True)
+                if timeout and time.perf_counter() - start > timeout:
+                    return self._stopped(output, start, timed_out=True)
+                try:
+                    line = self._messages.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    break
+                message = json.loads(line)
+                if "returncode" in message:
+                    return ProcessResult(message["returncode"], "".join(output["stdout"]),
+                                         "".join(output["stderr"]), time.perf_counter() - start)
+                output[message["stream"]].append(message["text"])
+                if on_output:
+                    on_output(message["stream"], message["text"])
+
+            # The worker died, e.g. a script called os._exit(); start a fresh one,
+            # unless the script already ran far enough to print something
+            self.kill()
+            if output["stdout"] or output["stderr"]:
+                break
+        output["stderr"].append("Generator worker process exited unexpectedly\n")
+        return ProcessResult(1, "".join(output["stdout"]), "".join(output["stderr"]),
+                             time.perf_counter() - start)
+
+    def _stopped(self, output, start, timed_out=False, cancelled=False):
+        returncode = self.kill()
+        return ProcessResult(returncode, "".join(output["stdout"]), "".join(output["stderr"]),
+                             time.perf_counter() - start, timed_out=timed_out, cancelled=cancelled)
+
+    def kill(self):
+        """Stop the worker process right away; returns its returncode"""
+        returncode = None
+        if self.process is not None:
+            self.process.kill()
+            returncode = self.process.wait()
+            self.process.stdin.close()
+            self.process = None
+        return returncode
+
+    def close(self):
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+            self.process = None
+
+
+class WorkerPool:
+    """Up to size warm workers shared by the generation jobs of a session
+
+    run() has the signature SignalMgrCore.run_generator expects from a
+    runner; it blocks while all workers are busy.
+    """
+
+    def __init__(self, python_cmd, size=1):
+        self.python_cmd = python_cmd
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._workers) < self.size:
+                worker = WarmWorker(self.python_cmd)
+                self._workers.append(worker)
+                return worker
+        return self._idle.get()
+
+    def run(self, script_path, args, on_output=None, timeout=None, cancel_event=None):
+        worker = self._acquire()
+        try:
+            return worker.run(script_path, args, on_output, timeout, cancel_event)
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        """Stop all worker processes"""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
@@ -0,0 +1,343 @@
+"""C header and source emitter for the signals of a project
+
+Runs in-process, without the generator scripts. Every signal gets an
+extern variable and Get_/Set_ accessors; STRUCT, ARRAY, STRING and ENUM
+signals also get a <name>_t typedef. The output is produced by filling
+the templates below and is streamed to the file one chunk per signal, so
+even very large projects are never held in memory as a single string.
+"""
+import os
+import re
+import datetime
+from functools import lru_cache
+
+# Signal and field data types -> AUTOSAR style C types
+BASE_TYPES = {
+    "INT8": "sint8", "UINT8": "uint8",
+    "INT16": "sint16", "UINT16": "uint16",
+    "INT32": "sint32", "UINT32": "uint32",
+    "INT64": "sint64", "UINT64": "uint64",
+    "FLOAT32": "float32", "FLOAT64": "float64",
+    "BOOLEAN": "bool_t", "BOOL": "bool_t", "CHAR": "char_t",
+}
+C_TYPES = frozenset(BASE_TYPES.values())
+
+# Length of STRING signals and fields, including the terminating NUL
+STRING_LENGTH = 64
+
+# Storage of ENUM<1Byte> and ENUM<4Bytes> signals
+ENUM_STORAGE = {1: "uint8", 4: "uint32"}
+
+_ARRAY_OF = re.compile(r"^ARRAY\s*\[\s*(\d+)\s*\]\s*OF\s+(\w+)$", re.IGNORECASE)  # ARRAY[10] OF UINT8
+_ARRAY_OF_SIZE = re.compile(r"^ARRAY\s*\[\s*(\w+)\s*\]\s*\[\s*(\d+)\s*\]$", re.IGNORECASE)  # Array[uint8][10]
+_ENUM = re.compile(r"^ENUM\s*<\s*(\d)\s*BYTES?\s*>\s*(?:\(\s*(\w+)\s*\))?$", re.IGNORECASE)  # ENUM<4Byte>(Name)
+_NOT_IDENTIFIER = re.compile(r"\W")
+
+HEADER_PROLOGUE = """\
+/**
+ * @file {file_name}
+ * @brief Signal definitions generated by Signal Manager
+ * @date {date}
+ */
+
+#ifndef {guard}
+#define {guard}
+
+#include <stdint.h>
+#include <stdbool.h>
+
+/* Automotive data type definitions */
+typedef unsigned char uint8;
+typedef unsigned short uint16;
+typedef unsigned int uint32;
+typedef unsigned long long uint64;
+typedef signed char sint8;
+typedef signed short sint16;
+typedef signed int sint32;
+typedef signed long long sint64;
+typedef float float32;
+typedef double float64;
+typedef char char_t;
+typedef unsigned char bool_t;
+
+/* Number of signals */
+#define SIGNAL_COUNT {signal_count}u
+"""
+HEADER_EPILOGUE = "\n#endif /* {guard} */\n"
+
+SECTION_TEMPLATE = "\n/* {title} */\n"
+ENUM_TEMPLATE = "typedef enum {{\n{entries}    {name}_MAX\n}} {name}_t;\n\n"
+ENUM_STORAGE_TEMPLATE = "enum {{\n{entries}    {name}_MAX\n}};\ntypedef {storage} {name}_t;\n\n"
+# Enumerators share one scope in C, so entries carry their enum name like <name>_MAX
+ENUM_ENTRY_TEMPLATE = "    {name}_{entry} = {value},\n"
+STRUCT_TEMPLATE = "typedef struct {{\n{fields}}} {name}_t;\n\n"
+FIELD_TEMPLATE = "    {type} {name}{dimension};\n"
+UNSUPPORTED_FIELD_TEMPLATE = "    /* {name}: {type} has no definition */\n"
+ARRAY_TEMPLATE = "typedef {type} {name}_t{dimension};\n"
+EXTERN_TEMPLATE = "extern {type} {name};\n"
+INIT_TEMPLATE = "#define {name}_INIT_VALUE {value}\n"
+ACCESSOR_DECLARATION_TEMPLATE = "void Get_{name}({type}* value);\nvoid Set_{name}(const {type}* value);\n"
+
+SOURCE_PROLOGUE = """\
+/**
+ * @file {file_name}
+ * @brief Signal storage and accessors generated by Signal Manager
+ * @date {date}
+ */
+
+#include <string.h>
+#include "{header_name}"
+
+/* Signal storage */
+"""
+DEFINITION_TEMPLATE = "{type} {name} = {init};\n"
+SCALAR_ACCESSOR_TEMPLATE = """
+void Get_{name}({type}* value)
+{{
+    *value = {name};
+}}
+
+void Set_{name}(const {type}* value)
+{{
+    {name} = *value;
+}}
+"""
+AGGREGATE_ACCESSOR_TEMPLATE = """
+void Get_{name}({type}* value)
+{{
+    (void)memcpy(value, &{name}, sizeof({type}));
+}}
+
+void Set_{name}(const {type}* value)
+{{
+    (void)memcpy(&{name}, value, sizeof({type}));
+}}
+"""
+
+
+def c_identifier(name):
+    """Return name with every character that C does not allow replaced by '_'"""
+    name = str(name)
+    if name.isidentifier() and name.isascii():
+        return name
+    name = _NOT_IDENTIFIER.sub("_", name)
+    return "_" + name if not name or name[0].isdigit() else name
+
+
+def base_type(type_text):
+    """Return the C type of a scalar data type, or None if it is not a scalar"""
+    type_text = str(type_text).strip()
+    c_type = BASE_TYPES.get(type_text.upper())
+    if c_type is None and type_text in C_TYPES:
+        c_type = type_text
+    return c_type
+
+
+def _user_type(type_text):
+    """Return a user defined type name, e.g. a typedef from another header, or None"""
+    type_text = str(type_text).strip()
+    if not type_text or type_text.upper() in ("STRUCT", "ARRAY", "STRING") or type_text.upper().startswith("ENUM"):
+        return None
+    return type_text if c_identifier(type_text) == type_text else None
+
+
+@lru_cache(maxsize=4096)
+def field_declaration(field_name, type_text):
+    """Return (declaration, enum) for one struct field
+
+    enum is (name, size) for fields typed ENUM<n>(Name), else None. Struct
+    layouts repeat across signals, so the results are cached.
+    """
+    name = c_identifier(field_name)
+    type_text = str(type_text or "").strip()
+
+    c_type = base_type(type_text)
+    if c_type is not None:
+        return FIELD_TEMPLATE.format(type=c_type, name=name, dimension=""), None
+    match = _ARRAY_OF.match(type_text)
+    if match:
+        size, element = match.groups()
+        return _array_field(name, element, size, type_text), None
+    match = _ARRAY_OF_SIZE.match(type_text)
+    if match:
+        element, size = match.groups()
+        return _array_field(name, element, size, type_text), None
+    match = _ENUM.match(type_text)
+    if match:
+        size, enum_name = match.groups()
+        if not enum_name:
+            return FIELD_TEMPLATE.format(type=ENUM_STORAGE.get(int(size), "uint32"), name=name, dimension=""), None
+        enum_name = c_identifier(enum_name)
+        return FIELD_TEMPLATE.format(type=f"{enum_name}_t", name=name, dimension=""), (enum_name, int(size))
+    if type_text.upper() == "STRING":
+        return FIELD_TEMPLATE.format(type="char_t", name=name, dimension=f"[{STRING_LENGTH}]"), None
+
+    c_type = _user_type(type_text)
+    if c_type is None:
+        return UNSUPPORTED_FIELD_TEMPLATE.format(name=name, type=type_text or "no type"), None
+    return FIELD_TEMPLATE.format(type=c_type, name=name, dimension=""), None
+
+
+def _array_field(name, element, size, type_text):
+    c_type = base_type(element) or _user_type(element)
+    if c_type is None:
+        return UNSUPPORTED_FIELD_TEMPLATE.format(name=name, type=type_text)
+    return FIELD_TEMPLATE.format(type=c_type, name=name, dimension=f"[{size}]")
+
+
+def _enum_typedef(name, size, entries):
+    entry_text = "".join(ENUM_ENTRY_TEMPLATE.format(name=name, entry=c_identifier(entry), value=value)
+                         for value, entry in enumerate(entries))
+    if size == 1:
+        return ENUM_STORAGE_TEMPLATE.format(entries=entry_text, name=name, storage=ENUM_STORAGE[1])
+    return ENUM_TEMPLATE.format(entries=entry_text, name=name)
+
+
+class _SignalDecl:
+    """C declarations of one signal: its type, typedef and initializer"""
+
+    __slots__ = ("name", "c_type", "section", "typedef", "init", "custom_init", "aggregate", "enum_types")
+
+    def __init__(self, signal_name, signal):
+        get = signal.get
+        self.name = name = c_identifier(signal_name)
+        data_type = str(get("DataType", "INT32") or "INT32").strip()
+        upper = data_type.upper()
+
+        self.section = None
+        self.typedef = None
+        self.aggregate = True
+        self.enum_types = None
+        c_type = base_type(data_type)
+        if c_type is not None and not get("is_struct", False):
+            self.c_type = c_type
+            self.aggregate = False
+        elif get("is_struct", False) or upper == "STRUCT":
+            self.section = "struct"
+            declarations = [field_declaration(str(field_name), str((field or {}).get("type") or ""))
+                            for field_name, field in (get("struct_fields") or {}).items()]
+            fields = "".join(declaration for declaration, _ in declarations)
+            self.enum_types = {enum for _, enum in declarations if enum}
+            # C does not allow empty structs
+            self.typedef = STRUCT_TEMPLATE.format(fields=fields or "    uint8 reserved;\n", name=name)
+            self.c_type = f"{name}_t"
+        elif upper == "ARRAY" or _ARRAY_OF.match(data_type) or _ARRAY_OF_SIZE.match(data_type):
+            element, size = self._array_shape(data_type, get("array_config") or {})
+            self.section = "array"
+            self.typedef = ARRAY_TEMPLATE.format(type=element, name=name, dimension=f"[{size}]")
+            self.c_type = f"{name}_t"
+        elif upper == "STRING":
+            self.section = "array"
+            self.typedef = ARRAY_TEMPLATE.format(type="char_t", name=name, dimension=f"[{STRING_LENGTH}]")
+            self.c_type = f"{name}_t"
+        elif _ENUM.match(data_type):
+            size = int(_ENUM.match(data_type).group(1))
+            enum_config = get("enum_config") or {}
+            enum_name = c_identifier(enum_config.get("name") or name)
+            self.section = "enum"
+            self.typedef = _enum_typedef(enum_name, size, enum_config.get("entries") or [])
+            self.c_type = f"{enum_name}_t"
+            self.aggregate = False
+        else:
+            self.c_type = _user_type(data_type) or "sint32"
+            self.aggregate = False
+
+        self.custom_init = None
+        if get("InitValue") == "Custom" and str(get("CustomInitValue", "")).strip():
+            # Multi-line custom values are joined into one line for the #define
+            self.custom_init = " ".join(str(get("CustomInitValue")).split())
+        self.init = f"{name}_INIT_VALUE" if self.custom_init else ("{0}" if self.aggregate else "0")
+
+    @staticmethod
+    def _array_shape(data_type, array_config):
+        match = _ARRAY_OF.match(data_type)
+        if match:
+            return base_type(match.group(2)) or match.group(2), match.group(1)
+        match = _ARRAY_OF_SIZE.match(data_type)
+        if match:
+            return base_type(match.group(1)) or match.group(1), match.group(2)
+        element = array_config.get("base_type", "UINT8")
+        return base_type(element) or c_identifier(element), int(array_config.get("size", 1) or 1)
+
+
+def signal_declarations(signals):
+    """Return the _SignalDecl of every signal, in project order"""
+    return [_SignalDecl(signal_name, signal) for signal_name, signal in signals.items()]
+
+
+def header_guard(file_name):
+    return c_identifier(os.path.splitext(os.path.basename(file_name))[0]).upper() + "_H"
+
+
+def header_chunks(declarations, file_name, date):
+    """Yield the text of the header file, one chunk per signal and section"""
+    guard = header_guard(file_name)
+    yield HEADER_PROLOGUE.format(file_name=os.path.basename(file_name), date=date,
+                                 guard=guard, signal_count=len(declarations))
+
+    # Enums shared by several signals are defined once; enums that struct
+    # fields name without any signal defining them get their storage type
+    yield SECTION_TEMPLATE.format(title="Enumeration type definitions")
+    defined = set()
+    for decl in declarations:
+        if decl.section == "enum" and decl.c_type not in defined:
+            defined.add(decl.c_type)
+            yield decl.typedef
+    for decl in declarations:
+        for enum_name, size in sorted(decl.enum_types or ()):
+            if f"{enum_name}_t" not in defined:
+                defined.add(f"{enum_name}_t")
+                yield ARRAY_TEMPLATE.format(type=ENUM_STORAGE.get(size, "uint32"), name=enum_name, dimension="")
+
+    for section, title in (("struct", "Structure type definitions"),
+                           ("array", "Array type definitions")):
+        yield SECTION_TEMPLATE.format(title=title)
+        for decl in declarations:
+            if decl.section == section:
+                yield decl.typedef
+
+    yield SECTION_TEMPLATE.format(title="Signal declarations")
+    for decl in declarations:
+        yield EXTERN_TEMPLATE.format(type=decl.c_type, name=decl.name)
+
+    yield SECTION_TEMPLATE.format(title="Default initialization values")
+    for decl in declarations:
+        if decl.custom_init:
+            yield INIT_TEMPLATE.format(name=decl.name, value=decl.custom_init)
+
+    yield SECTION_TEMPLATE.format(title="Signal accessor function declarations")
+    for decl in declarations:
+        yield ACCESSOR_DECLARATION_TEMPLATE.format(name=decl.name, type=decl.c_type)
+
+    yield HEADER_EPILOGUE.format(guard=guard)
+
+
+def source_chunks(declarations, file_name, header_name, date):
+    """Yield the text of the source file defining the signals and their accessors"""
+    yield SOURCE_PROLOGUE.format(file_name=os.path.basename(file_name), date=date,
+                                 header_name=os.path.basename(header_name))
+    for decl in declarations:
+        yield DEFINITION_TEMPLATE.format(type=decl.c_type, name=decl.name, init=decl.init)
+    for decl in declarations:
+        template = AGGREGATE_ACCESSOR_TEMPLATE if decl.aggregate else SCALAR_ACCESSOR_TEMPLATE
+        yield template.format(name=decl.name, type=decl.c_type)
+
+
+def _write_chunks(file_path, chunks):
+    with open(file_path, "w", newline="\n") as f:
+        f.writelines(chunks)
+
+
+def write_header(signals, header_path, source_path=None, date=None):
+    """Write the header (and, if source_path is given, the source) for signals
+
+    Returns the list of files written.
+    """
+    date = date or datetime.date.today().strftime("%Y-%m-%d")
+    declarations = signal_declarations(signals)
+    _write_chunks(header_path, header_chunks(declarations, header_path, date))
+    written = [header_path]
+    if source_path:
+        _write_chunks(source_path, source_chunks(declarations, source_path, header_path, date))
+        written.append(source_path)
+    return written
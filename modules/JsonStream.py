@@ -0,0 +1,137 @@
+import json
+
+
+class JsonStreamReader:
+    """Incrementally parse a signal manager JSON file
+
+    The top level object is read in fixed size chunks. Every top level key
+    except "signals" is decoded as a whole, while the "signals" object is
+    walked entry by entry and handed out in batches, so only the current
+    chunk and the signal being decoded have to be held as text.
+    """
+
+    WHITESPACE = " \t\n\r"
+
+    def __init__(self, file_path, chunk_size=64 * 1024, batch_size=500):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._read_size = chunk_size
+
+    def iter_events(self):
+        """Yield ("section", key, value) and ("signals", batch) events in file order
+
+        Each batch is a list of (signal_name, signal_properties) tuples.
+        """
+        with open(self.file_path, 'r', encoding='utf-8') as self._file:
+            self._buf = ""
+            self._pos = 0
+            self._eof = False
+
+            self._expect("{")
+            if self._peek() == "}":
+                self._pos += 1
+                return
+
+            while True:
+                key = self._decode_value()
+                self._expect(":")
+                if key == "signals" and self._peek() == "{":
+                    yield from self._iter_signal_batches()
+                else:
+                    yield ("section", key, self._decode_value())
+
+                separator = self._next_char()
+                if separator == "}":
+                    break
+                if separator != ",":
+                    self._error(f"Expected ',' or '}}' but found {separator!r}")
+
+    def _iter_signal_batches(self):
+        """Walk the signals object and yield its entries in batches"""
+        self._expect("{")
+        batch = []
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                name = self._decode_value()
+                self._expect(":")
+                batch.append((name, self._decode_value()))
+                if len(batch) >= self.batch_size:
+                    yield ("signals", batch)
+                    batch = []
+
+                separator = self._next_char()
+                if separator == "}":
+                    break
+                if separator != ",":
+                    self._error(f"Expected ',' or '}}' but found {separator!r}")
+
+        # Always emit at least one batch so an empty signals object is still reported
+        yield ("signals", batch)
+
+    def _fill(self):
+        """Drop the consumed part of the buffer and read the next chunk"""
+        if self._eof:
+            return False
+        data = self._file.read(self._read_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Return the next non whitespace character without consuming it"""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            length = len(buf)
+            while pos < length and buf[pos] in self.WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buf[pos]
+            if not self._fill():
+                self._error("Unexpected end of file")
+
+    def _next_char(self):
+        """Consume and return the next non whitespace character"""
+        char = self._peek()
+        self._pos += 1
+        return char
+
+    def _expect(self, char):
+        found = self._next_char()
+        if found != char:
+            self._error(f"Expected {char!r} but found {found!r}")
+
+    def _decode_value(self):
+        """Decode one JSON value, reading more data until it is complete"""
+        self._peek()
+        self._read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value touching the end of the buffer may be truncated (e.g. a number)
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Grow the read size so large sections are not re-parsed chunk by chunk
+            if not self._fill():
+                self._read_size = self.chunk_size
+                continue
+            self._read_size *= 2
+
+    def _error(self, message):
+        raise json.JSONDecodeError(message, self._buf, self._pos)
@@ -0,0 +1,146 @@
+"""Run a generator process while streaming its output
+
+The output of the process is read line by line as it is produced and
+handed to a callback, so the GUI log and the command line can show it
+live. A run can be cancelled or time out, and reports its wall-clock
+time and the peak memory of the process.
+"""
+import os
+import sys
+import time
+import threading
+import subprocess
+
+# Seconds between checks for cancellation and timeout while waiting; the
+# first checks come sooner so short runs do not wait a full interval
+POLL_INTERVAL = 0.1
+FIRST_POLL_INTERVAL = 0.005
+
+
+class ProcessResult:
+    """Outcome of one process run"""
+
+    def __init__(self, returncode, stdout, stderr, elapsed, peak_memory=None,
+                 timed_out=False, cancelled=False):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.elapsed = elapsed
+        # Peak resident memory in bytes, None where the platform does not report it
+        self.peak_memory = peak_memory
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+
+
+def format_memory(size):
+    """Return a byte count as e.g. '85.2 MiB'"""
+    if size is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _read_lines(stream, name, lines, on_output):
+    for line in iter(stream.readline, ""):
+        lines.append(line)
+        if on_output:
+            on_output(name, line)
+    stream.close()
+
+
+def _windows_peak_memory(process):
+    """Return PeakWorkingSetSize of a finished process on Windows"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        if ctypes.windll.psapi.GetProcessMemoryInfo(int(process._handle), ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def _wait(process, stop):
+    """Wait until process exits or stop() returns True; returns peak memory or None
+
+    On POSIX the process is reaped with os.wait4, which also reports its
+    resource usage.
+    """
+    killed = False
+    delay = FIRST_POLL_INTERVAL
+    if hasattr(os, "wait4"):
+        while True:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                if os.WIFSIGNALED(status):
+                    process.returncode = -os.WTERMSIG(status)
+                else:
+                    process.returncode = os.WEXITSTATUS(status)
+                # ru_maxrss is in KiB on Linux and in bytes on macOS
+                return usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+            if not killed and stop():
+                process.kill()
+                killed = True
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_INTERVAL)
+
+    while True:
+        try:
+            process.wait(delay)
+            break
+        except subprocess.TimeoutExpired:
+            if not killed and stop():
+                process.kill()
+                killed = True
+            delay = min(delay * 2, POLL_INTERVAL)
+    return _windows_peak_memory(process) if sys.platform == "win32" else None
+
+
+def run_streaming(cmd, on_output=None, timeout=None, cancel_event=None):
+    """Run cmd, calling on_output(stream, line) for every line it prints
+
+    stream is "stdout" or "stderr"; the callback runs in a reader thread.
+    The process is killed when timeout seconds have passed or cancel_event
+    is set. Returns a ProcessResult with the complete output.
+    """
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    start = time.perf_counter()
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, errors="replace", env=env)
+
+    stdout, stderr = [], []
+    readers = [threading.Thread(target=_read_lines, args=(process.stdout, "stdout", stdout, on_output), daemon=True),
+               threading.Thread(target=_read_lines, args=(process.stderr, "stderr", stderr, on_output), daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    state = {"timed_out": False, "cancelled": False}
+
+    def stop():
+        if cancel_event is not None and cancel_event.is_set():
+            state["cancelled"] = True
+            return True
+        if timeout and time.perf_counter() - start > timeout:
+            state["timed_out"] = True
+            return True
+        return False
+
+    peak_memory = _wait(process, stop)
+    for reader in readers:
+        reader.join()
+    elapsed = time.perf_counter() - start
+    return ProcessResult(process.returncode, "".join(stdout), "".join(stderr), elapsed, peak_memory,
+                         state["timed_out"], state["cancelled"])
@@ -0,0 +1,165 @@
+import os
+import json
+import tempfile
+
+from Modules.SignalModel import json_default
+
+
+def atomic_write(file_path, content):
+    """Write content to file_path via a temporary file and an atomic rename
+
+    The temporary file is created in the target directory so the final
+    os.replace never crosses a filesystem boundary. If anything fails the
+    original file is left untouched.
+
+    Args:
+        file_path: Destination path
+        content: str or bytes to write
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    mode = 'wb' if isinstance(content, (bytes, bytearray)) else 'w'
+    fd, temp_path = tempfile.mkstemp(prefix=".~", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files; keep the permissions of the file being replaced
+        if os.path.exists(file_path):
+            os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ChangeTracker:
+    """Records which signals, SoCs and metadata keys changed since the last save"""
+
+    def __init__(self):
+        self.dirty_signals = set()
+        self.dirty_socs = set()
+        self.dirty_metadata = set()
+        self.all_dirty = True
+
+    def mark_signal(self, *signal_names):
+        self.dirty_signals.update(signal_names)
+
+    def mark_soc(self, *soc_names):
+        self.dirty_socs.update(soc_names)
+
+    def mark_metadata(self, *keys):
+        self.dirty_metadata.update(keys)
+
+    def mark_all(self):
+        """Invalidate everything, e.g. after the document was replaced"""
+        self.all_dirty = True
+
+    def clear(self):
+        self.dirty_signals.clear()
+        self.dirty_socs.clear()
+        self.dirty_metadata.clear()
+        self.all_dirty = False
+
+    def has_changes(self):
+        return self.all_dirty or bool(self.dirty_signals or self.dirty_socs or self.dirty_metadata)
+
+
+class IncrementalJsonWriter:
+    """Serialize projects to JSON, re-encoding only sections that changed
+
+    Encoded fragments of every signal and every core_info SoC are cached
+    together with the object they were produced from. A fragment is reused
+    when the tracker does not report it dirty and the object is still the
+    same instance, so replaced signals (edits, undo/redo, reloads) are always
+    re-encoded. The other top level sections are small and always encoded.
+    The output is identical to json.dump(data, f, indent=4).
+    """
+
+    INDENT = 4
+
+    def __init__(self):
+        self._signal_fragments = {}
+        self._soc_fragments = {}
+        self._metadata_fragment = None
+
+    def reset(self):
+        """Drop all cached fragments"""
+        self._signal_fragments = {}
+        self._soc_fragments = {}
+        self._metadata_fragment = None
+
+    def render(self, data, tracker=None):
+        """Return the JSON text for data, reusing clean cached fragments"""
+        if tracker is None or tracker.all_dirty:
+            self.reset()
+            tracker = None
+
+        parts = []
+        for key, value in data.items():
+            if key == "signals" and isinstance(value, dict):
+                fragment = self._render_cached_object(
+                    value, self._signal_fragments, tracker.dirty_signals if tracker else None)
+            elif key == "core_info" and isinstance(value, dict):
+                fragment = self._render_cached_object(
+                    value, self._soc_fragments, tracker.dirty_socs if tracker else None)
+            elif key == "metadata" and isinstance(value, dict):
+                fragment = self._render_metadata(value, tracker)
+            else:
+                fragment = self._encode(value, 1)
+            parts.append(f"{' ' * self.INDENT}{json.dumps(key)}: {fragment}")
+
+        if not parts:
+            return "{}"
+        return "{\n" + ",\n".join(parts) + "\n}"
+
+    def save(self, data, file_path, tracker=None):
+        """Render data and write it atomically to file_path"""
+        atomic_write(file_path, self.render(data, tracker))
+        if tracker is not None:
+            tracker.clear()
+
+    def _encode(self, value, level):
+        """Encode value as it would appear at the given nesting level"""
+        text = json.dumps(value, indent=self.INDENT, default=json_default)
+        if level and "\n" in text:
+            text = text.replace("\n", "\n" + " " * (self.INDENT * level))
+        return text
+
+    def _render_cached_object(self, obj, cache, dirty):
+        """Render a level 1 object whose values are cached individually"""
+        if not obj:
+            cache.clear()
+            return "{}"
+
+        fresh = {}
+        entries = []
+        indent = " " * (self.INDENT * 2)
+        for name, value in obj.items():
+            cached = cache.get(name)
+            if cached is not None and cached[0] is value and (dirty is None or name not in dirty):
+                entry = cached[1]
+            else:
+                entry = f"{indent}{json.dumps(name)}: {self._encode(value, 2)}"
+            fresh[name] = (value, entry)
+            entries.append(entry)
+
+        # Forget entries that were deleted or renamed
+        cache.clear()
+        cache.update(fresh)
+        return "{\n" + ",\n".join(entries) + "\n" + " " * self.INDENT + "}"
+
+    def _render_metadata(self, metadata, tracker):
+        cached = self._metadata_fragment
+        # The shallow copy also catches edits that bypassed the tracker
+        if (cached is not None and cached[0] is metadata and cached[1] == metadata
+                and (tracker is None or not tracker.dirty_metadata)):
+            return cached[2]
+        fragment = self._encode(metadata, 1)
+        self._metadata_fragment = (metadata, dict(metadata), fragment)
+        return fragment
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5 import QtCore
+
+# Parts of the main window a handler can mark out of date
+TABLE = "table"            # signal table, reloaded from signals_data
+CORE_INFO = "core_info"    # Core Info tree
+COUNT = "count"            # signal count
+TITLE = "title"            # window title with the modified marker
+
+# Order the parts are refreshed in
+REGIONS = (TABLE, CORE_INFO, COUNT, TITLE)
+
+
+class RefreshScheduler(QtCore.QObject):
+    """Coalesces refreshes of the main window into one per event loop pass
+
+    Handlers call mark() with the parts their change affects instead of
+    calling the UIHelpers update functions themselves. The marks are
+    collected until control returns to the event loop, then every dirty
+    part is refreshed once, in REGIONS order. flush() refreshes right
+    away when a caller needs the views current, e.g. to select a row.
+    """
+
+    def __init__(self, app):
+        super(RefreshScheduler, self).__init__(app)
+        self.app = app
+        self._dirty = set()
+        self._flushing = False
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def mark(self, *regions):
+        """Schedule a refresh of the given regions"""
+        unknown = set(regions) - set(REGIONS)
+        if unknown:
+            raise ValueError(f"Unknown refresh regions: {', '.join(sorted(unknown))}")
+        self._dirty.update(regions)
+        if self._dirty and not self._timer.isActive():
+            self._timer.start()
+
+    def is_dirty(self, region):
+        return region in self._dirty
+
+    def flush(self):
+        """Refresh every dirty region now"""
+        self._timer.stop()
+        if self._flushing:
+            # A refresh marked more regions; the running flush picks them up
+            return
+        self._flushing = True
+        try:
+            while self._dirty:
+                region = next(region for region in REGIONS if region in self._dirty)
+                self._dirty.discard(region)
+                try:
+                    self._refresh(region)
+                except Exception as e:
+                    print(f"Error refreshing {region}: {e}")
+                    import traceback
+                    traceback.print_exc()
+        finally:
+            self._flushing = False
+
+    def _refresh(self, region):
+        ui_helpers = self.app.ui_helpers
+        if region == TABLE:
+            ui_helpers.refresh_signal_tree()
+        elif region == CORE_INFO:
+            ui_helpers.update_core_info()
+        elif region == COUNT:
+            ui_helpers.update_signal_count_display()
+        elif region == TITLE:
+            ui_helpers.update_window_title()
@@ -0,0 +1,162 @@
+CORE_KEY_PREFIX = "core_"
+
+
+def core_key(core_name):
+    """Return the signal property key for a 'Soc.Core' name, e.g. core_Aurix_Core3"""
+    if core_name.startswith(CORE_KEY_PREFIX):
+        return core_name
+    return f"{CORE_KEY_PREFIX}{core_name.replace('.', '_')}"
+
+
+def iter_bits(mask):
+    """Yield the positions of the set bits of mask in ascending order"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def bit_count(mask):
+    return bin(mask).count("1")
+
+
+class CoreIndex:
+    """Assigns every destination core key a fixed bit position
+
+    Positions are never reused, so route masks stay valid for the lifetime
+    of the process regardless of which project is loaded.
+    """
+
+    def __init__(self):
+        self.bits = {}
+        self.keys = []
+
+    def bit(self, key):
+        """Return the bit value for a core key, registering it if needed"""
+        bit = self.bits.get(key)
+        if bit is None:
+            bit = 1 << len(self.keys)
+            self.bits[key] = bit
+            self.keys.append(key)
+        return bit
+
+    def mask_for(self, core_names):
+        """Return the mask covering the given 'Soc.Core' names or core keys"""
+        mask = 0
+        for name in core_names:
+            mask |= self.bit(core_key(name))
+        return mask
+
+    def keys_in(self, mask):
+        """Return the core keys whose bits are set in mask"""
+        keys = self.keys
+        return [keys[position] for position in iter_bits(mask)]
+
+
+# Shared by every Signal so masks from different signals can be combined
+CORE_INDEX = CoreIndex()
+
+
+def route_mask(signal):
+    """Return the destination mask of a Signal or of a plain properties dict"""
+    mask = getattr(signal, "_routes", None)
+    if mask is not None:
+        return mask
+    mask = 0
+    for key, value in signal.items():
+        if value is True and key.startswith(CORE_KEY_PREFIX):
+            mask |= CORE_INDEX.bit(key)
+    return mask
+
+
+class RoutingMatrix:
+    """Signals x cores destination matrix stored as bitsets
+
+    Every signal owns a row; its row mask has one bit per destination core
+    (see CORE_INDEX). For every core a column mask has one bit per row, so
+    both "where does this signal go" and "what does this core consume" are
+    answered without scanning the signals. The matrix is updated by
+    SignalOperations whenever a signal is added, edited, renamed or removed.
+    """
+
+    def __init__(self, signals=None):
+        self.rebuild(signals or {})
+
+    def rebuild(self, signals):
+        """Rebuild the matrix from a {name: signal} mapping"""
+        self._row_of = {}
+        self._names = []
+        self._row_masks = []
+        self._free_rows = []
+        self._columns = {}
+        for name, signal in signals.items():
+            self.set_signal(name, signal)
+
+    def set_signal(self, name, signal):
+        """Insert or update the routing row of a signal"""
+        row = self._row_of.get(name)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+                self._names[row] = name
+            else:
+                row = len(self._names)
+                self._names.append(name)
+                self._row_masks.append(0)
+            self._row_of[name] = row
+
+        old_mask = self._row_masks[row]
+        new_mask = route_mask(signal)
+        if old_mask == new_mask:
+            return
+        row_bit = 1 << row
+        columns = self._columns
+        for position in iter_bits(old_mask & ~new_mask):
+            columns[position] &= ~row_bit
+        for position in iter_bits(new_mask & ~old_mask):
+            columns[position] = columns.get(position, 0) | row_bit
+        self._row_masks[row] = new_mask
+
+    def remove_signal(self, name):
+        row = self._row_of.pop(name, None)
+        if row is None:
+            return
+        row_bit = 1 << row
+        for position in iter_bits(self._row_masks[row]):
+            self._columns[position] &= ~row_bit
+        self._row_masks[row] = 0
+        self._names[row] = None
+        self._free_rows.append(row)
+
+    def rename_signal(self, old_name, new_name):
+        row = self._row_of.pop(old_name, None)
+        if row is not None:
+            self._row_of[new_name] = row
+            self._names[row] = new_name
+
+    def row_mask(self, signal_name):
+        row = self._row_of.get(signal_name)
+        return 0 if row is None else self._row_masks[row]
+
+    def column_mask(self, core_name):
+        """Return the row bitset of signals routed to a 'Soc.Core' name or core key"""
+        bit = CORE_INDEX.bits.get(core_key(core_name))
+        if bit is None:
+            return 0
+        return self._columns.get(bit.bit_length() - 1, 0)
+
+    def destinations(self, signal_name):
+        """Return the core keys a signal is routed to"""
+        return CORE_INDEX.keys_in(self.row_mask(signal_name))
+
+    def is_routed(self, signal_name, core_name):
+        bit = CORE_INDEX.bits.get(core_key(core_name))
+        return bool(bit and self.row_mask(signal_name) & bit)
+
+    def consumers(self, core_name):
+        """Return the names of all signals routed to a core, e.g. 'Aurix.Core3'"""
+        names = self._names
+        return [names[row] for row in iter_bits(self.column_mask(core_name))]
+
+    def consumer_count(self, core_name):
+        return bit_count(self.column_mask(core_name))
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel, QFrame, QGroupBox,
+                            QTreeWidget, QTreeWidgetItem, QPushButton)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt
+
+from Modules.RoutingMatrix import CORE_INDEX, route_mask
+
+# Signal properties shown in the panel, in display order
+ATTRIBUTE_KEYS = ('Variable_Port_Name', 'DataType', 'Memory Region', 'Buffer count_IPC',
+                  'Type', 'InitValue', 'Notifiers', 'Source', 'Impl_Approach',
+                  'GetObjRef', 'SM_Buff_Count', 'Timeout', 'Periodicity',
+                  'ASIL', 'Checksum', 'description')
+
+
+class SignalAttributePanel(QWidget):
+    """Attributes of the selected signal, shown in the SignalAttributeSection
+
+    The form is built once with a row for every attribute; selecting a
+    signal only sets the texts and hides the rows the signal does not
+    have, so moving through the signal table creates no widgets.
+    """
+
+    def __init__(self, app, parent=None):
+        super(SignalAttributePanel, self).__init__(parent)
+        self.app = app
+        self.signal_name = None
+        self._signal_info = None
+
+        layout = QVBoxLayout(self)
+        self.empty_label = QLabel("No signal selected")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.empty_label)
+
+        self.form_widget = QWidget()
+        self.form_layout = QFormLayout(self.form_widget)
+        self.form_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        layout.addWidget(self.form_widget)
+        layout.addStretch()
+
+        self.title_label = QLabel()
+        title_font = QFont()
+        title_font.setBold(True)
+        title_font.setPointSize(12)
+        self.title_label.setFont(title_font)
+        self.title_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.form_layout.addRow(QLabel("Signal Name:"), self.title_label)
+
+        line = QFrame()
+        line.setFrameShape(QFrame.HLine)
+        line.setFrameShadow(QFrame.Sunken)
+        self.form_layout.addRow(line)
+
+        # key -> (row label, value label)
+        self.rows = {}
+        internal_label = self._add_row("SignalInternalInfo", "SignalInternalInfo:")
+        internal_font = QFont()
+        internal_font.setBold(True)
+        internal_label.setFont(internal_font)
+        self._add_row("Footprint", "Footprint:")
+        for key in ATTRIBUTE_KEYS:
+            self._add_row(key, f"{key.replace('_', ' ').title()}:")
+
+        self.struct_group = QGroupBox("Structure Fields")
+        struct_layout = QVBoxLayout(self.struct_group)
+        self.field_tree = QTreeWidget()
+        self.field_tree.setHeaderLabels(["Field Name", "Type", "Description"])
+        self.field_tree.setColumnWidth(0, 150)
+        self.field_tree.setColumnWidth(1, 100)
+        struct_layout.addWidget(self.field_tree)
+        self.form_layout.addRow(self.struct_group)
+
+        self._add_row("Destination Cores", "Destination Cores:").setWordWrap(True)
+
+        self.edit_button = QPushButton("Edit Signal")
+        self.edit_button.clicked.connect(self.edit_signal)
+        self.form_layout.addRow("", self.edit_button)
+
+        self.clear()
+
+    def _add_row(self, key, text):
+        label = QLabel(text)
+        value_label = QLabel()
+        value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.form_layout.addRow(label, value_label)
+        self.rows[key] = (label, value_label)
+        return value_label
+
+    def _set_row(self, key, value):
+        """Show the row of key with value, or hide it if value is None"""
+        label, value_label = self.rows[key]
+        if value is not None:
+            value_label.setText(str(value))
+        label.setVisible(value is not None)
+        value_label.setVisible(value is not None)
+
+    def bind(self, signal_name, signal_info):
+        """Show the attributes of a signal"""
+        # Signals are replaced, not modified in place, when they are edited
+        if signal_name == self.signal_name and signal_info is self._signal_info:
+            return
+        self.signal_name = signal_name
+        self._signal_info = signal_info
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.title_label.setText(signal_name)
+            internal_info = signal_info.get("SignalInternalInfo")
+            self._set_row("SignalInternalInfo", None if internal_info is None else internal_info)
+
+            # Estimated target memory of the signal, see FootprintEstimator
+            signal_footprint = self.app.footprint.signals.get(signal_name)
+            self._set_row("Footprint", None if signal_footprint is None else
+                          f"{signal_footprint.total} bytes in {signal_footprint.region} "
+                          f"({signal_footprint.payload} bytes per buffer)")
+
+            for key in ATTRIBUTE_KEYS:
+                value = signal_info.get(key)
+                if key in signal_info and isinstance(value, bool):
+                    value = "Yes" if value else "No"
+                self._set_row(key, value if key in signal_info else None)
+
+            self.field_tree.clear()
+            struct_fields = signal_info.get("struct_fields") if signal_info.get("is_struct", False) else None
+            if struct_fields is not None:
+                self.field_tree.addTopLevelItems([
+                    QTreeWidgetItem([field_name, field_info.get("type", ""), field_info.get("description", "")])
+                    for field_name, field_info in struct_fields.items()])
+            self.struct_group.setVisible(struct_fields is not None)
+
+            core_targets = [key[5:].replace('_', '.') for key in CORE_INDEX.keys_in(route_mask(signal_info))]
+            self._set_row("Destination Cores", ", ".join(core_targets) if core_targets else None)
+
+            self.empty_label.hide()
+            self.form_widget.show()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def clear(self):
+        """Show the "No signal selected" message"""
+        self.signal_name = None
+        self._signal_info = None
+        self.field_tree.clear()
+        self.form_widget.hide()
+        self.empty_label.show()
+
+    def edit_signal(self):
+        if self.signal_name is not None:
+            self.app.signal_ops.edit_signal_details(self.signal_name)
@@ -452,6 +452,17 @@ class SignalDetailsDialog(QDialog):
                 ])
                 self.struct_fields_tree.addTopLevelItem(item)
 
+        # Array and enum configuration
+        array_config = self.signal_properties.get("array_config")
+        if array_config:
+            self.array_type_combo.setCurrentText(array_config.get("base_type", "UINT8"))
+            self.array_size_spin.setValue(array_config.get("size", 1))
+        enum_config = self.signal_properties.get("enum_config")
+        if enum_config:
+            self.enum_name_edit.setText(enum_config.get("name", ""))
+            self.enum_entries_list.addItems(enum_config.get("entries", []))
+            self.update_enum_max_entry()
+
         # Advanced tab
         self.buffer_count_ipc_spin.setValue(self.signal_properties.get("Buffer count_IPC", 1))
 
@@ -625,6 +636,20 @@ class SignalDetailsDialog(QDialog):
                 }
             properties["struct_fields"] = struct_fields
 
+        # Handle array and enum type properties, used by the header generator
+        data_type = properties["DataType"].upper()
+        if data_type == "ARRAY":
+            properties["array_config"] = {
+                "base_type": self.array_type_combo.currentText(),
+                "size": self.array_size_spin.value()
+            }
+        elif data_type.startswith("ENUM"):
+            properties["enum_config"] = {
+                "name": self.enum_name_edit.text().strip(),
+                "entries": [self.enum_entries_list.item(i).text()
+                            for i in range(self.enum_entries_list.count())]
+            }
+
         # Advanced properties
         properties["Buffer count_IPC"] = self.buffer_count_ipc_spin.value()
         properties["Impl_Approach"] = self.impl_approach_combo.currentText()
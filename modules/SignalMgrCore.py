@@ -0,0 +1,241 @@
+"""Project operations that do not need the GUI
+
+Used by the signalmgr command line tool and by the main window. Nothing in
+here imports PyQt5, and pandas is only imported when an Excel workbook is read.
+"""
+import os
+import sys
+import json
+
+from Modules import BinaryFormat, ExcelExport, ProcessRunner, GeneratorRegistry
+from Modules.ProjectWriter import atomic_write
+from Modules.SignalModel import json_default
+
+# Entry point of the generator scripts inside the script directory; the
+# generator targets are listed by GeneratorRegistry
+GENERATOR_SCRIPT = "main.py"
+
+# Generator input formats: name -> file written to the output directory and
+# passed to the generator scripts with -f
+GENERATOR_INPUT_FILES = {
+    "excel": "signal_data.xlsx",
+    "json": "signal_data.json",
+}
+DEFAULT_INPUT_FORMAT = "excel"
+
+# Version of the JSON generator input layout, see write_generator_json()
+GENERATOR_JSON_VERSION = 1
+
+EXCEL_EXTENSIONS = (".xlsx", ".xls")
+
+
+class SignalMgrError(Exception):
+    """A project operation failed for a reason that can be shown to the user"""
+
+
+def load_project(file_path):
+    """Read a .sgm/.json or .sgmb project file"""
+    if BinaryFormat.is_binary_file(file_path):
+        return BinaryFormat.load(file_path)
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def save_project(data, file_path):
+    """Write a project file, choosing the format from the extension"""
+    if BinaryFormat.is_binary_file(file_path):
+        atomic_write(file_path, BinaryFormat.dumps(data))
+    else:
+        atomic_write(file_path, json.dumps(data, indent=4, default=json_default))
+
+
+def import_excel(file_path):
+    """Read a project from an exported Excel workbook"""
+    from Modules import ExcelImport
+
+    data = ExcelImport.read_excel_config(file_path)
+    if not data:
+        raise SignalMgrError(f"No valid data found in the Excel file: {file_path}")
+    return data
+
+
+def export_excel(data, file_path):
+    """Write the Version, Config and LookUpTable sheets of a project"""
+    ExcelExport.write_workbook(data, file_path)
+
+
+def is_excel_file(file_path):
+    return str(file_path).lower().endswith(EXCEL_EXTENSIONS)
+
+
+def read_any(file_path):
+    """Read a project from a project file or an Excel workbook"""
+    if is_excel_file(file_path):
+        return import_excel(file_path)
+    return load_project(file_path)
+
+
+def write_any(data, file_path):
+    """Write a project to a project file or an Excel workbook"""
+    if is_excel_file(file_path):
+        export_excel(data, file_path)
+    else:
+        save_project(data, file_path)
+
+
+def convert(source_path, destination_path):
+    """Convert between .sgm/.json, .sgmb and .xlsx, based on the extensions"""
+    data = read_any(source_path)
+    write_any(data, destination_path)
+    return data
+
+
+def write_generator_json(data, file_path, sheets=None):
+    """Write the generator input as JSON instead of an Excel workbook
+
+    The document holds the same tables as the exported workbook, so a
+    generator script can build the very DataFrames it used to read with
+    pd.read_excel, without any xlsx encoding or parsing:
+
+        {"format": "signalmgr-tables", "version": 1,
+         "sheets": {"LookUpTable": [{"first_col": 0, "columns": [...], "rows": [[...], ...]}],
+                    "Config": [...], "Version": [...]}}
+
+    e.g. pd.DataFrame(table["rows"], columns=table["columns"]). Config
+    holds two tables side by side, as on the worksheet. sheets are the
+    tables from ExcelExport.workbook_tables(data), if already built.
+    """
+    sheets = {
+        sheet_name: [{"first_col": first_col, "columns": header, "rows": rows}
+                     for first_col, header, rows in tables]
+        for sheet_name, tables in (sheets or ExcelExport.workbook_tables(data)).items()
+    }
+    document = {"format": "signalmgr-tables", "version": GENERATOR_JSON_VERSION, "sheets": sheets}
+    with open(file_path, 'w') as f:
+        json.dump(document, f, separators=(",", ":"))
+
+
+def generator_input_format(data):
+    """Return the generator input format configured for a project"""
+    input_format = data.get("project_specific", {}).get("generator_input", DEFAULT_INPUT_FORMAT)
+    return input_format if input_format in GENERATOR_INPUT_FILES else DEFAULT_INPUT_FORMAT
+
+
+def generator_input_path(data, output_dir, input_format=None):
+    """Return the path of the generator input file in output_dir"""
+    input_format = input_format or generator_input_format(data)
+    if input_format not in GENERATOR_INPUT_FILES:
+        raise SignalMgrError(f"Unknown generator input format: {input_format}")
+    return os.path.join(output_dir, GENERATOR_INPUT_FILES[input_format])
+
+
+def export_generator_input(data, output_dir, input_format=None, sheets=None):
+    """Write the generator input file into output_dir and return its path"""
+    input_format = input_format or generator_input_format(data)
+    input_path = generator_input_path(data, output_dir, input_format)
+    os.makedirs(output_dir, exist_ok=True)
+    if input_format == "json":
+        write_generator_json(data, input_path, sheets)
+    else:
+        ExcelExport.write_workbook(data, input_path, sheets)
+    return input_path
+
+
+def generation_settings(data):
+    """Return the script directory, board and output directory stored in a project
+
+    Also returns the boards, SoCs and build types of the project, for
+    matrix generation.
+    """
+    paths = data.get("project_specific", {}).get("paths", {})
+    board_name = data.get("selected_board", "")
+    return {
+        "script_directory": paths.get("script_path", ""),
+        "board_name": board_name,
+        "output_dir": paths.get("output_path", ""),
+        "boards": list(data.get("board_options") or [board_name]),
+        "soc_list": list(data.get("soc_list") or [data.get("soc_type", "")]),
+        "build_list": list(data.get("build_list") or [data.get("build_type", "")]),
+    }
+
+
+class GenerationResult:
+    """Outcome of one generator run"""
+
+    def __init__(self, target, command, returncode, stdout, stderr, elapsed=None, peak_memory=None,
+                 timed_out=False, cancelled=False):
+        self.target = target
+        self.command = command
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.elapsed = elapsed
+        # Peak memory of the generator process in bytes, if known
+        self.peak_memory = peak_memory
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+
+def generator_target(target, script_directory=None):
+    """Return the GeneratorTarget for a target or target name"""
+    if isinstance(target, GeneratorRegistry.GeneratorTarget):
+        return target
+    registry = GeneratorRegistry.load(script_directory)
+    if target not in registry:
+        raise SignalMgrError(f"Unknown generator target: {target} "
+                             f"(available: {', '.join(registry.names())})")
+    return registry.get(target)
+
+
+def check_generation_inputs(target, script_directory, board_name, output_dir, input_format=None):
+    """Raise SignalMgrError if a generation cannot be started; returns the script path"""
+    target = generator_target(target, script_directory)
+    if not script_directory or not os.path.isdir(script_directory):
+        raise SignalMgrError("Script directory path is not configured.")
+    if input_format is not None and not target.accepts(input_format):
+        raise SignalMgrError(f"{target.display_name} does not read the {input_format} generator input "
+                             f"(it reads: {', '.join(target.inputs)})")
+    script_path = target.script_path(script_directory, GENERATOR_SCRIPT)
+    if not os.path.isfile(script_path):
+        raise SignalMgrError(f"Script not found: {script_path}")
+    if not board_name:
+        raise SignalMgrError("No board selected.")
+    if not output_dir:
+        raise SignalMgrError("Output directory is not configured.")
+    return script_path
+
+
+def run_generator(target, input_path, script_directory, board_name, output_dir, python_cmd=None,
+                  runner=None, on_output=None, timeout=None, cancel_event=None):
+    """Run the generator script for one target on an already exported input file
+
+    By default the script runs in a new process; runner, e.g. a
+    GeneratorRuntime.WorkerPool, runs it in an already started process
+    instead. Either way its output is passed to on_output(stream, line)
+    while it runs, and it is killed after timeout seconds or once
+    cancel_event is set.
+    """
+    target = generator_target(target, script_directory)
+    script_path = check_generation_inputs(target, script_directory, board_name, output_dir)
+    args = target.arguments(input_path, board_name, output_dir)
+    cmd = [python_cmd or sys.executable, script_path] + args
+    if runner is not None:
+        result = runner.run(script_path, args, on_output, timeout, cancel_event)
+    else:
+        result = ProcessRunner.run_streaming(cmd, on_output, timeout, cancel_event)
+    return GenerationResult(target.name, cmd, result.returncode, result.stdout, result.stderr, result.elapsed,
+                            result.peak_memory, result.timed_out, result.cancelled)
+
+
+def generate(data, target, script_directory, board_name, output_dir, python_cmd=None, input_format=None,
+             runner=None, on_output=None, timeout=None):
+    """Export the generator input for a project and run one generator target"""
+    check_generation_inputs(target, script_directory, board_name, output_dir,
+                            input_format or generator_input_format(data))
+    input_path = export_generator_input(data, output_dir, input_format)
+    return run_generator(target, input_path, script_directory, board_name, output_dir, python_cmd, runner,
+                         on_output, timeout)
@@ -0,0 +1,310 @@
+import sys
+import copy
+from collections.abc import Mapping, MutableMapping
+
+from Modules.RoutingMatrix import CORE_INDEX, CORE_KEY_PREFIX, core_key, iter_bits, bit_count
+
+# Strings up to this length are interned so repeated values such as "DDR"
+# or "SharedMemory" are stored once for all signals
+INTERN_MAX_LENGTH = 64
+
+
+class _Shape:
+    """Shared key layout of a signal
+
+    Signals with the same keys in the same order share one _Shape, so the
+    property names and their positions are stored once instead of per signal.
+    """
+
+    __slots__ = ("keys", "index", "_transitions")
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = {key: position for position, key in enumerate(keys)}
+        self._transitions = {}
+
+    def with_key(self, key):
+        shape = self._transitions.get(key)
+        if shape is None:
+            shape = get_shape(self.keys + (key,))
+            self._transitions[key] = shape
+        return shape
+
+    def without_key(self, key):
+        return get_shape(tuple(k for k in self.keys if k != key))
+
+
+_SHAPES = {}
+
+
+def get_shape(keys):
+    """Return the shared _Shape for a tuple of keys"""
+    shape = _SHAPES.get(keys)
+    if shape is None:
+        shape = _SHAPES[keys] = _Shape(tuple(sys.intern(key) for key in keys))
+    return shape
+
+
+class _Field:
+    """Typed attribute access to a signal property, e.g. signal.data_type"""
+
+    __slots__ = ("key", "default")
+
+    def __init__(self, key, default=None):
+        self.key = key
+        self.default = default
+
+    def __get__(self, signal, owner=None):
+        if signal is None:
+            return self
+        return signal.get(self.key, self.default)
+
+    def __set__(self, signal, value):
+        signal[self.key] = value
+
+
+class Signal(MutableMapping):
+    """Properties of a single signal
+
+    Values live in a plain list laid out by a shared _Shape, so a signal costs
+    one small object and one list instead of a full dict with its own copy of
+    every key. Destination routing (the core_<soc>_<core> booleans) is kept
+    as two bitmasks over CORE_INDEX: the cores that have a key at all and
+    the cores the signal is routed to. Signal behaves like the dict it
+    replaces (get, items, [], copy, ...) and converts back with to_dict()
+    for JSON serialization, re-expanding the routing bits into core_ keys.
+    """
+
+    __slots__ = ("_shape", "_values", "_routed", "_routes")
+
+    variable_port_name = _Field("Variable_Port_Name", "")
+    memory_region = _Field("Memory Region", "DDR")
+    buffer_count_ipc = _Field("Buffer count_IPC", 1)
+    type = _Field("Type", "Concurrent")
+    init_value = _Field("InitValue", "ZeroMemory")
+    notifiers = _Field("Notifiers", False)
+    source = _Field("Source", "")
+    impl_approach = _Field("Impl_Approach", "SharedMemory")
+    get_obj_ref = _Field("GetObjRef", False)
+    sm_buff_count = _Field("SM_Buff_Count", 1)
+    timeout = _Field("Timeout", 10)
+    periodicity = _Field("Periodicity", 10)
+    asil = _Field("ASIL", "QM")
+    checksum = _Field("Checksum", "Additive")
+    data_type = _Field("DataType", "INT32")
+    description = _Field("description", "")
+    is_struct = _Field("is_struct", False)
+    struct_fields = _Field("struct_fields", None)
+
+    def __init__(self, properties=None):
+        self._routed = 0
+        self._routes = 0
+        if not properties:
+            self._shape = get_shape(())
+            self._values = []
+            return
+
+        shape, plain_positions, route_positions = _get_layout(tuple(properties.keys()))
+        values = list(properties.values())
+        if route_positions:
+            routed = routes = 0
+            for position, bit in route_positions:
+                value = values[position]
+                if value is True:
+                    routes |= bit
+                elif value is not False:
+                    # Non boolean core_ values are kept as ordinary properties
+                    self._shape = get_shape(())
+                    self._values = []
+                    for key, item in properties.items():
+                        self[key] = item
+                    return
+                routed |= bit
+            self._routed = routed
+            self._routes = routes
+            values = [values[position] for position in plain_positions]
+
+        self._shape = shape
+        self._values = [_intern(value) for value in values]
+
+    @classmethod
+    def from_dict(cls, properties):
+        """Return properties as a Signal, converting plain dicts"""
+        if isinstance(properties, Signal):
+            return properties
+        return cls(properties)
+
+    def to_dict(self):
+        """Return the signal as a plain JSON compatible dict"""
+        result = dict(zip(self._shape.keys, self._values))
+        if self._routed:
+            keys = CORE_INDEX.keys
+            routes = self._routes
+            for position in iter_bits(self._routed):
+                result[keys[position]] = bool(routes >> position & 1)
+        return result
+
+    # Routing
+
+    def destination_keys(self):
+        """Return the core_ keys of all cores this signal is routed to"""
+        return CORE_INDEX.keys_in(self._routes)
+
+    def routes_to(self, core_name):
+        bit = CORE_INDEX.bits.get(core_key(core_name))
+        return bool(bit and self._routes & bit)
+
+    def set_route(self, core_name, enabled):
+        self[core_key(core_name)] = bool(enabled)
+
+    # Mapping interface
+
+    def __getitem__(self, key):
+        position = self._shape.index.get(key)
+        if position is not None:
+            return self._values[position]
+        bit = CORE_INDEX.bits.get(key)
+        if bit is not None and self._routed & bit:
+            return bool(self._routes & bit)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        position = self._shape.index.get(key)
+        if position is not None:
+            return self._values[position]
+        bit = CORE_INDEX.bits.get(key)
+        if bit is not None and self._routed & bit:
+            return bool(self._routes & bit)
+        return default
+
+    def __setitem__(self, key, value):
+        position = self._shape.index.get(key)
+        if position is not None:
+            self._values[position] = _intern(value)
+            return
+        if key.startswith(CORE_KEY_PREFIX):
+            bit = CORE_INDEX.bit(key)
+            if type(value) is bool:
+                self._routed |= bit
+                self._routes = self._routes | bit if value else self._routes & ~bit
+                return
+            # Replacing a route with a non boolean value turns it into a plain property
+            self._routed &= ~bit
+            self._routes &= ~bit
+        self._shape = self._shape.with_key(key)
+        self._values.append(_intern(value))
+
+    def __delitem__(self, key):
+        position = self._shape.index.get(key)
+        if position is not None:
+            self._shape = self._shape.without_key(key)
+            del self._values[position]
+            return
+        bit = CORE_INDEX.bits.get(key)
+        if bit is None or not self._routed & bit:
+            raise KeyError(key)
+        self._routed &= ~bit
+        self._routes &= ~bit
+
+    def __contains__(self, key):
+        if key in self._shape.index:
+            return True
+        bit = CORE_INDEX.bits.get(key)
+        return bool(bit and self._routed & bit)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._values) + bit_count(self._routed)
+
+    def keys(self):
+        if not self._routed:
+            return self._shape.keys
+        return self._shape.keys + tuple(CORE_INDEX.keys_in(self._routed))
+
+    def values(self):
+        values = list(self._values)
+        routes = self._routes
+        values.extend(bool(routes >> position & 1) for position in iter_bits(self._routed))
+        return values
+
+    def items(self):
+        return zip(self.keys(), self.values())
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        duplicate = Signal.__new__(Signal)
+        duplicate._shape = self._shape
+        duplicate._values = list(self._values)
+        duplicate._routed = self._routed
+        duplicate._routes = self._routes
+        return duplicate
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        duplicate = self.copy()
+        # Scalars are immutable; only nested values such as struct_fields need copying
+        duplicate._values = [copy.deepcopy(value, memo) if isinstance(value, (dict, list)) else value
+                             for value in self._values]
+        return duplicate
+
+    def __reduce__(self):
+        return (Signal, (self.to_dict(),))
+
+    def __repr__(self):
+        return f"Signal({self.to_dict()!r})"
+
+
+_LAYOUTS = {}
+
+
+def _get_layout(keys):
+    """Split a key tuple into the plain property shape and the routing keys"""
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        plain_positions = []
+        route_positions = []
+        for position, key in enumerate(keys):
+            if key.startswith(CORE_KEY_PREFIX):
+                route_positions.append((position, CORE_INDEX.bit(key)))
+            else:
+                plain_positions.append(position)
+        shape = get_shape(tuple(keys[position] for position in plain_positions))
+        layout = _LAYOUTS[keys] = (shape, plain_positions, route_positions)
+    return layout
+
+
+def _intern(value):
+    if type(value) is str and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def signals_from_json(signals):
+    """Convert a {name: properties} mapping loaded from JSON to Signal objects"""
+    if not signals:
+        return {}
+    return {sys.intern(name): Signal.from_dict(properties) for name, properties in signals.items()}
+
+
+def signals_to_json(signals):
+    """Convert a {name: Signal} mapping back to plain dicts"""
+    return {name: properties.to_dict() if isinstance(properties, Signal) else properties
+            for name, properties in signals.items()}
+
+
+def json_default(obj):
+    """default= hook for json.dump so Signal objects serialize like dicts"""
+    if isinstance(obj, Signal):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
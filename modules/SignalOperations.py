@@ -1,13 +1,56 @@
 from PyQt5.QtWidgets import QMessageBox, QInputDialog, QTreeWidgetItem
 from Modules.SignalDetailsDialog import SignalDetailsDialog
 from Modules.ConfigMgrDialog import ConfigManagerDialog
+from Modules.SignalModel import Signal
+from Modules.RefreshScheduler import TABLE, CORE_INFO, COUNT, TITLE
 import copy
 
 class SignalOperations:
     def __init__(self, app):
         self.app = app
 
+    def signal_updated(self, signal_name):
+        """Record that a signal was added or replaced"""
+        self.app.change_tracker.mark_signal(signal_name)
+        self.app.routing.set_signal(signal_name, self.app.signals_data["signals"][signal_name])
+        self.app.footprint.set_signal(signal_name, self.app.signals_data["signals"][signal_name])
+        self.app.search_index.set_signal(signal_name, self.app.signals_data["signals"][signal_name])
+        self.app.footprint_dock.schedule_refresh()
+        self.app.ui_helpers.signal_model.signal_updated(signal_name)
+
+    def signal_removed(self, signal_name):
+        """Record that a signal was deleted"""
+        self.app.change_tracker.mark_signal(signal_name)
+        self.app.routing.remove_signal(signal_name)
+        self.app.footprint.remove_signal(signal_name)
+        self.app.search_index.remove_signal(signal_name)
+        self.app.footprint_dock.schedule_refresh()
+        self.app.ui_helpers.signal_model.signal_removed(signal_name)
+
+    def signal_renamed(self, old_name, new_name):
+        """Record that a signal was renamed"""
+        self.app.change_tracker.mark_signal(old_name, new_name)
+        self.app.routing.rename_signal(old_name, new_name)
+        self.app.footprint.rename_signal(old_name, new_name)
+        self.app.search_index.rename_signal(old_name, new_name, self.app.signals_data["signals"][new_name])
+        self.app.footprint_dock.schedule_refresh()
+        self.app.ui_helpers.signal_model.signal_renamed(old_name, new_name)
+
+    def signals_replaced(self):
+        """Record that signals_data was replaced as a whole (open, undo/redo, configuration manager)"""
+        self.app.change_tracker.mark_all()
+        self.app.routing.rebuild(self.app.signals_data.get("signals", {}))
+        self.app.footprint.rebuild(self.app.signals_data.get("signals", {}))
+        self.app.footprint_dock.schedule_refresh()
+        self.app.search_index.rebuild(self.app.signals_data.get("signals", {}))
+        # A filtered table has to be searched again
+        signal_model = self.app.ui_helpers.signal_model
+        if signal_model is not None and signal_model.search is not None:
+            self.app.refresh.mark(TABLE)
+
     def add_signal(self):
+        if self.app.file_ops.refuse_while_loading("Adding a signal"):
+            return
         signal_name, ok = QInputDialog.getText(self.app, "Add Signal", "Enter signal name:")
         if ok and signal_name:
             if signal_name in self.app.signals_data.get("signals", {}):
@@ -45,67 +88,64 @@ class SignalOperations:
 
         if dialog.exec_():
             # Save current state for undo
-            self.app.ui_helpers.save_undo_state()
+            self.app.ui_helpers.save_undo_state([signal_name])
 
             # Initialize signals dict if not exists
             if "signals" not in self.app.signals_data:
                 self.app.signals_data["signals"] = {}
 
             # Add the signal with the properties from the dialog
-            self.app.signals_data["signals"][signal_name] = dialog.get_signal_properties()
+            self.app.signals_data["signals"][signal_name] = Signal.from_dict(dialog.get_signal_properties())
+            self.signal_updated(signal_name)
 
             self.app.modified = True
-            self.app.ui_helpers.update_window_title()
-            self.app.ui_helpers.refresh_signal_tree()
+            self.app.refresh.mark(TITLE, COUNT)
             # Select the newly added signal to show its details
-
-            for i in range(self.app.ui_helpers.signal_tree.rowCount()):
-                item = self.app.ui_helpers.signal_tree.item(i, 0)  # Assuming signal names are in first column
-                if item and item.text() == signal_name:
-                    self.app.ui_helpers.signal_tree.selectRow(i)
-                    # Force display of signal details
-                    self.app.ui_helpers.display_signal_details(signal_name, self.app.signals_data["signals"][signal_name])
-                    break
-            # After successfully adding a signal, update the count
-            self.app.ui_helpers.update_signal_count_display()
+            if self.app.ui_helpers.select_signal(signal_name):
+                # Force display of signal details
+                self.app.ui_helpers.display_signal_details(signal_name, self.app.signals_data["signals"][signal_name])
         else:
             # If user canceled, remove the temporary signal
             if signal_name in self.app.signals_data.get("signals", {}):
                 del self.app.signals_data["signals"][signal_name]
 
     def delete_signal(self):
-        if not self.app.ui_helpers.signal_tree.currentItem():
+        if self.app.file_ops.refuse_while_loading("Deleting a signal"):
+            return
+        signal_name = self.app.ui_helpers.current_signal_name()
+        if not signal_name:
             QMessageBox.warning(self.app, "Warning", "No signal selected")
             return
-        signal_name = self.app.ui_helpers.signal_tree.currentItem().text(0)
         reply = QMessageBox.question(self.app, "Confirm Delete",
                                     f"Are you sure you want to delete signal '{signal_name}'?",
                                     QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             # Save current state for undo
-            self.app.ui_helpers.save_undo_state()
+            self.app.ui_helpers.save_undo_state([signal_name], removing=[signal_name])
             # Delete the signal
             if "signals" in self.app.signals_data and signal_name in self.app.signals_data["signals"]:
                 del self.app.signals_data["signals"][signal_name]
+                self.signal_removed(signal_name)
                 self.app.modified = True
-                self.app.ui_helpers.update_window_title()
-                self.app.ui_helpers.refresh_signal_tree()
+                self.app.refresh.mark(TITLE, COUNT)
                 QMessageBox.information(self.app, "Success", f"Signal '{signal_name}' deleted")
-                # After successfully deleting a signal, update the count
-                self.app.ui_helpers.update_signal_count_display()
 
     def update_signal(self):
-        if not self.app.ui_helpers.signal_tree.currentItem():
+        if self.app.file_ops.refuse_while_loading("Editing a signal"):
+            return
+        signal_name = self.app.ui_helpers.current_signal_name()
+        if not signal_name:
             QMessageBox.warning(self.app, "Warning", "No signal selected")
             return
-        signal_name = self.app.ui_helpers.signal_tree.currentItem().text(0)
         self.edit_signal_details(signal_name)
 
     def rename_signal(self):
-        if not self.app.ui_helpers.signal_tree.currentItem():
+        if self.app.file_ops.refuse_while_loading("Renaming a signal"):
+            return
+        old_name = self.app.ui_helpers.current_signal_name()
+        if not old_name:
             QMessageBox.warning(self.app, "Warning", "No signal selected")
             return
-        old_name = self.app.ui_helpers.signal_tree.currentItem().text(0)
         new_name, ok = QInputDialog.getText(self.app, "Rename Signal",
                                                      "Enter new signal name:", text=old_name)
         if ok and new_name and new_name != old_name:
@@ -113,21 +153,21 @@ class SignalOperations:
                 QMessageBox.warning(self.app, "Warning", f"Signal '{new_name}' already exists")
                 return
             # Save current state for undo
-            self.app.ui_helpers.save_undo_state()
+            self.app.ui_helpers.save_undo_state([old_name, new_name], removing=[old_name])
             # Rename the signal
             if "signals" in self.app.signals_data and old_name in self.app.signals_data["signals"]:
                 self.app.signals_data["signals"][new_name] = self.app.signals_data["signals"][old_name]
                 del self.app.signals_data["signals"][old_name]
+                self.signal_renamed(old_name, new_name)
                 self.app.modified = True
-                self.app.ui_helpers.update_window_title()
-                self.app.ui_helpers.refresh_signal_tree()
+                self.app.refresh.mark(TITLE)
                 QMessageBox.information(self.app, "Success", f"Signal renamed to '{new_name}'")
 
     def copy_signal(self):
-        if not self.app.ui_helpers.signal_tree.currentItem():
+        signal_name = self.app.ui_helpers.current_signal_name()
+        if not signal_name:
             QMessageBox.warning(self.app, "Warning", "No signal selected")
             return
-        signal_name = self.app.ui_helpers.signal_tree.currentItem().text(0)
         if "signals" in self.app.signals_data and signal_name in self.app.signals_data["signals"]:
             self.app.copied_signal = {
                 "name": signal_name,
@@ -144,6 +184,8 @@ class SignalOperations:
             QMessageBox.information(self.app, "Success", f"Signal '{signal_name}' copied")
 
     def paste_signal(self):
+        if self.app.file_ops.refuse_while_loading("Pasting a signal"):
+            return
         if not self.app.copied_signal:
             QMessageBox.warning(self.app, "Warning", "No signal copied")
             return
@@ -155,27 +197,27 @@ class SignalOperations:
             new_name = f"{original_name}_copy{counter}"
             counter += 1
         # Save current state for undo
-        self.app.ui_helpers.save_undo_state()
+        self.app.ui_helpers.save_undo_state([new_name])
         # Initialize signals dict if not exists
         if "signals" not in self.app.signals_data:
             self.app.signals_data["signals"] = {}
         # Add the copied signal with the new name
-        self.app.signals_data["signals"][new_name] = self.app.copied_signal["properties"].copy()
+        self.app.signals_data["signals"][new_name] = Signal.from_dict(self.app.copied_signal["properties"]).copy()
+        self.signal_updated(new_name)
         self.app.modified = True
-        self.app.ui_helpers.update_window_title()
-        self.app.ui_helpers.refresh_signal_tree()
+        self.app.refresh.mark(TITLE, COUNT)
         QMessageBox.information(self.app, "Success", f"Signal pasted as '{new_name}'")
-        # After pasting a signal, update the count
-        self.app.ui_helpers.update_signal_count_display()
 
     def cut_signal(self):
-        if not self.app.ui_helpers.signal_tree.currentItem():
+        if self.app.file_ops.refuse_while_loading("Cutting a signal"):
+            return
+        signal_name = self.app.ui_helpers.current_signal_name()
+        if not signal_name:
             QMessageBox.warning(self.app, "Warning", "No signal selected")
             return
-        signal_name = self.app.ui_helpers.signal_tree.currentItem().text(0)
         if "signals" in self.app.signals_data and signal_name in self.app.signals_data["signals"]:
             # Save current state for undo
-            self.app.ui_helpers.save_undo_state()
+            self.app.ui_helpers.save_undo_state([signal_name], removing=[signal_name])
 
             # Copy the signal first
             self.app.copied_signal = {
@@ -185,9 +227,9 @@ class SignalOperations:
 
             # Then delete the signal
             del self.app.signals_data["signals"][signal_name]
+            self.signal_removed(signal_name)
             self.app.modified = True
-            self.app.ui_helpers.update_window_title()
-            self.app.ui_helpers.refresh_signal_tree()
+            self.app.refresh.mark(TITLE, COUNT)
 
             # Enable paste action after cutting
             if hasattr(self.app, 'paste_action'):
@@ -198,10 +240,10 @@ class SignalOperations:
                 self.app.ui.actionPaste_Signal.setEnabled(True)
 
             QMessageBox.information(self.app, "Success", f"Signal '{signal_name}' cut")
-            # Update the signal count
-            self.app.ui_helpers.update_signal_count_display()
 
     def edit_signal_details(self, signal_name):
+        if self.app.file_ops.refuse_while_loading("Editing a signal"):
+            return
         if "signals" in self.app.signals_data and signal_name in self.app.signals_data["signals"]:
             # Get available cores for source selection
             available_cores = self.app.ui_helpers.get_available_cores()
@@ -209,19 +251,20 @@ class SignalOperations:
             dialog = SignalDetailsDialog(self.app, signal_name, self.app.signals_data["signals"][signal_name], available_cores)
             if dialog.exec_():
                 # Save current state for undo
-                self.app.ui_helpers.save_undo_state()
+                self.app.ui_helpers.save_undo_state([signal_name])
                 # Update signal with new properties
-                self.app.signals_data["signals"][signal_name] = dialog.get_signal_properties()
+                self.app.signals_data["signals"][signal_name] = Signal.from_dict(dialog.get_signal_properties())
+                self.signal_updated(signal_name)
                 self.app.modified = True
-                self.app.ui_helpers.update_window_title()
-                self.app.ui_helpers.refresh_signal_tree()
+                self.app.refresh.mark(TITLE)
                 # If currently selected, update display
-                current_item = self.app.ui_helpers.signal_tree.currentItem()
-                if current_item and current_item.text(0) == signal_name:
+                if self.app.ui_helpers.current_signal_name() == signal_name:
                     self.app.ui_helpers.display_signal_details(signal_name, self.app.signals_data["signals"][signal_name])
 
     def open_configuration_manager(self, is_new_file=False):
         """Open configuration manager with proper handling for UI structure"""
+        if self.app.file_ops.refuse_while_loading("Changing the configuration"):
+            return
         # Open the configuration manager dialog without requiring version checks
         config_dialog = ConfigManagerDialog(self.app.signals_data, self.app)
         if is_new_file:
@@ -241,20 +284,25 @@ class SignalOperations:
                 "signals": {}               # For storing signals
             }
             self.app.current_file = None
+            self.signals_replaced()
+            self.app.history.clear()
             self.app.modified = True
-            self.app.ui_helpers.update_window_title()
+            self.app.refresh.mark(TABLE, CORE_INFO, COUNT, TITLE)
+
+        # The dialog edits nested sections in place, so capture the undo state up front
+        undo_snapshot = self.app.history.take_snapshot(self.app.signals_data)
 
         # Show the configuration manager dialog
         if config_dialog.exec_():
             # If user clicked OK, update the configuration
             updated_config = config_dialog.get_updated_config()
+            self.app.history.record(undo_snapshot)
             self.app.signals_data = updated_config
+            self.signals_replaced()
             self.app.modified = True
-            self.app.ui_helpers.update_window_title()
             self.app.ui_helpers.populate_soc_list()
             self.app.ui_helpers.populate_build_types()
-            self.app.ui_helpers.refresh_signal_tree()
-            self.app.ui_helpers.update_core_info()
+            self.app.refresh.mark(TABLE, CORE_INFO, COUNT, TITLE)
 
     def load_config(self, config_data):
         """Load configuration data into the UI"""
@@ -0,0 +1,200 @@
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtCore import Qt
+
+
+class SignalTableModel(QtCore.QAbstractTableModel):
+    """Table model over app.signals_data["signals"]
+
+    Only the ordered list of signal names is kept here; cell text is read
+    from the signal store on demand, so Qt only asks for the rows that are
+    visible. SignalOperations reports single edits through signal_updated,
+    signal_removed and signal_renamed, which emit row level notifications
+    instead of resetting the whole table. With a search set, only the
+    matching signals are listed.
+    """
+
+    HEADERS = ["Signal Name", "Type", "Description"]
+    # Signal property shown in each column; the name column reads the key itself
+    COLUMN_KEYS = (None, "DataType", "description")
+
+    def __init__(self, app, parent=None):
+        super(SignalTableModel, self).__init__(parent)
+        self.app = app
+        self._names = []
+        self._row_of = {}
+        # SearchQuery filtering the rows, or None to list every signal
+        self.search = None
+
+    def _signals(self):
+        return self.app.signals_data.get("signals") or {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        name = self._names[index.row()]
+        column = index.column()
+        if column == 0:
+            return name
+        signal_info = self._signals().get(name)
+        if signal_info is None:
+            return None
+        value = signal_info.get(self.COLUMN_KEYS[column], "")
+        return value if isinstance(value, str) else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    # Lookups
+
+    def name_at(self, row):
+        if 0 <= row < len(self._names):
+            return self._names[row]
+        return None
+
+    def row_of(self, signal_name):
+        """Return the row of a signal, or -1 if it is not in the table"""
+        if self._row_of is None:
+            # Rebuilt lazily after removals instead of shifting every later row
+            self._row_of = {name: row for row, name in enumerate(self._names)}
+        return self._row_of.get(signal_name, -1)
+
+    # Updates
+
+    def reset_signals(self):
+        """Reload all rows from the signal store"""
+        self.beginResetModel()
+        if self.search is None:
+            self._names = list(self._signals().keys())
+        else:
+            self._names = self.search.result().select(self._signals())
+        self._row_of = None
+        self.endResetModel()
+
+    def set_search(self, search):
+        """List only the signals matching a SearchQuery; None lists all of them"""
+        self.search = search
+        self.reset_signals()
+
+    def append_signals(self, signal_names):
+        """Append rows for signals that were added to the end of the store"""
+        signal_names = [name for name in signal_names if self.row_of(name) < 0]
+        if not signal_names:
+            return
+        first = len(self._names)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(signal_names) - 1)
+        self._names.extend(signal_names)
+        if self._row_of is not None:
+            self._row_of.update((name, row) for row, name in enumerate(signal_names, first))
+        self.endInsertRows()
+
+    def signal_updated(self, signal_name):
+        """Insert a row for a new signal or refresh the row of an existing one
+
+        While searching, a new signal is only listed if it matches; an edited
+        one stays listed so it does not vanish under the cursor.
+        """
+        row = self.row_of(signal_name)
+        if row < 0:
+            if self.search is None or self.search.matches(signal_name):
+                self._insert_signal(signal_name)
+        else:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def _insert_signal(self, signal_name):
+        """Add the row of a signal at its place in the store order
+
+        New signals are added at the end of the store; undo puts deleted
+        ones back in the middle.
+        """
+        signals = self._signals()
+        if not signals or next(reversed(signals)) == signal_name:
+            self.append_signals([signal_name])
+            return
+        later = False
+        row = len(self._names)
+        for name in signals:
+            if later and self.row_of(name) >= 0:
+                row = self.row_of(name)
+                break
+            later = later or name == signal_name
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._names.insert(row, signal_name)
+        self._row_of = None
+        self.endInsertRows()
+
+    def signal_removed(self, signal_name):
+        row = self.row_of(signal_name)
+        if row < 0:
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._names[row]
+        self._row_of = None
+        self.endRemoveRows()
+
+    def signal_renamed(self, old_name, new_name):
+        row = self.row_of(old_name)
+        if row < 0:
+            self.signal_updated(new_name)
+            return
+        self._names[row] = new_name
+        if self._row_of is not None:
+            del self._row_of[old_name]
+            self._row_of[new_name] = row
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+
+class SignalTableView(QtWidgets.QTableView):
+    """Signal list view
+
+    Emits itemSelectionChanged like the QTableWidget it replaces, so the
+    existing selection handlers and their connect/disconnect logic keep working.
+    """
+
+    itemSelectionChanged = QtCore.pyqtSignal()
+
+    def __init__(self, parent=None):
+        super(SignalTableView, self).__init__(parent)
+        self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        # Fixed row heights let the view compute scrolling without measuring rows
+        vertical_header = self.verticalHeader()
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + 8)
+        self.horizontalHeader().setStretchLastSection(True)
+
+    def selectionChanged(self, selected, deselected):
+        super(SignalTableView, self).selectionChanged(selected, deselected)
+        self.itemSelectionChanged.emit()
+
+    def current_signal_name(self):
+        """Return the name of the selected signal, or None"""
+        model = self.model()
+        if model is None or self.selectionModel() is None:
+            return None
+        rows = self.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return model.name_at(rows[0].row())
+
+    def select_signal(self, signal_name):
+        """Select and scroll to a signal; returns False if it is not listed"""
+        row = self.model().row_of(signal_name)
+        if row < 0:
+            return False
+        self.selectRow(row)
+        self.scrollTo(self.model().index(row, 0))
+        return True
@@ -1,18 +1,34 @@
 import os
 from datetime import datetime
 from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtWidgets import QMessageBox, QTreeWidgetItem, QPushButton, QGroupBox
-from PyQt5.QtCore import Qt, QObject
+from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtCore import QObject
 import traceback
 import copy
 
+from Modules.SignalTableModel import SignalTableModel, SignalTableView
+from Modules.SignalAttributePanel import SignalAttributePanel
+from Modules.CoreInfoView import CoreInfoView
+from Modules.ApiConfigPanel import ApiConfigPanel, ApiConfigModel
+from Modules.RefreshScheduler import TABLE, CORE_INFO, COUNT, TITLE
+
 # Make UIHelpers inherit from QObject so it can be used as an event filter
 class UIHelpers(QObject):
+    # Undo/redo steps touching more signals reload the views instead of updating them row by row
+    ROW_UPDATE_LIMIT = 200
+
     def __init__(self, app):
         # Initialize the QObject parent
         super(UIHelpers, self).__init__(app)
         self.app = app
         self.signal_tree = None
+        self.signal_model = None
+        # Persistent form of the signal attribute section, see signal_attribute_panel()
+        self.attribute_panel = None
+        # Diffing view of the Core Info tree, see update_core_info()
+        self.core_info_view = None
+        # API configuration editors, see api_config_panel()
+        self.api_panel = None
         # Store a deep copy of signals data for version comparison
         self.original_signals_data = None
         # Default values for version info
@@ -56,9 +72,8 @@ class UIHelpers(QObject):
         # Try to load from existing metadata
         metadata = self.app.signals_data.get("metadata", {})
 
-        # Store a deep copy of the current signals data for future comparison
-        import copy
-        self.original_signals_data = copy.deepcopy(self.app.signals_data)
+        # Store the current metadata for future comparison
+        self.snapshot_saved_state()
 
         # Check if metadata has values or we should use defaults
         metadata_empty = (
@@ -211,24 +226,43 @@ class UIHelpers(QObject):
         if skip_validation:
             self.app.modified = original_modified
 
+    def snapshot_saved_state(self):
+        """Remember the saved metadata so later edits can be detected
+
+        Only the metadata is compared against, so copying the whole document
+        (including every signal) is unnecessary.
+        """
+        self.original_signals_data = {
+            "metadata": copy.deepcopy(self.app.signals_data.get("metadata", {}))
+        }
+
     def setup_tree_widget(self):
         """Set up a table widget in the scroll area for signal list with a flat structure"""
         # Check if signal list widget is already set up
         if hasattr(self, 'signal_tree') and self.signal_tree is not None:
             return
 
-        # Use QTableWidget instead of QTreeWidget since signals are flat data
-        self.signal_tree = QtWidgets.QTableWidget()
-        self.signal_tree.setColumnCount(3)
-        self.signal_tree.setHorizontalHeaderLabels(["Signal Name", "Type", "Description"])
+        # Use a model/view table; cell text is fetched lazily for visible rows only
+        self.signal_model = SignalTableModel(self.app, self)
+        self.signal_tree = SignalTableView()
+        self.signal_tree.setModel(self.signal_model)
         self.signal_tree.setColumnWidth(0, 150)
         self.signal_tree.setColumnWidth(1, 100)
-        self.signal_tree.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.signal_tree.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
 
         # Connect signal selection handler only once
         self.signal_tree.itemSelectionChanged.connect(self.handle_signal_selected)
 
+        # Search bar filtering the table, see SignalSearchIndex for the query syntax
+        self.signal_search = QtWidgets.QLineEdit()
+        self.signal_search.setObjectName("SignalSearch")
+        self.signal_search.setPlaceholderText("Search signals, e.g. temp asil:B source:Aurix.Core0")
+        self.signal_search.setClearButtonEnabled(True)
+        self.signal_search.setToolTip("Terms must all match; field:term searches one of "
+                                      "name, port, type, source, asil, desc")
+        self.signal_search.textChanged.connect(self.filter_signals)
+        self.signal_search_count = QtWidgets.QLabel()
+        QtWidgets.QShortcut(QtGui.QKeySequence(QtGui.QKeySequence.Find), self.app, self.focus_signal_search)
+
         # Find the scroll area from the UI
         scroll_area = self.app.ui.SignalEntryScrollArea
         if scroll_area:
@@ -240,30 +274,59 @@ class UIHelpers(QObject):
             layout = QtWidgets.QVBoxLayout(content_widget)
             layout.setContentsMargins(0, 0, 0, 0)
 
+            search_layout = QtWidgets.QHBoxLayout()
+            search_layout.addWidget(self.signal_search)
+            search_layout.addWidget(self.signal_search_count)
+            layout.addLayout(search_layout)
+
             # Add table widget to layout
             layout.addWidget(self.signal_tree)
             print("Signal table successfully set up in SignalEntryScrollArea")
         else:
             print("ERROR: SignalEntryScrollArea not found in UI")
 
-    # We also need to update refresh_signal_tree to work with QTableWidget
     def refresh_signal_tree(self):
-        # Clear and repopulate the signal table
-        self.signal_tree.setRowCount(0)
-        if "signals" in self.app.signals_data:
-            signals = self.app.signals_data["signals"]
-            self.signal_tree.setRowCount(len(signals))
+        """Reload the signal table after signals_data was replaced as a whole"""
+        self.signal_model.reset_signals()
+        self._update_search_count()
+
+    def filter_signals(self, text):
+        """List only the signals matching the search text"""
+        selected = self.current_signal_name()
+        self.signal_model.set_search(self.app.search_index.query(text))
+        self._update_search_count()
+        if selected:
+            self.select_signal(selected)
+
+    def focus_signal_search(self):
+        self.signal_search.setFocus()
+        self.signal_search.selectAll()
+
+    def _update_search_count(self):
+        if self.signal_model.search is None:
+            self.signal_search_count.clear()
+        else:
+            total = len(self.app.signals_data.get("signals") or {})
+            self.signal_search_count.setText(f"{self.signal_model.rowCount()} of {total}")
 
-            for row, (signal_name, signal_info) in enumerate(signals.items()):
-                # Create items for each column
-                name_item = QtWidgets.QTableWidgetItem(signal_name)
-                type_item = QtWidgets.QTableWidgetItem(signal_info.get("DataType", ""))
-                desc_item = QtWidgets.QTableWidgetItem(signal_info.get("description", ""))
+    def append_signal_rows(self, signal_batch):
+        """Append a batch of (signal_name, signal_info) rows to the signal table
 
-                # Set items in table
-                self.signal_tree.setItem(row, 0, name_item)
-                self.signal_tree.setItem(row, 1, type_item)
-                self.signal_tree.setItem(row, 2, desc_item)
+        Used by the streaming loader so rows appear while a file is still loading.
+        """
+        self.signal_model.append_signals([signal_name for signal_name, _ in signal_batch])
+
+    def current_signal_name(self):
+        """Return the name of the signal selected in the signal table, or None"""
+        if self.signal_tree is None:
+            return None
+        return self.signal_tree.current_signal_name()
+
+    def select_signal(self, signal_name):
+        """Select a signal in the signal table"""
+        if self.signal_tree is None:
+            return False
+        return self.signal_tree.select_signal(signal_name)
 
     def populate_soc_list(self):
         # Clear current entries
@@ -512,8 +575,12 @@ class UIHelpers(QObject):
         if "metadata" not in self.app.signals_data:
             self.app.signals_data["metadata"] = {}
 
-        # Update all metadata fields at once
-        self.app.signals_data["metadata"].update(new_metadata)
+        # Update all metadata fields at once, recording the keys that changed
+        metadata = self.app.signals_data["metadata"]
+        changed_keys = [key for key, value in new_metadata.items() if metadata.get(key) != value]
+        if changed_keys:
+            self.app.change_tracker.mark_metadata(*changed_keys)
+        metadata.update(new_metadata)
 
         # Only mark as modified if not initial setup and data was actually changed
         if not initial:
@@ -573,174 +640,74 @@ class UIHelpers(QObject):
     def update_signal_count_display(self):
         """Update the signal count display in the UI"""
         try:
-            # Process events before updating to keep UI responsive
-            QtWidgets.QApplication.processEvents()
-
-            # Initialize components if they don't exist
-            if not hasattr(self.app.ui, 'SignalCnt'):
-                self._create_signal_count_widgets()
-                # Process events after widget creation
-                QtWidgets.QApplication.processEvents()
+            # Find or initialize components if they don't exist
+            if getattr(self.app.ui, 'SignalCnt', None) is None:
+                signal_cnt = self.app.findChild(QtWidgets.QSpinBox, "SignalCnt")
+                if signal_cnt:
+                    self.app.ui.SignalCnt = signal_cnt
+                else:
+                    self._create_signal_count_widgets()
 
             # Safety check for signal_data
             if not hasattr(self.app, 'signals_data') or self.app.signals_data is None:
                 print("Warning: signals_data not initialized, skipping count update")
                 return
 
-            # Update the count safely
-            signal_count = len(self.app.signals_data.get("signals", {}))
-
             # Check if SignalCnt still exists and is valid before accessing
             if hasattr(self.app.ui, 'SignalCnt') and self.app.ui.SignalCnt is not None:
-                self.app.ui.SignalCnt.setValue(signal_count)
-                # Process events after updating
-                QtWidgets.QApplication.processEvents()
+                self.app.ui.SignalCnt.setValue(len(self.app.signals_data.get("signals", {})))
             else:
                 print("Warning: SignalCnt widget not available, skipping update")
         except Exception as e:
             print(f"Error updating signal count: {e}")
             import traceback
             traceback.print_exc()
-            # Ensure UI remains responsive even after error
-            QtWidgets.QApplication.processEvents()
 
     def on_signal_selection_changed(self):
         # This handles when the signal selection changes
-        selected_items = self.signal_tree.selectedItems()
-        if selected_items:
-            signal_name = selected_items[0].text(0)
+        signal_name = self.current_signal_name()
+        if signal_name:
             if "signals" in self.app.signals_data and signal_name in self.app.signals_data["signals"]:
                 signal_info = self.app.signals_data["signals"][signal_name]
                 self.display_signal_details(signal_name, signal_info)
 
     def display_signal_details(self, signal_name, signal_info):
-        """Display signal details in the SiganlDetailsFrame with the new SignalAttributeSection scrollArea"""
+        """Display signal details in the SignalAttributeSection scrollArea of the SiganlDetailsFrame"""
         try:
-            print(f"Displaying details for signal: {signal_name}")
-
-            # Get the SiganlDetailsFrame
-            details_frame = self.app.ui.SiganlDetailsFrame
-            if not details_frame:
-                print("ERROR: SiganlDetailsFrame not found")
+            panel = self.signal_attribute_panel()
+            if panel is None:
                 return
+            panel.bind(signal_name, signal_info)
+        except Exception as e:
+            print(f"Error displaying signal details: {e}")
+            traceback.print_exc()
 
-            # Check if we already created the scroll area
-            attr_scroll = None
-            if hasattr(self.app.ui, "SignalAttributeSection"):
-                attr_scroll = self.app.ui.SignalAttributeSection
-            else:
-                attr_scroll = details_frame.findChild(QtWidgets.QScrollArea, "SignalAttributeSection")
-
-            # If not found or not valid, create the scroll area
-            if not attr_scroll or not isinstance(attr_scroll, QtWidgets.QScrollArea):
-                attr_scroll = self.setup_signal_attribute_section(details_frame)
-                if not attr_scroll:
-                    print("ERROR: Failed to create SignalAttributeSection")
-                    return
+    def signal_attribute_panel(self):
+        """Return the SignalAttributePanel, installed in the SignalAttributeSection
 
-                # Store direct reference to the scroll area in the UI
-                self.app.ui.SignalAttributeSection = attr_scroll
-                print("Created SignalAttributeSection during signal display")
+        The panel is created once and kept across selections, files and
+        rebuilds of the scroll area.
+        """
+        details_frame = getattr(self.app.ui, "SiganlDetailsFrame", None)
+        if not details_frame:
+            print("ERROR: SiganlDetailsFrame not found")
+            return None
 
-            # Create content for the scroll area
-            content_widget = QtWidgets.QWidget()
-            attr_scroll.setWidget(content_widget)
-
-            # Use form layout for signal attributes
-            form_layout = QtWidgets.QFormLayout(content_widget)
-            content_widget.setLayout(form_layout)  # Explicitly set layout to content widget
-            form_layout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
-
-            # Add signal name as a title
-            title_label = QtWidgets.QLabel(signal_name)
-            title_font = QtGui.QFont()
-            title_font.setBold(True)
-            title_font.setPointSize(12)
-            title_label.setFont(title_font)
-            form_layout.addRow(QtWidgets.QLabel("Signal Name:"), title_label)
-
-            # Add separator line
-            line = QtWidgets.QFrame()
-            line.setFrameShape(QtWidgets.QFrame.HLine)
-            line.setFrameShadow(QtWidgets.QFrame.Sunken)
-            form_layout.addRow(line)
-
-            # Display SignalInternalInfo first if it exists (with special formatting)
-            if "SignalInternalInfo" in signal_info:
-                internal_value = str(signal_info["SignalInternalInfo"])
-                internal_label = QtWidgets.QLabel(internal_value)
-                internal_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                internal_font = QtGui.QFont()
-                internal_font.setBold(True)
-                internal_label.setFont(internal_font)
-                form_layout.addRow("SignalInternalInfo:", internal_label)
-                print(f"Added SignalInternalInfo: {internal_value}")
-
-            # Display key signal properties in a readable format
-            for key in ['Variable_Port_Name', 'DataType', 'Memory Region', 'Buffer count_IPC',
-                    'Type', 'InitValue', 'Notifiers', 'Source', 'Impl_Approach',
-                    'GetObjRef', 'SM_Buff_Count', 'Timeout', 'Periodicity',
-                    'ASIL', 'Checksum', 'description']:
-                if key in signal_info:
-                    value = signal_info[key]
-                    # Format boolean values as Yes/No
-                    if isinstance(value, bool):
-                        value = "Yes" if value else "No"
-                    # Create a label with the value
-                    value_label = QtWidgets.QLabel(str(value))
-                    value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                    form_layout.addRow(f"{key.replace('_', ' ').title()}:", value_label)
-
-            # If it's a structure type, show fields
-            if signal_info.get("is_struct", False) and "struct_fields" in signal_info:
-                struct_group = QGroupBox("Structure Fields")
-                struct_layout = QtWidgets.QVBoxLayout(struct_group)
-                struct_group.setLayout(struct_layout)
-
-                # Create a tree for structure fields
-                field_tree = QtWidgets.QTreeWidget()
-                field_tree.setHeaderLabels(["Field Name", "Type", "Description"])
-                field_tree.setColumnWidth(0, 150)
-                field_tree.setColumnWidth(1, 100)
-
-                # Add fields to tree
-                for field_name, field_info in signal_info["struct_fields"].items():
-                    field_item = QtWidgets.QTreeWidgetItem([
-                        field_name,
-                        field_info.get("type", ""),
-                        field_info.get("description", "")
-                    ])
-                    field_tree.addTopLevelItem(field_item)
-                struct_layout.addWidget(field_tree)
-                form_layout.addRow(struct_group)
-
-            # Show core destinations if available
-            core_targets = []
-            for key in signal_info:
-                if key.startswith("core_") and signal_info[key]:
-                    core_name = key[5:].replace('_', '.')
-                    core_targets.append(core_name)
-
-            if core_targets:
-                dest_label = QtWidgets.QLabel(", ".join(core_targets))
-                dest_label.setWordWrap(True)
-                form_layout.addRow("Destination Cores:", dest_label)
-
-            # Add Edit button at the bottom of the form
-            edit_button = QPushButton("Edit Signal")
-            edit_button.clicked.connect(lambda: self.app.signal_ops.edit_signal_details(signal_name))
-            form_layout.addRow("", edit_button)
-
-            print(f"Signal details displayed for {signal_name}")
-
-            # Make sure the form is visible
-            content_widget.show()
-            attr_scroll.show()
-            details_frame.show()
+        attr_scroll = getattr(self.app.ui, "SignalAttributeSection", None)
+        if not isinstance(attr_scroll, QtWidgets.QScrollArea):
+            attr_scroll = details_frame.findChild(QtWidgets.QScrollArea, "SignalAttributeSection")
+        if not isinstance(attr_scroll, QtWidgets.QScrollArea):
+            attr_scroll = self.setup_signal_attribute_section(details_frame)
+            if not attr_scroll:
+                print("ERROR: Failed to create SignalAttributeSection")
+                return None
+        self.app.ui.SignalAttributeSection = attr_scroll
 
-        except Exception as e:
-            print(f"Error displaying signal details: {e}")
-            traceback.print_exc()
+        if self.attribute_panel is None:
+            self.attribute_panel = SignalAttributePanel(self.app)
+        if attr_scroll.widget() is not self.attribute_panel:
+            attr_scroll.setWidget(self.attribute_panel)
+        return self.attribute_panel
 
     def update_core_info(self):
         """Update the Core Info tree widget with configuration data organized by SOC"""
@@ -751,68 +718,15 @@ class UIHelpers(QObject):
                 print("ERROR: Could not find or create core info tree widget")
                 return
 
-            # Clear the tree widget
-            tree.clear()
+            if self.core_info_view is None or self.core_info_view.tree is not tree:
+                self.core_info_view = CoreInfoView(tree)
 
-            # Get core info from signals_data
-            core_info = self.app.signals_data.get("core_info", {})
+            # Only the SOCs, cores and details that changed are touched
+            self.core_info_view.update(self.app.signals_data.get("core_info", {}))
 
-            if not core_info:
-                tree.addTopLevelItem(QTreeWidgetItem(["No core information available"]))
-                return
-
-            # Add cores to tree widget - grouped by SOC
-            for soc_name, cores in core_info.items():
-                # Create SOC node as parent
-                soc_item = QTreeWidgetItem(tree)
-                soc_item.setText(0, f"SOC: {soc_name}")
-                soc_item.setExpanded(True)  # Expand SOC by default
-
-                # Add cores as children of SOC
-                for core_name, core_props in cores.items():
-                    # Create core item as child of SOC
-                    core_item = QTreeWidgetItem(soc_item)
-                    core_item.setText(0, f"Core: {core_name}")
-
-                    # Create child items for core details
-                    if isinstance(core_props, dict):
-                        # Add core role
-                        role_str = "Master" if core_props.get("is_master", False) else "Slave"
-                        role_item = QTreeWidgetItem(core_item)
-                        role_item.setText(0, f"Role: {role_str}")
-
-                        # OS info
-                        os_str = str(core_props.get("os", "Unknown"))
-                        os_item = QTreeWidgetItem(core_item)
-                        os_item.setText(0, f"OS: {os_str}")
-
-                        # SOC Family
-                        family_str = str(core_props.get("soc_family", "Unknown"))
-                        if family_str and family_str != "Unknown":
-                            family_item = QTreeWidgetItem(core_item)
-                            family_item.setText(0, f"SOC Family: {family_str}")
-
-                        # Boolean properties
-                        for prop_name, display_name in [
-                            ("is_qnx", "QNX Core"),
-                            ("is_autosar", "Autosar Compliant"),
-                            ("is_sim", "Simulation Core")
-                        ]:
-                            if core_props.get(prop_name, False):
-                                prop_item = QTreeWidgetItem(core_item)
-                                prop_item.setText(0, f"{display_name}: Yes")
-                    else:
-                        # For string or other scalar values
-                        desc_item = QTreeWidgetItem(core_item)
-                        desc_item.setText(0, str(core_props))
-
-            # Keep SOCs expanded, but collapse core details by default
-            for i in range(tree.topLevelItemCount()):
-                soc_item = tree.topLevelItem(i)
-                soc_item.setExpanded(True)
-                for j in range(soc_item.childCount()):
-                    core_item = soc_item.child(j)
-                    core_item.setExpanded(False)
+            # Keep the core list of the API configuration in step
+            if self.api_panel is not None:
+                self.api_panel.refresh()
 
         except Exception as e:
             print(f"ERROR in update_core_info: {e}")
@@ -821,6 +735,8 @@ class UIHelpers(QObject):
 
     def _get_core_tree_widget(self):
         """Get the core tree widget, creating it if necessary"""
+        if self.core_info_view is not None:
+            return self.core_info_view.tree
 
         # First try to find the correct scroll area based on the new UI structure
         soc_area = getattr(self.app.ui, 'Soc_CoreInfo', None)
@@ -901,8 +817,7 @@ class UIHelpers(QObject):
             soc_type = self.app.ui.SOCListComboBox.currentText()
             self.app.signals_data["soc_type"] = soc_type
             self.app.modified = True
-            self.update_window_title()
-            self.update_core_info()
+            self.app.refresh.mark(TITLE, CORE_INFO)
 
     def build_type_changed(self, index):
         if index > 0:  # Not the default "Select Build Type" item
@@ -913,50 +828,63 @@ class UIHelpers(QObject):
 
             self.app.signals_data["build_type"] = build_type
             self.app.modified = True
-            self.update_window_title()
+            self.app.refresh.mark(TITLE)
 
             # Update API configuration UI
             self.update_api_configuration()
 
             # Update other UI components that depend on build type
-            self.update_core_info()
+            self.app.refresh.mark(CORE_INFO)
 
-    def save_undo_state(self):
-        """Save current state to undo stack"""
-        import copy
-        self.app.undo_stack.append(copy.deepcopy(self.app.signals_data))
-        # Clear redo stack after a new action
-        self.app.redo_stack.clear()
+    def save_undo_state(self, signal_names=None, removing=()):
+        """Save current state to the undo history
+
+        Pass the names of the signals an action is about to add, change or
+        delete to record only those; without names the whole document is recorded.
+        removing lists the signals the action deletes or renames, so undo
+        restores them at their position.
+        """
+        if signal_names is None:
+            self.app.history.record_snapshot(self.app.signals_data)
+        else:
+            self.app.history.record_signals(self.app.signals_data, signal_names, removing)
 
     def undo_action(self):
         """Restore previous state"""
-        if self.app.undo_stack:
-            import copy
-            # Save current state to redo stack
-            self.app.redo_stack.append(copy.deepcopy(self.app.signals_data))
-            # Restore previous state
-            self.app.signals_data = self.app.undo_stack.pop()
-            self.app.modified = True
-            self.update_window_title()
-            self.refresh_signal_tree()
-            self.update_core_info()
-            # After undo, update the signal count
-            self.update_signal_count_display()
+        if self.app.file_ops.refuse_while_loading("Undo"):
+            return
+        if self.app.history.can_undo():
+            self.app.signals_data, changed = self.app.history.undo(self.app.signals_data)
+            self._history_applied(changed)
 
     def redo_action(self):
         """Restore next state"""
-        if self.app.redo_stack:
-            import copy
-            # Save current state to undo stack
-            self.app.undo_stack.append(copy.deepcopy(self.app.signals_data))
-            # Restore next state
-            self.app.signals_data = self.app.redo_stack.pop()
-            self.app.modified = True
-            self.update_window_title()
-            self.refresh_signal_tree()
-            self.update_core_info()
-            # After redo, update the signal count
-            self.update_signal_count_display()
+        if self.app.file_ops.refuse_while_loading("Redo"):
+            return
+        if self.app.history.can_redo():
+            self.app.signals_data, changed = self.app.history.redo(self.app.signals_data)
+            self._history_applied(changed)
+
+    def _history_applied(self, changed):
+        """Update the views after undo/redo changed the given signals (None: everything)"""
+        if changed is not None and len(changed) > self.ROW_UPDATE_LIMIT:
+            # Putting many deleted signals back row by row would scan the table for each
+            changed = None
+        if changed is None:
+            self.app.signal_ops.signals_replaced()
+            self.app.refresh.mark(TABLE, CORE_INFO)
+        else:
+            signals = self.app.signals_data.get("signals", {})
+            for signal_name in changed:
+                if signal_name in signals:
+                    self.app.signal_ops.signal_updated(signal_name)
+                else:
+                    self.app.signal_ops.signal_removed(signal_name)
+            selected = self.current_signal_name()
+            if selected in changed and selected in signals:
+                self.display_signal_details(selected, signals[selected])
+        self.app.modified = True
+        self.app.refresh.mark(TITLE, COUNT)
 
     def get_available_cores(self):
         """Get list of all configured cores in the format 'soc.core'"""
@@ -1310,24 +1238,10 @@ class UIHelpers(QObject):
     def handle_signal_selected(self):
         """Handle signal selection with improved error handling to prevent crashes"""
         try:
-            # For QTableWidget, we need to use selectedIndexes() or currentRow()
-            selected_rows = self.signal_tree.selectionModel().selectedRows()
-            if not selected_rows:
-                print("No row selected")
-                return
-
-            # Get the row index of the first selected row
-            row_index = selected_rows[0].row()
-
-            # Get signal name from first column (index 0)
-            name_item = self.signal_tree.item(row_index, 0)
-            if not name_item:
-                print("Invalid selected row item")
-                return
-
-            signal_name = name_item.text()
+            # The table model maps the selected row back to the signal name
+            signal_name = self.current_signal_name()
             if not signal_name:
-                print("Empty signal name")
+                print("No row selected")
                 return
 
             print(f"Signal selected: {signal_name}")
@@ -1364,6 +1278,11 @@ class UIHelpers(QObject):
             parent_frame: The parent frame to add the section to
         """
         try:
+            # Keep the attribute panel alive; it is moved into the new scroll area
+            if self.attribute_panel is not None and self.attribute_panel.parent() is not None:
+                self.attribute_panel.parent().parent().takeWidget()
+                self.attribute_panel.setParent(None)
+
             # Clear any existing content in the frame
             for child in parent_frame.findChildren(QtWidgets.QWidget):
                 if child.objectName() != "label_2":  # Keep the label_2 widget to avoid crashes
@@ -1392,6 +1311,8 @@ class UIHelpers(QObject):
 
             # Store reference
             self.app.ui.SignalAttributeSection = attribute_section
+            if self.attribute_panel is not None:
+                attribute_section.setWidget(self.attribute_panel)
 
             # Add to main layout
             layout.addWidget(attribute_section)
@@ -1430,173 +1351,12 @@ class UIHelpers(QObject):
         layout.addRow(label, input_field)
 
     def display_signal_details_internal(self, signal_name, signal_info):
-        """Display signal details in the SiganlDetailsFrame with the new SignalAttributeSection scrollArea"""
-        try:
-            print(f"Displaying details for signal: {signal_name}")
-
-            # Make UI responsive before processing
-            QtWidgets.QApplication.processEvents()
-
-            # Get the SiganlDetailsFrame - note the spelling matches your UI structure
-            details_frame = self.app.ui.SiganlDetailsFrame
-            if not details_frame:
-                print("ERROR: SiganlDetailsFrame not found")
-                return
-
-            # Check if we already created the scroll area
-            attr_scroll = details_frame.findChild(QtWidgets.QScrollArea, "SignalAttributeSection")
-
-            # If not found, create the scroll area without the redundant label
-            if not attr_scroll:
-                attr_scroll = self.setup_signal_attribute_section(details_frame)
-                if not attr_scroll:
-                    print("ERROR: Failed to create SignalAttributeSection")
-                    return
-                # Process events after creating scroll area
-                QtWidgets.QApplication.processEvents()
-
-            # Create content for the scroll area
-            content_widget = QtWidgets.QWidget()
-            attr_scroll.setWidget(content_widget)
-
-            # Use form layout for signal attributes
-            form_layout = QtWidgets.QFormLayout(content_widget)
-            content_widget.setLayout(form_layout)  # Explicitly set layout to content widget
-            form_layout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
-
-            # Add signal name as a title
-            title_label = QtWidgets.QLabel(signal_name)
-            title_font = QtGui.QFont()
-            title_font.setBold(True)
-            title_font.setPointSize(12)
-            title_label.setFont(title_font)
-            form_layout.addRow(QtWidgets.QLabel("Signal Name:"), title_label)
-
-            # Process events after adding title
-            QtWidgets.QApplication.processEvents()
-
-            # Add separator line
-            line = QtWidgets.QFrame()
-            line.setFrameShape(QtWidgets.QFrame.HLine)
-            line.setFrameShadow(QtWidgets.QFrame.Sunken)
-            form_layout.addRow(line)
-
-            # Safety check for signal_info
-            if signal_info is None:
-                print(f"Warning: Signal info is None for {signal_name}")
-                error_label = QtWidgets.QLabel("Signal information not available")
-                form_layout.addRow(error_label)
-                return
-
-            # Display SignalInternalInfo first if it exists (with special formatting)
-            if "SignalInternalInfo" in signal_info:
-                try:
-                    internal_value = str(signal_info["SignalInternalInfo"])
-                    internal_label = QtWidgets.QLabel(internal_value)
-                    internal_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                    internal_font = QtGui.QFont()
-                    internal_font.setBold(True)
-                    internal_label.setFont(internal_font)
-                    form_layout.addRow("SignalInternalInfo:", internal_label)
-                    print(f"Added SignalInternalInfo: {internal_value}")
-                except Exception as e:
-                    print(f"Error displaying SignalInternalInfo: {e}")
-
-            # Process events periodically
-            QtWidgets.QApplication.processEvents()
-
-            # Display key signal properties in a readable format
-            for key in ['Variable_Port_Name', 'DataType', 'Memory Region', 'Buffer count_IPC',
-                    'Type', 'InitValue', 'Notifiers', 'Source', 'Impl_Approach',
-                    'GetObjRef', 'SM_Buff_Count', 'Timeout', 'Periodicity',
-                    'ASIL', 'Checksum', 'description']:
-                try:
-                    if key in signal_info:
-                        value = signal_info[key]
-                        # Format boolean values as Yes/No
-                        if isinstance(value, bool):
-                            value = "Yes" if value else "No"
-                        # Create a label with the value
-                        value_label = QtWidgets.QLabel(str(value))
-                        value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                        form_layout.addRow(f"{key.replace('_', ' ').title()}:", value_label)
-                except Exception as e:
-                    print(f"Error displaying property {key}: {e}")
-
-                # Process events every few items
-                if key in ['DataType', 'Source', 'description']:
-                    QtWidgets.QApplication.processEvents()
-
-            # If it's a structure type, show fields
-            if signal_info.get("is_struct", False) and "struct_fields" in signal_info:
-                try:
-                    struct_group = QGroupBox("Structure Fields")
-                    struct_layout = QtWidgets.QVBoxLayout(struct_group)
-                    struct_group.setLayout(struct_layout)
-
-                    # Create a tree for structure fields
-                    field_tree = QtWidgets.QTreeWidget()
-                    field_tree.setHeaderLabels(["Field Name", "Type", "Description"])
-                    field_tree.setColumnWidth(0, 150)
-                    field_tree.setColumnWidth(1, 100)
-
-                    # Add fields to tree
-                    for field_name, field_info in signal_info["struct_fields"].items():
-                        field_item = QtWidgets.QTreeWidgetItem([
-                            field_name,
-                            field_info.get("type", ""),
-                            field_info.get("description", "")
-                        ])
-                        field_tree.addTopLevelItem(field_item)
-                    struct_layout.addWidget(field_tree)
-                    form_layout.addRow(struct_group)
-
-                    # Process events after adding structure fields
-                    QtWidgets.QApplication.processEvents()
-                except Exception as e:
-                    print(f"Error displaying structure fields: {e}")
-
-            # Show core destinations if available
-            try:
-                core_targets = []
-                for key in signal_info:
-                    if key.startswith("core_") and signal_info[key]:
-                        core_name = key[5:].replace('_', '.')
-                        core_targets.append(core_name)
-
-                if core_targets:
-                    dest_label = QtWidgets.QLabel(", ".join(core_targets))
-                    dest_label.setWordWrap(True)
-                    form_layout.addRow("Destination Cores:", dest_label)
-            except Exception as e:
-                print(f"Error displaying core destinations: {e}")
-
-            # Process events before adding edit button
-            QtWidgets.QApplication.processEvents()
-
-            # Add Edit button at the bottom of the form
-            try:
-                edit_button = QPushButton("Edit Signal")
-                edit_button.clicked.connect(lambda: self.app.signal_ops.edit_signal_details(signal_name))
-                form_layout.addRow("", edit_button)
-            except Exception as e:
-                print(f"Error adding edit button: {e}")
-
-            print(f"Signal details displayed for {signal_name}")
-
-            # Make sure the form is visible
-            content_widget.show()
-            attr_scroll.show()
-            details_frame.show()
-
-            # Final processEvents to ensure UI is fully updated
-            QtWidgets.QApplication.processEvents()
-
-        except Exception as e:
-            print(f"Error displaying signal details: {e}")
-            traceback.print_exc()
-            # Ensure UI remains responsive even after error
-            QtWidgets.QApplication.processEvents()
+        """Display signal details in the SignalAttributeSection scrollArea of the SiganlDetailsFrame"""
+        if signal_info is None:
+            print(f"Warning: Signal info is None for {signal_name}")
+            self.clear_signal_attribute_section()
+            return
+        self.display_signal_details(signal_name, signal_info)
 
     def _reconnect_ui_signals(self):
         """Reconnect UI signals after file loading"""
@@ -1768,267 +1528,44 @@ class UIHelpers(QObject):
             traceback.print_exc()
 
     def clear_signal_attribute_section(self):
-        """
-        Safely clear the signal attribute section to prevent segmentation faults.
-        This creates a completely new widget and properly handles existing references.
-        """
+        """Show "No signal selected" in the signal attribute section"""
         try:
-            print("Safely clearing SignalAttributeSection...")
-
-            # Get the SiganlDetailsFrame - note the spelling matches the UI structure
-            if hasattr(self.app.ui, 'SiganlDetailsFrame') and self.app.ui.SiganlDetailsFrame is not None:
-                details_frame = self.app.ui.SiganlDetailsFrame
-
-                # Process events to ensure UI is responsive
-                QtWidgets.QApplication.processEvents()
-
-                # Find existing SignalAttributeSection or create it if it doesn't exist
-                attr_scroll = details_frame.findChild(QtWidgets.QScrollArea, "SignalAttributeSection")
-
-                # If no scroll area exists, create a new one from scratch
-                if not attr_scroll or not isinstance(attr_scroll, QtWidgets.QScrollArea):
-                    # Create a new layout for the frame if needed
-                    if details_frame.layout() is None:
-                        layout = QtWidgets.QVBoxLayout(details_frame)
-                        layout.setContentsMargins(5, 5, 5, 5)
-                    else:
-                        layout = details_frame.layout()
-
-                    # Create a new scroll area
-                    attr_scroll = QtWidgets.QScrollArea(details_frame)
-                    attr_scroll.setWidgetResizable(True)
-                    attr_scroll.setObjectName("SignalAttributeSection")
-
-                    # Add it to layout if not already there
-                    layout.addWidget(attr_scroll)
-
-                    # Store reference to ensure access
-                    self.app.ui.SignalAttributeSection = attr_scroll
-                    print("Created new SignalAttributeSection")
-
-                # Create empty content for the scroll area
-                empty_widget = QtWidgets.QWidget()
-                empty_layout = QtWidgets.QVBoxLayout(empty_widget)
-
-                # Create "No signal selected" message
-                empty_label = QtWidgets.QLabel("No signal selected")
-                empty_label.setAlignment(QtCore.Qt.AlignCenter)
-                empty_layout.addWidget(empty_label)
-
-                # Set the empty widget as scroll area content
-                # Save the previous widget for proper cleanup
-                previous_widget = attr_scroll.takeWidget()
-
-                # Process events before setting the new widget
-                QtWidgets.QApplication.processEvents()
-
-                # Set the new empty widget
-                attr_scroll.setWidget(empty_widget)
-
-                # Process events after widget change
-                QtWidgets.QApplication.processEvents()
-
-                # Properly clean up the previous widget if it exists
-                if previous_widget:
-                    previous_widget.setParent(None)
-                    del previous_widget
-
-                print("SignalAttributeSection successfully cleared")
+            panel = self.signal_attribute_panel()
+            if panel is not None:
+                panel.clear()
         except Exception as e:
             print(f"Error clearing signal attribute section: {e}")
-            import traceback
             traceback.print_exc()
-            # Ensure UI remains responsive
-            QtWidgets.QApplication.processEvents()
-
-    def _create_smp_api_config(self, parent_layout):
-        """Create SMP API configuration layout"""
-        # Create group box for better organization
-        group_box = QtWidgets.QGroupBox("SMP API Configuration")
-        form_layout = QtWidgets.QFormLayout(group_box)
-
-        # SpinLock API settings
-        spinlock_section = QtWidgets.QGroupBox("SpinLock/Unlock API")
-        spinlock_layout = QtWidgets.QFormLayout(spinlock_section)
-
-        # SpinLock API
-        self.app.lineEdit_SpinLockAPI = QtWidgets.QLineEdit()
-        spinlock_layout.addRow("SpinLock API:", self.app.lineEdit_SpinLockAPI)
-
-        # SpinUnlock API
-        self.app.lineEdit_SpinUnLockAPI = QtWidgets.QLineEdit()
-        spinlock_layout.addRow("SpinUnlock API:", self.app.lineEdit_SpinUnLockAPI)
 
-        # SpinLock Header
-        self.app.lineEdit_SpinLockHeaderFile = QtWidgets.QLineEdit()
-        spinlock_layout.addRow("Header File:", self.app.lineEdit_SpinLockHeaderFile)
+    def api_config_panel(self):
+        """Return the ApiConfigPanel, installed in the APIscrollArea
 
-        # Add spinlock section to parent
-        form_layout.addRow(spinlock_section)
-
-        # Semaphore API settings
-        semaphore_section = QtWidgets.QGroupBox("Semaphore API")
-        semaphore_layout = QtWidgets.QFormLayout(semaphore_section)
-
-        # SemaphoreLock API
-        self.app.lineEdit_SemaphoreLockAPI = QtWidgets.QLineEdit()
-        semaphore_layout.addRow("SemaphoreLock API:", self.app.lineEdit_SemaphoreLockAPI)
-
-        # SemaphoreUnlock API
-        self.app.lineEdit_SemaphoreUnLockAPI = QtWidgets.QLineEdit()
-        semaphore_layout.addRow("SemaphoreUnlock API:", self.app.lineEdit_SemaphoreUnLockAPI)
-
-        # Semaphore Header
-        self.app.lineEdit_SemaphoreHeaderFile = QtWidgets.QLineEdit()
-        semaphore_layout.addRow("Header File:", self.app.lineEdit_SemaphoreHeaderFile)
-
-        # Add semaphore section to parent
-        form_layout.addRow(semaphore_section)
-
-        # GetCoreId API settings
-        coreid_section = QtWidgets.QGroupBox("GetCoreId API")
-        coreid_layout = QtWidgets.QFormLayout(coreid_section)
-
-        # GetCoreId API
-        self.app.lineEdit_GetCoreID = QtWidgets.QLineEdit()
-        coreid_layout.addRow("GetCoreId API:", self.app.lineEdit_GetCoreID)
-
-        # GetCoreId Header
-        self.app.lineEdit_GetCoreIDHeaderFile = QtWidgets.QLineEdit()
-        coreid_layout.addRow("Header File:", self.app.lineEdit_GetCoreIDHeaderFile)
-
-        # Add coreid section to parent
-        form_layout.addRow(coreid_section)
-
-        # Add group box to parent layout
-        parent_layout.addWidget(group_box)
+        The panel is created once; update_api_configuration() only rebinds it.
+        """
+        if self.api_panel is not None:
+            return self.api_panel
 
-        # Load values if they exist
-        self._load_smp_api_values()
+        api_frame = self.app.findChild(QtWidgets.QFrame, "APIFrame")
+        if not api_frame:
+            print("APIFrame not found in UI")
+            return None
 
-    def _create_multicore_api_config(self, parent_layout):
-        """Create multi-core API configuration layout with expandable sections"""
-        # Create group box
-        group_box = QtWidgets.QGroupBox("Multi-core API Configuration")
-        group_layout = QtWidgets.QVBoxLayout(group_box)
+        api_scroll_area = self.app.findChild(QtWidgets.QScrollArea, "APIscrollArea")
+        if not api_scroll_area:
+            print("APIscrollArea not found in UI")
+            return None
 
-        # Get cores from configuration
-        core_info = self.app.signals_data.get("core_info", {})
-        if not core_info:
-            no_cores_label = QtWidgets.QLabel("No cores configured. Please configure cores first.")
-            group_layout.addWidget(no_cores_label)
-        else:
-            # Create a tree widget for hierarchical organization
-            tree_widget = QtWidgets.QTreeWidget()
-            tree_widget.setHeaderLabels(["Configuration", "Value"])
-            tree_widget.setColumnCount(2)  # Two columns: one for name, one for value
-            tree_widget.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-            tree_widget.header().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
-            tree_widget.header().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
-            group_layout.addWidget(tree_widget)
-
-            # Create items for each SOC and its cores
-            for soc_name, cores in core_info.items():
-                # Create SOC level item
-                soc_item = QtWidgets.QTreeWidgetItem(tree_widget, [f"SOC: {soc_name}", ""])
-                soc_item.setExpanded(True)  # Expanded by default
-
-                # Create core items under this SOC
-                for core_name, core_data in cores.items():
-                    # Create core level item
-                    core_item = QtWidgets.QTreeWidgetItem(soc_item, [f"Core: {core_name}", ""])
-                    core_item.setExpanded(True)  # Start expanded
-
-                    # Create SpinLock section as a child item of the core
-                    spinlock_item = QtWidgets.QTreeWidgetItem(core_item, ["SpinLock/Unlock API", ""])
-                    spinlock_item.setExpanded(False)  # Collapsed by default
-
-                    # Create SpinLock API widgets as children of the spinlock item
-                    spinlock_api_item = QtWidgets.QTreeWidgetItem(spinlock_item, ["SpinLock API", ""])
-                    spinlock_api = QtWidgets.QLineEdit()
-                    spinlock_api.setObjectName(f"lineEdit_SpinLockAPI_{soc_name}_{core_name}")
-                    tree_widget.setItemWidget(spinlock_api_item, 1, spinlock_api)
-
-                    spinunlock_api_item = QtWidgets.QTreeWidgetItem(spinlock_item, ["SpinUnlock API", ""])
-                    spinunlock_api = QtWidgets.QLineEdit()
-                    spinunlock_api.setObjectName(f"lineEdit_SpinUnLockAPI_{soc_name}_{core_name}")
-                    tree_widget.setItemWidget(spinunlock_api_item, 1, spinunlock_api)
-
-                    spinlock_header_item = QtWidgets.QTreeWidgetItem(spinlock_item, ["Header File", ""])
-                    spinlock_header = QtWidgets.QLineEdit()
-                    spinlock_header.setObjectName(f"lineEdit_SpinLockHeaderFile_{soc_name}_{core_name}")
-                    tree_widget.setItemWidget(spinlock_header_item, 1, spinlock_header)
-
-                    # Create Semaphore section as a child item of the core
-                    semaphore_item = QtWidgets.QTreeWidgetItem(core_item, ["Semaphore API", ""])
-                    semaphore_item.setExpanded(False)  # Collapsed by default
-
-                    # Create Semaphore API widgets as children of the semaphore item
-                    semaphore_lock_item = QtWidgets.QTreeWidgetItem(semaphore_item, ["SemaphoreLock API", ""])
-                    semaphore_lock = QtWidgets.QLineEdit()
-                    semaphore_lock.setObjectName(f"lineEdit_SemaphoreLockAPI_{soc_name}_{core_name}")
-                    tree_widget.setItemWidget(semaphore_lock_item, 1, semaphore_lock)
-
-                    semaphore_unlock_item = QtWidgets.QTreeWidgetItem(semaphore_item, ["SemaphoreUnlock API", ""])
-                    semaphore_unlock = QtWidgets.QLineEdit()
-                    semaphore_unlock.setObjectName(f"lineEdit_SemaphoreUnLockAPI_{soc_name}_{core_name}")
-                    tree_widget.setItemWidget(semaphore_unlock_item, 1, semaphore_unlock)
-
-                    semaphore_header_item = QtWidgets.QTreeWidgetItem(semaphore_item, ["Header File", ""])
-                    semaphore_header = QtWidgets.QLineEdit()
-                    semaphore_header.setObjectName(f"lineEdit_SemaphoreHeaderFile_{soc_name}_{core_name}")
-                    tree_widget.setItemWidget(semaphore_header_item, 1, semaphore_header)
-
-                    # Store widgets in app for later access
-                    setattr(self.app, f"spinlock_api_{soc_name}_{core_name}", spinlock_api)
-                    setattr(self.app, f"spinunlock_api_{soc_name}_{core_name}", spinunlock_api)
-                    setattr(self.app, f"spinlock_header_{soc_name}_{core_name}", spinlock_header)
-                    setattr(self.app, f"semaphore_lock_{soc_name}_{core_name}", semaphore_lock)
-                    setattr(self.app, f"semaphore_unlock_{soc_name}_{core_name}", semaphore_unlock)
-                    setattr(self.app, f"semaphore_header_{soc_name}_{core_name}", semaphore_header)
-
-                    # Load values if they exist
-                    self._load_core_api_values(soc_name, core_name)
-
-        # Add group box to parent layout
-        parent_layout.addWidget(group_box)
+        self.api_panel = ApiConfigPanel(self.app)
+        api_scroll_area.setWidget(self.api_panel)
+        return self.api_panel
 
     def update_api_configuration(self):
         """Update API configuration UI based on build type"""
         try:
-            # Find the API Frame
-            api_frame = self.app.findChild(QtWidgets.QFrame, "APIFrame")
-            if not api_frame:
-                print("APIFrame not found in UI")
-                return
-
-            # Get the API scroll area
-            api_scroll_area = self.app.findChild(QtWidgets.QScrollArea, "APIscrollArea")
-            if not api_scroll_area:
-                print("APIscrollArea not found in UI")
-                return
-
-            # Create fresh content widget
-            contents_widget = QtWidgets.QWidget()
-            api_scroll_area.setWidget(contents_widget)
-
-            # Create layout
-            main_layout = QtWidgets.QVBoxLayout(contents_widget)
-            main_layout.setContentsMargins(10, 10, 10, 10)
-
-            # Get current build type
-            build_type = self.app.signals_data.get("build_type", "SMP")
-
-            # Different UI based on build type
-            if build_type == "SMP":
-                self._create_smp_api_config(main_layout)
-            else:
-                self._create_multicore_api_config(main_layout)
-
-            # Store references for access
-            self.app.api_scroll_contents = contents_widget
-            self.app.api_main_layout = main_layout
-
+            panel = self.api_config_panel()
+            if panel is None:
+                return False
+            panel.refresh()
             return True
         except Exception as e:
             print(f"Error updating API configuration: {e}")
@@ -2036,127 +1573,14 @@ class UIHelpers(QObject):
             traceback.print_exc()
             return False
 
-    def _load_smp_api_values(self):
-        """Load SMP API values from configuration"""
-        # Get API settings from configuration
-        if "project_specific" in self.app.signals_data and "api_config" in self.app.signals_data["project_specific"]:
-            api_config = self.app.signals_data["project_specific"]["api_config"]
-
-            # Set values if they exist
-            if "smp" in api_config:
-                smp_config = api_config["smp"]
-
-                # SpinLock APIs
-                if "spinlock_api" in smp_config:
-                    self.app.lineEdit_SpinLockAPI.setText(smp_config["spinlock_api"])
-                if "spinunlock_api" in smp_config:
-                    self.app.lineEdit_SpinUnLockAPI.setText(smp_config["spinunlock_api"])
-                if "spinlock_header" in smp_config:
-                    self.app.lineEdit_SpinLockHeaderFile.setText(smp_config["spinlock_header"])
-
-                # Semaphore APIs
-                if "semaphore_lock_api" in smp_config:
-                    self.app.lineEdit_SemaphoreLockAPI.setText(smp_config["semaphore_lock_api"])
-                if "semaphore_unlock_api" in smp_config:
-                    self.app.lineEdit_SemaphoreUnLockAPI.setText(smp_config["semaphore_unlock_api"])
-                if "semaphore_header" in smp_config:
-                    self.app.lineEdit_SemaphoreHeaderFile.setText(smp_config["semaphore_header"])
-
-                # GetCoreId API
-                if "get_core_id_api" in smp_config:
-                    self.app.lineEdit_GetCoreID.setText(smp_config["get_core_id_api"])
-                if "get_core_id_header" in smp_config:
-                    self.app.lineEdit_GetCoreIDHeaderFile.setText(smp_config["get_core_id_header"])
-
-    def _load_core_api_values(self, soc_name, core_name):
-        """Load API values for a specific core"""
-        # Get API settings from configuration
-        if "project_specific" in self.app.signals_data and "api_config" in self.app.signals_data["project_specific"]:
-            api_config = self.app.signals_data["project_specific"]["api_config"]
-
-            # Check if multicore config exists
-            if "multicore" in api_config:
-                multicore_config = api_config["multicore"]
-
-                # Find this core's config
-                core_key = f"{soc_name}_{core_name}"
-                if core_key in multicore_config:
-                    core_config = multicore_config[core_key]
-
-                    # Get widgets for this core
-                    spinlock_api = getattr(self.app, f"spinlock_api_{soc_name}_{core_name}", None)
-                    spinunlock_api = getattr(self.app, f"spinunlock_api_{soc_name}_{core_name}", None)
-                    spinlock_header = getattr(self.app, f"spinlock_header_{soc_name}_{core_name}", None)
-                    semaphore_lock = getattr(self.app, f"semaphore_lock_{soc_name}_{core_name}", None)
-                    semaphore_unlock = getattr(self.app, f"semaphore_unlock_{soc_name}_{core_name}", None)
-                    semaphore_header = getattr(self.app, f"semaphore_header_{soc_name}_{core_name}", None)
-
-                    # Set values if widgets and data exist
-                    if spinlock_api and "spinlock_api" in core_config:
-                        spinlock_api.setText(core_config["spinlock_api"])
-                    if spinunlock_api and "spinunlock_api" in core_config:
-                        spinunlock_api.setText(core_config["spinunlock_api"])
-                    if spinlock_header and "spinlock_header" in core_config:
-                        spinlock_header.setText(core_config["spinlock_header"])
-                    if semaphore_lock and "semaphore_lock_api" in core_config:
-                        semaphore_lock.setText(core_config["semaphore_lock_api"])
-                    if semaphore_unlock and "semaphore_unlock_api" in core_config:
-                        semaphore_unlock.setText(core_config["semaphore_unlock_api"])
-                    if semaphore_header and "semaphore_header" in core_config:
-                        semaphore_header.setText(core_config["semaphore_header"])
-
     def save_api_configuration(self):
-        """Save API configuration to the signals data structure"""
-        try:
-            # Initialize project_specific if it doesn't exist
-            if "project_specific" not in self.app.signals_data:
-                self.app.signals_data["project_specific"] = {}
+        """Save API configuration to the signals data structure
 
-            # Initialize api_config if it doesn't exist
-            if "api_config" not in self.app.signals_data["project_specific"]:
-                self.app.signals_data["project_specific"]["api_config"] = {}
-
-            # Get current build type
-            build_type = self.app.signals_data.get("build_type", "SMP")
-
-            # Get API form data according to the current build type
-            if build_type == "SMP":
-                # Save SMP API configuration
-                self.app.signals_data["project_specific"]["api_config"]["smp"] = {
-                    "spinlock_api": self.app.lineEdit_SpinLockAPI.text(),
-                    "spinunlock_api": self.app.lineEdit_SpinUnLockAPI.text(),
-                    "spinlock_header": self.app.lineEdit_SpinLockHeaderFile.text(),
-                    "semaphore_lock_api": self.app.lineEdit_SemaphoreLockAPI.text(),
-                    "semaphore_unlock_api": self.app.lineEdit_SemaphoreUnLockAPI.text(),
-                    "semaphore_header": self.app.lineEdit_SemaphoreHeaderFile.text(),
-                    "get_core_id_api": self.app.lineEdit_GetCoreID.text(),
-                    "get_core_id_header": self.app.lineEdit_GetCoreIDHeaderFile.text()
-                }
-            else:
-                # Save multicore API configuration
-                if "multicore" not in self.app.signals_data["project_specific"]["api_config"]:
-                    self.app.signals_data["project_specific"]["api_config"]["multicore"] = {}
-
-                # Get all configured cores
-                core_info = self.app.signals_data.get("core_info", {})
-                for soc_name, cores in core_info.items():
-                    for core_name in cores:
-                        core_key = f"{soc_name}_{core_name}"
-
-                        # Get the widget references for this core
-                        spinlock_api = getattr(self.app, f"spinlock_api_{core_key}", None)
-                        if not spinlock_api:
-                            continue  # Skip if widgets don't exist for this core
-
-                        # Save this core's API configuration
-                        self.app.signals_data["project_specific"]["api_config"]["multicore"][core_key] = {
-                            "spinlock_api": getattr(self.app, f"spinlock_api_{core_key}").text(),
-                            "spinunlock_api": getattr(self.app, f"spinunlock_api_{core_key}").text(),
-                            "spinlock_header": getattr(self.app, f"spinlock_header_{core_key}").text(),
-                            "semaphore_lock_api": getattr(self.app, f"semaphore_lock_{core_key}").text(),
-                            "semaphore_unlock_api": getattr(self.app, f"semaphore_unlock_{core_key}").text(),
-                            "semaphore_header": getattr(self.app, f"semaphore_header_{core_key}").text()
-                        }
+        The editors write every edit into the data structure already; this
+        adds the keys of the settings that were never edited.
+        """
+        try:
+            ApiConfigModel(self.app).complete()
 
             # Mark as modified
             self.app.modified = True
@@ -2212,38 +1636,9 @@ class UIHelpers(QObject):
         try:
             print("Clearing API configuration fields...")
 
-            # Clear SMP mode fields if they exist
-            smp_fields = [
-                "lineEdit_SpinLockAPI",
-                "lineEdit_SpinUnLockAPI",
-                "lineEdit_SpinLockHeaderFile",
-                "lineEdit_SemaphoreLockAPI",
-                "lineEdit_SemaphoreUnLockAPI",
-                "lineEdit_SemaphoreHeaderFile",
-                "lineEdit_GetCoreID",
-                "lineEdit_GetCoreIDHeaderFile"
-            ]
-
-            for field_name in smp_fields:
-                field = getattr(self.app, field_name, None)
-                if field and hasattr(field, 'setText'):
-                    field.setText("")
-
-            # Clear MultiCore mode fields if they exist
-            # Find all attributes that match our naming pattern
-            for attr_name in dir(self.app):
-                # Look for the spinlock and semaphore widgets for each core
-                if any(attr_name.startswith(prefix) for prefix in
-                      ["spinlock_api_", "spinunlock_api_", "spinlock_header_",
-                       "semaphore_lock_", "semaphore_unlock_", "semaphore_header_"]):
-                    field = getattr(self.app, attr_name)
-                    if field and hasattr(field, 'setText'):
-                        field.setText("")
-
-            # Also clear the data structure
-            if "project_specific" in self.app.signals_data:
-                if "api_config" in self.app.signals_data["project_specific"]:
-                    self.app.signals_data["project_specific"]["api_config"] = {}
+            ApiConfigModel(self.app).clear()
+            if self.api_panel is not None:
+                self.api_panel.clear()
 
             print("API configuration fields cleared successfully")
             return True
@@ -0,0 +1,239 @@
+import sys
+import copy
+from collections import deque
+
+# Default limits for UndoHistory; whichever is reached first evicts the oldest steps
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_MAX_STEPS = 500
+
+# Marks a signal that did not exist in the recorded state
+_MISSING = object()
+
+
+def _estimate_size(value, depth=0):
+    """Rough size in bytes of value and its nested containers"""
+    size = sys.getsizeof(value)
+    if depth > 8:
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += _estimate_size(key, depth + 1) + _estimate_size(item, depth + 1)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += _estimate_size(item, depth + 1)
+    elif hasattr(value, "_values"):
+        # Signal: the shape is shared, only the values list belongs to it
+        size += _estimate_size(value._values, depth + 1)
+    return size
+
+
+def _positions(signals, names):
+    """Return {name: index in signals} of the names present in signals
+
+    Scans from the end and stops once every name is found, so signals that
+    were just added cost next to nothing.
+    """
+    wanted = {name for name in names if name in signals}
+    positions = {}
+    index = len(signals)
+    for name in reversed(signals):
+        if not wanted:
+            break
+        index -= 1
+        if name in wanted:
+            positions[name] = index
+            wanted.discard(name)
+    return positions
+
+
+def _insert_signals(signals, entries):
+    """Insert (index, name, value) entries so every name ends up at its index
+
+    Appending is enough when all of them belong at the end; otherwise the
+    dict is rebuilt in the new order.
+    """
+    entries = sorted(entries, key=lambda entry: entry[0])
+    if entries[0][0] >= len(signals):
+        for _, name, value in entries:
+            signals[name] = value
+        return
+    items = list(signals.items())
+    for index, name, value in entries:
+        items.insert(index, (name, value))
+    signals.clear()
+    signals.update(items)
+
+
+class _SignalChange:
+    """Undo step holding the previous value of a few signals
+
+    positions holds the index in the signals dict of the recorded signals
+    the action deleted or renamed, so they are put back where they were
+    instead of at the end.
+    """
+
+    __slots__ = ("values", "positions", "size")
+
+    def __init__(self, values, positions):
+        self.values = values
+        self.positions = positions
+        self.size = sum(_estimate_size(value) for value in values.values() if value is not _MISSING)
+
+    def apply(self, data):
+        """Restore the recorded signals in data; returns the inverse step"""
+        signals = data.setdefault("signals", {})
+        current = {name: signals.get(name, _MISSING) for name in self.values}
+        # Only the signals this step removes need a position to come back to
+        positions = _positions(signals, [name for name, value in self.values.items() if value is _MISSING])
+        restored = []
+        for name, value in self.values.items():
+            if value is _MISSING:
+                signals.pop(name, None)
+            elif name in signals:
+                # Replacing a value keeps its place in the dict
+                signals[name] = value
+            else:
+                restored.append((self.positions.get(name, sys.maxsize), name, value))
+        if restored:
+            _insert_signals(signals, restored)
+        return data, _SignalChange(current, positions)
+
+    def signal_names(self):
+        return list(self.values)
+
+
+class _Snapshot:
+    """Undo step holding a whole document
+
+    The signals dict is copied shallowly, so the snapshot shares its Signal
+    objects with the live document and with other snapshots. The remaining
+    sections (metadata, core_info, ...) are small and are deep copied.
+    """
+
+    __slots__ = ("data", "size")
+
+    def __init__(self, data):
+        self.data = share_copy(data)
+        signals = self.data.get("signals") or {}
+        self.size = sys.getsizeof(signals) + sum(
+            _estimate_size(value) for key, value in self.data.items() if key != "signals")
+
+    def apply(self, data):
+        return self.data, _Snapshot(data)
+
+    def signal_names(self):
+        return None
+
+
+def share_copy(data):
+    """Return a copy of a document that shares its Signal objects
+
+    Signals are replaced, never modified in place, so copying the signals
+    dict is enough; the other sections are edited in place and are deep
+    copied.
+    """
+    return {key: dict(value) if key == "signals" and isinstance(value, dict) else copy.deepcopy(value)
+            for key, value in data.items()}
+
+
+class UndoHistory:
+    """Bounded undo/redo history based on diffs and structural sharing
+
+    Signals are never modified in place: edits store a new Signal object and
+    leave the previous one untouched. A step therefore only needs references
+    to the previous values of the signals an action touches, which makes
+    recording, undo and redo cost proportional to the size of the change.
+    Actions that may touch anything else record a _Snapshot, which still
+    shares the Signal objects instead of copying them.
+
+    The oldest undo steps are dropped once the estimated size of the history
+    exceeds memory_budget bytes or there are more than max_steps steps.
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, max_steps=DEFAULT_MAX_STEPS):
+        self.memory_budget = memory_budget
+        self.max_steps = max_steps
+        self._undo = deque()
+        self._redo = []
+        self._size = 0
+
+    def __len__(self):
+        return len(self._undo)
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    @property
+    def size(self):
+        """Estimated memory held by the history in bytes"""
+        return self._size
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+
+    def record_signals(self, data, signal_names, removing=()):
+        """Record the current state of some signals before they are changed
+
+        removing names the signals the action deletes or renames; only their
+        positions are recorded, so undo puts them back in place while
+        ordinary edits skip the scan of the signals dict.
+        """
+        signals = data.get("signals") or {}
+        values = {name: signals.get(name, _MISSING) for name in signal_names}
+        self._push(_SignalChange(values, _positions(signals, removing) if removing else {}))
+
+    def record_snapshot(self, data):
+        """Record the whole document before a change of unknown extent"""
+        self._push(_Snapshot(data))
+
+    def take_snapshot(self, data):
+        """Capture the whole document now and record it later with record()
+
+        For dialogs that edit the document in place and may still be cancelled.
+        """
+        return _Snapshot(data)
+
+    def record(self, step):
+        self._push(step)
+
+    def undo(self, data):
+        """Undo the last step
+
+        Returns (data, signal_names): the document to use from now on and the
+        names of the signals that changed, or None if the whole document was
+        replaced. Returns (data, []) if there is nothing to undo.
+        """
+        return self._move(self._undo, self._redo, data)
+
+    def redo(self, data):
+        """Redo the last undone step; returns the same as undo()"""
+        return self._move(self._redo, self._undo, data)
+
+    def _push(self, step):
+        for redo_step in self._redo:
+            self._size -= redo_step.size
+        self._redo.clear()
+        self._undo.append(step)
+        self._size += step.size
+        self._evict()
+
+    def _move(self, source, target, data):
+        if not source:
+            return data, []
+        step = source.pop()
+        self._size -= step.size
+        data, inverse = step.apply(data)
+        target.append(inverse)
+        self._size += inverse.size
+        self._evict()
+        return data, step.signal_names()
+
+    def _evict(self):
+        # Keep at least the most recent step so the last action can always be undone
+        while len(self._undo) > 1 and (self._size > self.memory_budget or len(self._undo) > self.max_steps):
+            self._size -= self._undo.popleft().size
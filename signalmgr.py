@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Signal Manager command line tool
+
+Runs conversions and code generation without starting the GUI. PyQt5 is
+never imported, so jobs start quickly and several can run side by side.
+
+    python signalmgr.py convert project.sgm project.xlsx
+    python signalmgr.py generate project.sgm --target signal_mgr --board TC4 --output out/
+    python signalmgr.py generate project.sgm --dry-run --diff
+    python signalmgr.py generate project.sgm --matrix --report release.json
+    python signalmgr.py targets project.sgm
+    python signalmgr.py footprint project.sgm
+    python signalmgr.py search project.sgm "asil:B source:Aurix.Core0"
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import threading
+
+# Add the current directory to the path so modules can be found
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Modules import SignalMgrCore, GeneratorRuntime, GeneratorRegistry
+from Modules.SignalMgrCore import GENERATOR_INPUT_FILES, SignalMgrError
+from Modules.GenerationPipeline import (GenerationPipeline, plan_jobs, plan_matrix, matrix_summary,
+                                        DEFAULT_MAX_WORKERS)
+from Modules.GenerationCache import ADDED, UNCHANGED
+from Modules.ProcessRunner import format_memory
+from Modules.ProjectWriter import atomic_write
+from Modules.FootprintEstimator import FootprintEstimator
+from Modules.SignalSearchIndex import SignalSearchIndex
+from Modules.ExcelExport import available_cores
+from Modules.RoutingMatrix import core_key
+
+_output_lock = threading.Lock()
+
+
+def cmd_convert(args):
+    start = time.perf_counter()
+    data = SignalMgrCore.convert(args.source, args.destination)
+    signal_count = len(data.get("signals") or {})
+    print(f"Converted {args.source} -> {args.destination} "
+          f"({signal_count} signals, {time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+def cmd_generate(args):
+    data = SignalMgrCore.read_any(args.project)
+    settings = SignalMgrCore.generation_settings(data)
+    script_directory = args.scripts or settings["script_directory"]
+    output_dir = args.output or settings["output_dir"]
+    if args.target:
+        targets = [SignalMgrCore.generator_target(name, script_directory) for name in args.target]
+    else:
+        targets = list(GeneratorRegistry.load(script_directory))
+
+    runtime = GeneratorRuntime.runtime_settings(data)
+    python_cmd = GeneratorRuntime.resolve_python(args.python or runtime.get("python"))
+    if python_cmd is None:
+        raise SignalMgrError("No Python interpreter found for the generator scripts.")
+
+    dry_run = args.dry_run or args.diff
+    start = time.perf_counter()
+    runner = GeneratorRuntime.WorkerPool(python_cmd, args.jobs) if args.warm_workers else None
+    try:
+        pipeline = GenerationPipeline(data, script_directory, output_dir, python_cmd, args.jobs,
+                                      args.input_format, args.force, runner, args.timeout, dry_run)
+        if args.matrix:
+            planned = plan_matrix(targets, args.board or settings["boards"], args.soc or settings["soc_list"],
+                                  args.build or settings["build_list"], output_dir)
+        else:
+            planned = plan_jobs(targets, args.board or [settings["board_name"]], output_dir)
+        jobs = pipeline.run(planned,
+                            on_finished=lambda job: report_job(job, dry_run, args.diff),
+                            on_output=report_output if args.verbose else None)
+    finally:
+        if runner is not None:
+            runner.close()
+    elapsed = time.perf_counter() - start
+    if args.matrix:
+        report_matrix(matrix_summary(jobs), elapsed, args.report)
+    failures = sum(1 for job in jobs if not job.ok)
+    print(f"{len(jobs) - failures}/{len(jobs)} generators succeeded ({elapsed:.2f}s)")
+    return 1 if failures else 0
+
+
+def report_matrix(cells, elapsed, report_path=None):
+    """Print the per-cell summary of a matrix generation, and write it as JSON"""
+    print(f"\n{'SoC':<16} {'Build':<14} {'Board':<14} {'Status':<16} {'Time':>8}  Peak memory")
+    for cell in cells:
+        if cell["failed"]:
+            status = f"{cell['failed']}/{cell['jobs']} failed"
+        elif cell["up_to_date"] == cell["jobs"]:
+            status = "up to date"
+        else:
+            status = "ok"
+        print(f"{cell['soc']:<16} {cell['build']:<14} {cell['board']:<14} {status:<16} "
+              f"{cell['elapsed']:>7.2f}s  {format_memory(cell['peak_memory'])}")
+    if report_path:
+        report = {"elapsed": elapsed, "cells": cells}
+        atomic_write(report_path, json.dumps(report, indent=2))
+        print(f"Report written to {report_path}")
+
+
+def cmd_targets(args):
+    data = SignalMgrCore.read_any(args.project)
+    script_directory = args.scripts or SignalMgrCore.generation_settings(data)["script_directory"]
+    for target in GeneratorRegistry.load(script_directory):
+        source = target.source or "built in"
+        print(f"{target.name:<16} {target.display_name:<32} -i {target.input_id:<12} {source}")
+    return 0
+
+
+def cmd_footprint(args):
+    data = SignalMgrCore.read_any(args.project)
+    footprint = FootprintEstimator(data.get("signals") or {})
+    budgets = data.get("project_specific", {}).get("memory_budgets", {})
+    overruns = footprint.overruns(budgets)
+    core_names = {core_key(name): name for name in available_cores(data)}
+    core_names[""] = "(no source core)"
+    for region, used in sorted(footprint.regions.items()):
+        budget = budgets.get(region)
+        usage = f" of {format_memory(budget)} ({100.0 * used / budget:.1f}%)" if budget else ""
+        marker = "  OVER BUDGET" if region in overruns else ""
+        print(f"{region:<16} {format_memory(used)}{usage}{marker}")
+        for (item_region, key), size in sorted(footprint.region_cores.items()):
+            if item_region == region and size:
+                print(f"    {core_names.get(key, key):<28} {format_memory(size)}")
+    if footprint.unknown:
+        print(f"{len(footprint.unknown)} signals have types of unknown size: "
+              f"{', '.join(sorted(footprint.unknown))}")
+    return 1 if overruns else 0
+
+
+def cmd_search(args):
+    data = SignalMgrCore.read_any(args.project)
+    signals = data.get("signals") or {}
+    query = SignalSearchIndex(signals).query(" ".join(args.query))
+    hits = list(signals) if query is None else query.result().select(signals)
+    for name in hits:
+        print(name)
+    print(f"{len(hits)} of {len(signals)} signals", file=sys.stderr)
+    return 0 if hits else 1
+
+
+def report_output(job, stream, line):
+    # Called from the reader threads while the generators run
+    with _output_lock:
+        print(f"[{job.label}] {line}", end="" if line.endswith("\n") else "\n",
+              file=sys.stderr if stream == "stderr" else sys.stdout, flush=True)
+
+
+def report_job(job, dry_run=False, diff=False):
+    # Called from the pipeline threads; keep the output of one job together
+    with _output_lock:
+        _report_job(job, dry_run, diff)
+
+
+def _report_job(job, dry_run=False, diff=False):
+    if job.skipped:
+        print(f"{job.label}: up to date")
+    elif job.ok and dry_run:
+        changed = [change for change in job.changes if change.status != UNCHANGED]
+        print(f"{job.label}: {len(changed)} files would change, "
+              f"{len(job.changes) - len(changed)} unchanged ({job.statistics})")
+        for change in changed:
+            print(f"  {'A' if change.status == ADDED else 'M'} {change.path}")
+            if diff:
+                print(change.diff(), end="")
+    elif job.ok:
+        print(f"{job.label}: generated in {job.output_dir}, {len(job.written_files)} files written, "
+              f"{len(job.unchanged_files)} unchanged ({job.statistics})")
+    elif job.status in ("Timed out", "Cancelled"):
+        print(f"{job.label}: {job.status.lower()} ({job.statistics})", file=sys.stderr)
+    else:
+        print(f"{job.label}: failed ({job.statistics})\n{job.log}", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="signalmgr", description="Signal Manager command line tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser(
+        "convert", help="Convert between .sgm/.json, .sgmb and .xlsx (chosen by extension)")
+    convert_parser.add_argument("source", help="Project file or Excel workbook to read")
+    convert_parser.add_argument("destination", help="Project file or Excel workbook to write")
+    convert_parser.set_defaults(func=cmd_convert)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Run the code generators for a project")
+    generate_parser.add_argument("project", help="Project file or Excel workbook")
+    generate_parser.add_argument("-t", "--target", action="append",
+                                 help="Generator to run; repeat for several (default: all, "
+                                      "see the targets command)")
+    generate_parser.add_argument("-B", "--board", action="append",
+                                 help="Board name; repeat for several (default: the project's selected board)")
+    generate_parser.add_argument("--matrix", action="store_true",
+                                 help="Generate every board x SoC x build type combination, each into "
+                                      "OUTPUT/<SoC>/<build type>/<board>, and print a summary")
+    generate_parser.add_argument("--soc", action="append",
+                                 help="SoC for --matrix; repeat for several (default: the project's SoC list)")
+    generate_parser.add_argument("--build", action="append",
+                                 help="Build type for --matrix; repeat for several "
+                                      "(default: the project's build list)")
+    generate_parser.add_argument("--report", help="With --matrix, also write the summary as JSON to this file")
+    generate_parser.add_argument("-O", "--output", help="Output directory (default: the project's output path)")
+    generate_parser.add_argument("-S", "--scripts", help="Generator script directory (default: the project's script path)")
+    generate_parser.add_argument("--python", help="Python interpreter for the generator scripts "
+                                                  "(default: the project setting, else this one)")
+    generate_parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_MAX_WORKERS,
+                                 help=f"Generators to run in parallel (default: {DEFAULT_MAX_WORKERS})")
+    generate_parser.add_argument("--input-format", choices=list(GENERATOR_INPUT_FILES),
+                                 help="File handed to the generators: 'json' skips the Excel "
+                                      "round trip (default: the project setting, else excel)")
+    generate_parser.add_argument("--force", action="store_true",
+                                 help="Run every generator, even if its inputs did not change")
+    generate_parser.add_argument("--warm-workers", action="store_true",
+                                 help="Run the generators in reused worker processes, so their "
+                                      "imports are loaded once per worker instead of once per job")
+    generate_parser.add_argument("--timeout", type=float,
+                                 help="Kill a generator that runs longer than this many seconds")
+    generate_parser.add_argument("-n", "--dry-run", action="store_true",
+                                 help="Run the generators without writing anything and list "
+                                      "the files that would be added (A) or modified (M)")
+    generate_parser.add_argument("--diff", action="store_true",
+                                 help="Like --dry-run, and print a unified diff for every changed file")
+    generate_parser.add_argument("-v", "--verbose", action="store_true",
+                                 help="Print the generator output while it runs")
+    generate_parser.set_defaults(func=cmd_generate)
+
+    targets_parser = subparsers.add_parser(
+        "targets", help="List the generator targets, including the plugins of the script directory")
+    targets_parser.add_argument("project", help="Project file or Excel workbook")
+    targets_parser.add_argument("-S", "--scripts", help="Generator script directory (default: the project's script path)")
+    targets_parser.set_defaults(func=cmd_targets)
+
+    footprint_parser = subparsers.add_parser(
+        "footprint", help="Print the estimated memory footprint per region and core; "
+                          "exits with 1 if a region is over its budget")
+    footprint_parser.add_argument("project", help="Project file or Excel workbook")
+    footprint_parser.set_defaults(func=cmd_footprint)
+
+    search_parser = subparsers.add_parser(
+        "search", help="List the signals matching a search, as in the search bar of the GUI; "
+                       "exits with 1 if none match")
+    search_parser.add_argument("project", help="Project file or Excel workbook")
+    search_parser.add_argument("query", nargs="+", help="Search terms, e.g. temp asil:B source:Aurix.Core0")
+    search_parser.set_defaults(func=cmd_search)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (SignalMgrError, OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())